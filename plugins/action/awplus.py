@@ -0,0 +1,59 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2023 Allied Telesis
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Action module class for the awplus modules
+The modules run as they would without an action plugin. When the
+connection's perf option is on (the ansible_awplus_perf variable or the
+ANSIBLE_AWPLUS_PERF environment variable), the commands the connection sent
+to the device for the task are added to its result under _perf.
+"""
+
+import json
+
+from ansible.module_utils.connection import Connection, ConnectionError
+from ansible.plugins.action.normal import ActionModule as ActionNormal
+
+
+class ActionModule(ActionNormal):
+    def run(self, tmp=None, task_vars=None):
+        perf = self._start_perf()
+        result = super(ActionModule, self).run(tmp, task_vars)
+        return self._finish_perf(perf, result)
+
+    def _start_perf(self):
+        """ Start recording the commands sent for the task
+
+        :returns: the connection to collect the records from, or None if
+                  they aren't wanted
+        """
+        socket_path = getattr(self._connection, 'socket_path', None)
+        if not socket_path:
+            return None
+        connection = Connection(socket_path)
+        try:
+            # the connection resolves the perf option, so ask it rather than
+            # looking at the task variables
+            if not json.loads(connection.get_capabilities()).get('perf'):
+                return None
+            # drop anything recorded before this task
+            connection.get_perf_records()
+        except ConnectionError:
+            return None
+        return connection
+
+    def _finish_perf(self, connection, result):
+        """ Add the commands recorded for the task to its result
+
+        :param connection: the connection returned by _start_perf
+        :param result: the task result
+        :returns: the task result
+        """
+        if connection is not None:
+            try:
+                result.setdefault('_perf', {})['commands'] = connection.get_perf_records()
+            except ConnectionError:
+                pass
+        return result
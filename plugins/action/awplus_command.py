@@ -0,0 +1,107 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2023 Allied Telesis
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Action module class for awplus_command
+A task that only runs show commands is answered on the controller over the
+host's persistent connection, without starting the module on the host.
+This saves the module start-up, argument validation and capability lookup
+that would otherwise come before the first command of every host.
+Anything else is passed on to the module unchanged.
+"""
+
+import time
+
+from ansible.module_utils._text import to_text
+from ansible.module_utils.connection import Connection, ConnectionError
+from ansible.module_utils.six import string_types
+from ansible.plugins.action import ActionBase
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.parsing import Conditional
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import to_lines, to_list
+from ansible_collections.alliedtelesis.awplus.plugins.action.awplus import ActionModule as ActionNetworkModule
+
+# The module options handled on the controller; any other option sends the
+# task to the module.
+DIRECT_OPTIONS = frozenset(('commands', 'wait_for', 'waitfor', 'match', 'retries', 'interval'))
+
+
+class ActionModule(ActionNetworkModule):
+    def run(self, tmp=None, task_vars=None):
+        commands = self._direct_commands()
+        socket_path = getattr(self._connection, 'socket_path', None)
+        if commands is None or not socket_path or self._task.async_val:
+            return super(ActionModule, self).run(tmp, task_vars)
+
+        perf = self._start_perf()
+        result = ActionBase.run(self, tmp, task_vars)
+        del tmp
+        result.update(self._run_direct(Connection(socket_path), commands))
+        return self._finish_perf(perf, result)
+
+    def _direct_commands(self):
+        """ The commands of the task, if they can be run on the controller
+
+        :rtype: list
+        :returns: the show commands, or None if the task needs the module
+        """
+        args = self._task.args
+        if not set(args).issubset(DIRECT_OPTIONS) or not args.get('commands'):
+            return None
+
+        commands = []
+        for item in to_list(args['commands']):
+            if isinstance(item, dict):
+                if set(k for k, v in item.items() if v is not None) != set(['command']):
+                    return None
+                item = item['command']
+            if not isinstance(item, string_types) or not item.startswith('show'):
+                return None
+            commands.append(item)
+        return commands
+
+    def _run_direct(self, connection, commands):
+        """ Run the commands over the persistent connection as the module would
+
+        :param connection: the persistent connection of the host
+        :param commands: the show commands
+        :rtype: dictionary
+        :returns: the task result
+        """
+        args = self._task.args
+        try:
+            conditionals = [Conditional(c) for c in to_list(args.get('wait_for', args.get('waitfor')))]
+            retries = int(args.get('retries', 10))
+            interval = int(args.get('interval', 1))
+        except (AttributeError, ValueError) as exc:
+            return dict(failed=True, msg=to_text(exc))
+        match = args.get('match', 'all')
+        if match not in ('all', 'any'):
+            return dict(failed=True, msg=f"value of match must be one of: all, any, got: {match}")
+
+        responses = []
+        while retries > 0:
+            try:
+                responses = connection.run_commands(commands=commands)
+            except ConnectionError as exc:
+                return dict(failed=True, msg=to_text(exc, errors='surrogate_then_replace'))
+
+            for item in list(conditionals):
+                if item(responses):
+                    if match == 'any':
+                        conditionals = list()
+                        break
+                    conditionals.remove(item)
+
+            if not conditionals:
+                break
+
+            time.sleep(interval)
+            retries -= 1
+
+        if conditionals:
+            return dict(failed=True, msg="One or more conditional statements have not been satisfied",
+                        failed_conditions=[item.raw for item in conditionals])
+
+        return dict(changed=False, stdout=responses, stdout_lines=list(to_lines(responses)))
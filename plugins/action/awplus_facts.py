@@ -0,0 +1,43 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2023 Allied Telesis
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Action module class for awplus_facts
+When the resource facts cache is enabled, this fills in where the cached
+facts are kept, so that each host has its own entry in the fact cache
+directory unless the user says otherwise.
+"""
+
+import copy
+import os
+
+from ansible import constants as C
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible_collections.alliedtelesis.awplus.plugins.action.awplus import ActionModule as ActionNetworkModule
+
+# Only these fact cache plugins treat the cache connection as a directory.
+FILE_CACHE_PLUGINS = ('jsonfile', 'ansible.builtin.jsonfile', 'yaml', 'community.general.yaml')
+
+
+class ActionModule(ActionNetworkModule):
+    def run(self, tmp=None, task_vars=None):
+        perf = self._start_perf()
+        module_args = copy.deepcopy(self._task.args)
+        if boolean(module_args.get('resource_cache', False), strict=False):
+            if not module_args.get('resource_cache_dir'):
+                fact_cache_dir = C.CACHE_PLUGIN_CONNECTION
+                if fact_cache_dir and C.CACHE_PLUGIN in FILE_CACHE_PLUGINS:
+                    module_args['resource_cache_dir'] = os.path.join(fact_cache_dir, 'awplus_resources')
+                else:
+                    module_args['resource_cache_dir'] = '~/.ansible/awplus_resources'
+            if not module_args.get('resource_cache_key'):
+                module_args['resource_cache_key'] = task_vars.get('inventory_hostname')
+        module_return = self._execute_module(
+            module_name='alliedtelesis.awplus.awplus_facts',
+            module_args=module_args,
+            task_vars=task_vars,
+            tmp=tmp
+        )
+        return self._finish_perf(perf, module_return)
@@ -11,13 +11,14 @@ not have to specify which user Ansible is using to connect.
 """
 
 import copy
-from ansible.plugins.action import ActionBase
+from ansible_collections.alliedtelesis.awplus.plugins.action.awplus import ActionModule as ActionNetworkModule
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.user.user import UserArgs
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.config.user.user import User
 
 
-class ActionModule(ActionBase):
+class ActionModule(ActionNetworkModule):
     def run(self, tmp=None, task_vars=None):
+        perf = self._start_perf()
         module_args = copy.deepcopy(self._task.args)
         module_args['ansible_user'] = task_vars.get('ansible_user')
         module_return = self._execute_module(
@@ -26,4 +27,4 @@ class ActionModule(ActionBase):
             task_vars=task_vars,
             tmp=tmp
         )
-        return module_return
+        return self._finish_perf(perf, module_return)
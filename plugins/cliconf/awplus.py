@@ -29,14 +29,77 @@ description:
     - This awplus plugin provides low level abstraction apis for
       sending and receiving CLI commands from AW+ network devices.
 version_added: "2.4"
+options:
+  config_batch_size:
+    type: int
+    default: 1
+    description:
+      - Number of configuration lines written to the device at once by edit_config.
+      - With the default of 1 each line waits for the device prompt before the next
+        one is sent.
+      - Larger values pipeline the lines and match the output back to each line by
+        its prompt, which avoids a round-trip per line on large changes. Lines after
+        a failing line in the same batch have already been sent to the device when
+        the error is reported.
+      - Batching is not used when the C(terminal_stderr_re) connection option is set.
+    env:
+      - name: ANSIBLE_AWPLUS_CONFIG_BATCH_SIZE
+    vars:
+      - name: ansible_awplus_config_batch_size
+  command_cache_ttl:
+    type: int
+    default: 0
+    description:
+      - Number of seconds the output of a C(show) command read by C(get) is kept
+        by the persistent connection and returned to later tasks and modules
+        asking for the same command.
+      - The kept outputs are dropped whenever configuration is sent to the device
+        through the connection.
+      - With the default of 0 every command is sent to the device.
+    env:
+      - name: ANSIBLE_AWPLUS_COMMAND_CACHE_TTL
+    vars:
+      - name: ansible_awplus_command_cache_ttl
+  command_cache_size:
+    type: int
+    default: 128
+    description:
+      - Maximum number of command outputs kept when C(command_cache_ttl) is set.
+        The least recently used output is dropped first.
+    env:
+      - name: ANSIBLE_AWPLUS_COMMAND_CACHE_SIZE
+    vars:
+      - name: ansible_awplus_command_cache_size
+  perf:
+    type: boolean
+    default: false
+    description:
+      - Record every command sent to the device with the time it took, the size of
+        its response and whether it was answered from the command cache.
+      - The records of each task are returned in its result under C(_perf).
+    env:
+      - name: ANSIBLE_AWPLUS_PERF
+    vars:
+      - name: ansible_awplus_perf
+  perf_log:
+    type: path
+    description:
+      - When C(perf) is enabled, also append each record as a line of JSON to this file.
+    env:
+      - name: ANSIBLE_AWPLUS_PERF_LOG
+    vars:
+      - name: ansible_awplus_perf_log
 """
 
 import re
 import time
 import json
+import hashlib
+
+from collections import OrderedDict, deque
 
 from ansible.errors import AnsibleConnectionFailure
-from ansible.module_utils._text import to_text
+from ansible.module_utils._text import to_bytes, to_text
 from ansible.module_utils.common._collections_compat import Mapping
 from ansible.module_utils.six import iteritems
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.config import NetworkConfig, dumps
@@ -44,8 +107,91 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
 from ansible.plugins.cliconf import CliconfBase, enable_mode
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.utils.utils import get_sys_info
 
+# The CLI prompt at the start of a line, as echoed in front of each pipelined command.
+CLI_PROMPT_RE = re.compile(r"[\w\+\-\.:\/\[\]]+(?:\([^\)]+\)){0,3}[>#] ?")
+
+# Number of output lines returned by each get_lines call.
+OUTPUT_CHUNK_LINES = 2000
+
+# Number of perf records kept until they are read; the oldest are dropped
+# first when nothing collects them.
+PERF_RECORDS_LIMIT = 1000
+
 
 class Cliconf(CliconfBase):
+    def __init__(self, *args, **kwargs):
+        super(Cliconf, self).__init__(*args, **kwargs)
+        # The parsed running configuration and show command outputs, kept
+        # until the device configuration is changed.
+        self._running_obj = None
+        self._command_cache = OrderedDict()
+        self._streamed_output = None
+        self._perf_records = deque(maxlen=PERF_RECORDS_LIMIT)
+        # Digests of the startup configuration, by the lines ignored. They
+        # are kept when configuration is sent, and dropped by any other
+        # command that isn't a show command.
+        self._startup_digests = {}
+
+    def _invalidate_caches(self, startup=False):
+        self._running_obj = None
+        self._command_cache.clear()
+        if startup:
+            self._startup_digests.clear()
+
+    def _get_command_cache_limits(self):
+        try:
+            ttl = self.get_option("command_cache_ttl")
+            size = self.get_option("command_cache_size")
+        except KeyError:
+            return 0, 0
+        return int(ttl or 0), int(size or 0)
+
+    def _perf_enabled(self):
+        try:
+            return bool(self.get_option("perf"))
+        except KeyError:
+            return False
+
+    def _record_perf(self, command, seconds, out, cached=False):
+        try:
+            host = self._connection.get_option("host")
+        except KeyError:
+            host = None
+        record = {
+            "time": time.time(),
+            "host": host,
+            "command": to_text(command, errors="surrogate_then_replace"),
+            "seconds": round(seconds, 6),
+            "bytes": len(to_bytes(out, errors="surrogate_then_replace")),
+            "cached": cached,
+        }
+        self._perf_records.append(record)
+        path = self.get_option("perf_log")
+        if path:
+            with open(path, "a") as log:
+                log.write(json.dumps(record) + "\n")
+
+    def get_perf_records(self, clear=True):
+        """
+        Get the commands recorded since the records were last cleared, at
+        most the last PERF_RECORDS_LIMIT of them.
+        :param clear: Whether to clear the records returned.
+        :return: List of records, each with the 'command', the 'seconds' it took,
+                 the 'bytes' of its response and whether it was 'cached'.
+        """
+        records = list(self._perf_records)
+        if clear:
+            self._perf_records.clear()
+        return records
+
+    def send_command(self, command=None, **kwargs):
+        if not self._perf_enabled():
+            return super(Cliconf, self).send_command(command=command, **kwargs)
+        start = time.perf_counter()
+        out = super(Cliconf, self).send_command(command=command, **kwargs)
+        self._record_perf(command, time.perf_counter() - start, out)
+        return out
+
     @enable_mode
     def get_config(self, source="running", flags=None, format=None):
         if source not in ("running", "startup"):
@@ -68,6 +214,37 @@ class Cliconf(CliconfBase):
 
         return self.send_command(cmd)
 
+    @enable_mode
+    def get_config_digests(self, ignore_lines=None):
+        """
+        Get digests of the running and startup configurations, for telling
+        whether the running configuration has been saved. The running
+        configuration is read on every call, unless the command cache is
+        enabled. The startup digest is kept until a command other than a
+        show command is run through this connection, such as the copy to
+        the startup configuration.
+        :param ignore_lines: Regular expressions of lines to leave out.
+        :return: Dict with the hex SHA-1 digest of the 'running' and
+                 'startup' configurations, as parsed by NetworkConfig.
+        """
+        key = tuple(to_list(ignore_lines))
+        ttl, size = self._get_command_cache_limits()
+        if ttl > 0 and size > 0:
+            running = self._get_cached("show running-config", ttl, size)
+        else:
+            running = self.get_config(source="running")
+
+        startup = self._startup_digests.get(key)
+        if startup is None:
+            startup = self._config_digest(self.get_config(source="startup"), key)
+            self._startup_digests[key] = startup
+        return {"running": self._config_digest(running, key), "startup": startup}
+
+    def _config_digest(self, config, ignore_lines):
+        config = to_text(config, errors="surrogate_then_replace").strip()
+        config_obj = NetworkConfig(indent=1, contents=config, ignore_lines=list(ignore_lines))
+        return hashlib.sha1(to_bytes(str(config_obj), errors="surrogate_or_strict")).hexdigest()
+
     def get_diff(
         self,
         candidate=None,
@@ -135,9 +312,14 @@ class Cliconf(CliconfBase):
         if running and diff_match != "none":
             # running configuration
             have_src, have_banners = self._extract_banners(running)
-            running_obj = NetworkConfig(
-                indent=1, contents=have_src, ignore_lines=diff_ignore_lines
-            )
+            # The same running configuration is usually diffed against
+            # several candidates, so keep the last one parsed.
+            key = (have_src, tuple(to_list(diff_ignore_lines)))
+            if self._running_obj is None or self._running_obj[0] != key:
+                self._running_obj = (key, NetworkConfig(
+                    indent=1, contents=have_src, ignore_lines=diff_ignore_lines
+                ))
+            running_obj = self._running_obj[1]
             configdiffobjs = candidate_obj.difference(
                 running_obj, path=path, match=diff_match, replace=diff_replace
             )
@@ -176,16 +358,25 @@ class Cliconf(CliconfBase):
         results = []
         requests = []
         if commit:
+            self._invalidate_caches()
             self.send_command("configure terminal")
+            lines = []
             for line in to_list(candidate):
                 if not isinstance(line, Mapping):
                     line = {"command": line}
 
                 cmd = line["command"]
                 if cmd != "end" and cmd[0] != "!":
-                    results.append(self.send_command(**line))
+                    lines.append(line)
                     requests.append(cmd)
 
+            batch_size = self._get_config_batch_size()
+            if batch_size > 1:
+                results = self._send_config_batches(lines, batch_size)
+            else:
+                for line in lines:
+                    results.append(self.send_command(**line))
+
             self.send_command("end")
         else:
             raise ValueError("check mode is not supported")
@@ -199,6 +390,114 @@ class Cliconf(CliconfBase):
         resp["response"] = results
         return resp
 
+    def _get_config_batch_size(self):
+        try:
+            batch_size = self.get_option("config_batch_size")
+        except KeyError:
+            return 1
+        if not batch_size or self._connection.get_option("terminal_stderr_re"):
+            return 1
+        return int(batch_size)
+
+    def _send_config_batches(self, lines, batch_size):
+        """
+        Send configuration lines in batches of batch_size. Lines that have to
+        answer a prompt are sent on their own.
+        :param lines: list of send_command arguments, one per configuration line
+        :param batch_size: maximum number of lines written at once
+        :return: list of responses, one per line
+        """
+        results = []
+        batch = []
+        for line in lines:
+            if len(line) > 1:
+                results.extend(self._send_config_batch(batch))
+                batch = []
+                results.append(self.send_command(**line))
+                continue
+            batch.append(line["command"])
+            if len(batch) == batch_size:
+                results.extend(self._send_config_batch(batch))
+                batch = []
+        results.extend(self._send_config_batch(batch))
+        return results
+
+    def _send_config_batch(self, commands):
+        """
+        Write a batch of configuration lines without waiting for the prompt
+        in between, then read the output back and split it per line.
+        :param commands: list of configuration lines
+        :return: list of responses, one per line
+        """
+        if len(commands) < 2:
+            return [self.send_command(command) for command in commands]
+
+        terminal = self._connection._terminal
+        stderr_re = terminal.terminal_stderr_re
+        start = time.perf_counter()
+        # Errors are looked for per line below, so that they can be tied to
+        # the line that caused them rather than to the whole batch.
+        terminal.terminal_stderr_re = []
+        try:
+            for command in commands:
+                self._connection.send(command=to_bytes(command), sendonly=True)
+                self.history.append(("*****", "*****"))
+
+            output = ""
+            responses = None
+            while responses is None:
+                out = self._connection.receive(command=to_bytes(commands[-1]), strip_prompt=False)
+                # each receive stops at a prompt, and the next line is
+                # echoed after it on the same line
+                output += to_text(out, errors="surrogate_then_replace")
+                responses = self._split_batch_output(commands, output)
+        finally:
+            terminal.terminal_stderr_re = stderr_re
+        if self._perf_enabled():
+            self._record_perf("\n".join(commands), time.perf_counter() - start, output)
+
+        for command, response in zip(commands, responses):
+            for regex in stderr_re:
+                # the terminal's matchers take each search as more of the
+                # same response unless reset
+                if hasattr(regex, "reset"):
+                    regex.reset()
+                if regex.search(to_bytes(response, errors="surrogate_then_replace")):
+                    raise AnsibleConnectionFailure(f"{command}\r\n{response}")
+        return responses
+
+    def _split_batch_output(self, commands, output):
+        """
+        Split the output read back for a batch of pipelined lines into the
+        response for each line. Each line after the first is echoed behind
+        the CLI prompt, which marks the end of the previous line's response.
+        :param commands: list of configuration lines sent
+        :param output: the output received so far
+        :return: list of responses, or None if the output is not complete yet
+        """
+        lines = [line for line in output.splitlines() if line.strip()]
+        # the output is complete once the last line has been echoed and
+        # answered with the prompt
+        if not lines or not CLI_PROMPT_RE.fullmatch(lines[-1].strip()):
+            return None
+
+        responses = [[] for command in commands]
+        index = 0
+        for line in lines[:-1]:
+            stripped = line.strip()
+            if index + 1 < len(commands):
+                command = commands[index + 1].strip()
+                if stripped.endswith(command) and CLI_PROMPT_RE.fullmatch(stripped[:-len(command)]):
+                    index += 1
+                    continue
+            if index == 0 and not responses[0] and stripped == commands[0].strip():
+                continue
+            responses[index].append(line)
+
+        if index + 1 < len(commands):
+            return None
+        return ["\n".join(response).strip() for response in responses]
+
     def edit_macro(self, candidate=None, commit=True, replace=None, comment=None):
         resp = {}
         operations = self.get_device_operations()
@@ -209,6 +508,7 @@ class Cliconf(CliconfBase):
         results = []
         requests = []
         if commit:
+            self._invalidate_caches()
             commands = ""
             for line in candidate:
                 if line != "None":
@@ -242,6 +542,11 @@ class Cliconf(CliconfBase):
         if output:
             raise ValueError(f"'output' value {output} is not supported for get")
 
+        cacheable = command.startswith("show ") and newline and not (prompt or answer or sendonly or check_all)
+        ttl, size = self._get_command_cache_limits()
+        if cacheable and ttl > 0 and size > 0:
+            return self._get_cached(command, ttl, size)
+
         return self.send_command(
             command=command,
             prompt=prompt,
@@ -251,6 +556,54 @@ class Cliconf(CliconfBase):
             check_all=check_all,
         )
 
+    def _get_cached(self, command, ttl, size):
+        """
+        Get the output of a show command, from the command cache if it was
+        read within the last ttl seconds.
+        :param command: the show command
+        :param ttl: number of seconds an output is kept
+        :param size: maximum number of outputs kept
+        :return: the command output
+        """
+        now = time.monotonic()
+        entry = self._command_cache.get(command)
+        if entry is not None and now - entry[0] < ttl:
+            self._command_cache.move_to_end(command)
+            if self._perf_enabled():
+                self._record_perf(command, 0, entry[1], cached=True)
+            return entry[1]
+
+        out = self.send_command(command=command)
+        self._command_cache[command] = (now, out)
+        self._command_cache.move_to_end(command)
+        while len(self._command_cache) > size:
+            self._command_cache.popitem(last=False)
+        return out
+
+    def get_lines(self, command=None, start=0, count=OUTPUT_CHUNK_LINES):
+        """
+        Get the output of a show command a number of lines at a time, so that
+        the caller never holds a large output in a single response.
+        The command is run when start is 0, and its output is kept by the
+        connection until the last lines have been returned.
+        :param command: the show command
+        :param start: index of the first output line wanted
+        :param count: maximum number of lines returned
+        :return: dict with the 'lines' and whether there are 'more' after them
+        """
+        if not command:
+            raise ValueError("must provide value of command to execute")
+
+        if not start or self._streamed_output is None or self._streamed_output[0] != command:
+            out = to_text(self.get(command=command), errors="surrogate_then_replace")
+            self._streamed_output = (command, out.splitlines())
+
+        lines = self._streamed_output[1]
+        more = start + count < len(lines)
+        if not more:
+            self._streamed_output = None
+        return {"lines": lines[start:start + count], "more": more}
+
     def get_device_info(self):
         device_info = {}
 
@@ -312,8 +665,12 @@ class Cliconf(CliconfBase):
             "get_diff",
             "run_commands",
             "get_defaults_flag",
+            "get_config_digests",
+            "get_lines",
+            "get_perf_records",
         ]
         result["device_operations"] = self.get_device_operations()
+        result["perf"] = self._perf_enabled()
         result.update(self.get_option_values())
         return json.dumps(result)
 
@@ -334,6 +691,7 @@ class Cliconf(CliconfBase):
         results = []
         requests = []
         if commit:
+            self._invalidate_caches()
             for key, value in iteritems(banners_obj):
                 key += f" {multiline_delimiter}"
                 self.send_command("config terminal", sendonly=True)
@@ -367,6 +725,8 @@ class Cliconf(CliconfBase):
                     f"'output' value {output} is not supported for run_commands"
                 )
 
+            if not cmd["command"].startswith("show"):
+                self._invalidate_caches(startup=True)
             try:
                 out = self.send_command(**cmd)
             except AnsibleConnectionFailure as e:
@@ -10,11 +10,15 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 import json
+import time
 
-from ansible.module_utils._text import to_text
+from ansible.module_utils._text import to_bytes, to_text
 from ansible.module_utils.basic import env_fallback
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import to_list
-from ansible.module_utils.connection import Connection, ConnectionError
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import (
+    ConnectionError,
+    get_module_connection,
+)
 
 _DEVICE_CONFIGS = {}
 
@@ -44,18 +48,59 @@ def get_connection(module):
     capabilities = get_capabilities(module)
     network_api = capabilities.get("network_api")
     if network_api == "cliconf":  # Use awplus cliconf to run command on AW+ platform
-        module._awplus_connection = Connection(module._socket_path)
+        module._awplus_connection = get_module_connection(module)
+        if capabilities.get("perf"):
+            _start_perf(module)
     else:
         module.fail_json(msg=f"Invalid connection type {network_api}")
 
     return module._awplus_connection
 
 
+def _start_perf(module):
+    """Record the calls made through these helpers, for add_perf_records to
+    return in the module result.
+    """
+    module._awplus_perf = []
+
+
+def add_perf_records(module, result):
+    """Add the calls recorded through these helpers to the module result
+    under _perf, if the connection's perf option is on.
+    :param module: the module
+    :param result: the module result
+    :returns: the module result
+    """
+    records = getattr(module, "_awplus_perf", None)
+    if records is not None:
+        result.setdefault("_perf", {})["calls"] = records
+    return result
+
+
+def _response_size(out):
+    if out is None:
+        return 0
+    if isinstance(out, (list, tuple)):
+        return sum(_response_size(item) for item in out)
+    return len(to_bytes(out, errors="surrogate_then_replace"))
+
+
+def _record_call(module, call, start, out=None, cached=False):
+    records = getattr(module, "_awplus_perf", None)
+    if records is not None:
+        records.append({
+            "call": call,
+            "seconds": round(time.perf_counter() - start, 6),
+            "bytes": _response_size(out),
+            "cached": cached,
+        })
+
+
 def get_capabilities(module):
     if hasattr(module, "_awplus_capabilities"):
         return module._awplus_capabilities
     try:
-        capabilities = Connection(module._socket_path).get_capabilities()
+        capabilities = get_module_connection(module).get_capabilities()
     except ConnectionError as exc:
         module.fail_json(msg=to_text(exc, errors="surrogate_then_replace"))
     module._awplus_capabilities = json.loads(capabilities)
@@ -79,9 +124,12 @@ def get_config(module, flags=None):
         section_filter = True
 
     flag_str = " ".join(flags)
+    start = time.perf_counter()
 
     try:
-        return _DEVICE_CONFIGS[flag_str]
+        cfg = _DEVICE_CONFIGS[flag_str]
+        _record_call(module, "get_config", start, cfg, cached=True)
+        return cfg
     except KeyError:
         connection = get_connection(module)
         try:
@@ -94,22 +142,56 @@ def get_config(module, flags=None):
                 module.fail_json(msg=to_text(exc, errors="surrogate_then_replace"))
         cfg = to_text(out, errors="surrogate_then_replace").strip()
         _DEVICE_CONFIGS[flag_str] = cfg
+        _record_call(module, "get_config", start, cfg)
         return cfg
 
 
+def clear_config_cache():
+    """Forget the configurations fetched by get_config, once the device
+    configuration has been changed.
+    """
+    _DEVICE_CONFIGS.clear()
+
+
+def iter_command_lines(module, command, count=None):
+    """Yield the output lines of a show command, fetched from the
+    connection a chunk at a time.
+    """
+    connection = get_connection(module)
+    kwargs = dict(count=count) if count else {}
+    start = 0
+    more = True
+    while more:
+        try:
+            chunk = connection.get_lines(command=command, start=start, **kwargs)
+        except ConnectionError as exc:
+            module.fail_json(msg=to_text(exc, errors="surrogate_then_replace"))
+        for line in chunk["lines"]:
+            yield line
+        start += len(chunk["lines"])
+        more = chunk["more"]
+
+
 def run_commands(module, commands, check_rc=True):
     connection = get_connection(module)
+    start = time.perf_counter()
     try:
-        return connection.run_commands(commands=commands, check_rc=check_rc)
+        out = connection.run_commands(commands=commands, check_rc=check_rc)
     except ConnectionError as exc:
         module.fail_json(msg=to_text(exc))
+    _record_call(module, "run_commands", start, out)
+    return out
 
 
 def load_config(module, commands):
     connection = get_connection(module)
+    start = time.perf_counter()
 
     try:
         resp = connection.edit_config(commands)
-        return resp.get("response")
     except ConnectionError as exc:
         module.fail_json(msg=to_text(exc))
+    finally:
+        clear_config_cache()
+    _record_call(module, "load_config", start, resp.get("response"))
+    return resp.get("response")
@@ -0,0 +1,95 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2023 Allied Telesis
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" A hierarchical view of an AW+ configuration
+
+The configuration text is parsed once into sections (the unindented lines)
+and their children (the lines indented below them, nested by indentation).
+Each line keeps its position in the text.
+
+The resource facts index the running-config sections with it, so the
+config is split once however many fact classes read it. The cliconf
+get_diff still parses with netcommon's NetworkConfig, whose match and
+replace rules it relies on.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+class ConfigLine(object):
+    """ A configuration line and the lines indented below it
+    """
+
+    __slots__ = ("raw", "lineno", "children")
+
+    def __init__(self, raw, lineno, children=None):
+        self.raw = raw
+        self.lineno = lineno
+        self.children = children if children is not None else []
+
+    def lines(self):
+        """ The line followed by all the lines below it, as in the config """
+        yield self.raw
+        for child in self.children:
+            for line in child.lines():
+                yield line
+
+
+class ConfigTree(object):
+    """ The sections of an AW+ configuration
+    """
+
+    def __init__(self, config=None):
+        self.sections = []
+        if config:
+            self.load(config)
+
+    def load(self, config):
+        """ Parse configuration text into the tree
+        :param config: the configuration text
+        """
+        stack = []
+        for lineno, line in enumerate(config.splitlines()):
+            text = line.lstrip()
+            indent = len(line) - len(text)
+            if not indent and (not text or text.startswith("!")):
+                # an unindented blank or comment line closes the section
+                stack = []
+                continue
+
+            node = ConfigLine(line, lineno)
+            while stack and stack[-1][0] >= indent:
+                stack.pop()
+            if stack and indent:
+                stack[-1][1].children.append(node)
+            else:
+                self.sections.append(node)
+            stack.append((indent, node))
+
+    def get_sections(self, keywords=None):
+        """ The sections starting with any of the given keywords
+        :param keywords: list of section starts, e.g. 'interface' or 'router bgp'
+        :return: list of ConfigLine, all sections if no keywords are given
+        """
+        if not keywords:
+            return list(self.sections)
+        keywords = tuple(keywords)
+        return [section for section in self.sections if section.raw.startswith(keywords)]
+
+    def section_text(self, keyword):
+        """ The text of the sections starting with keyword, each section
+        followed by a '!' line as the device shows them
+        :param keyword: the start of the section line
+        :return: the section text
+        """
+        lines = []
+        for section in self.get_sections([keyword]):
+            lines.extend(section.lines())
+            lines.append("!")
+        return "\n".join(lines)
@@ -28,14 +28,18 @@
 
 import os
 import hashlib
+import itertools
 import json
+import select
 import socket
 import struct
 import traceback
 import uuid
 
+from contextlib import contextmanager
 from functools import partial
 from ansible.module_utils._text import to_bytes, to_text
+from ansible.module_utils.connection import ConnectionError as _ConnectionError
 from ansible.module_utils.common.json import AnsibleJSONEncoder
 from ansible.module_utils.six import iteritems
 from ansible.module_utils.six.moves import cPickle
@@ -70,25 +74,68 @@ def send_data(s, data):
 
 
 def recv_data(s):
+    """Receive one length-prefixed message.
+
+    The payload is read straight into a buffer of its announced size, so a
+    large response is not rebuilt by concatenating every received chunk.
+    """
     header_len = 8  # size of a packed unsigned long long
-    data = to_bytes("")
-    while len(data) < header_len:
-        d = s.recv(header_len - len(data))
-        if not d:
-            return None
-        data += d
-    data_len = struct.unpack("!Q", data[:header_len])[0]
-    data = data[header_len:]
-    while len(data) < data_len:
-        d = s.recv(data_len - len(data))
-        if not d:
+    header = _recv_into(s, bytearray(header_len))
+    if header is None:
+        return None
+    data_len = struct.unpack("!Q", header)[0]
+    data = _recv_into(s, bytearray(data_len))
+    if data is None:
+        return None
+    return bytes(data)
+
+
+def _recv_into(s, buf):
+    view = memoryview(buf)
+    received = 0
+    while received < len(buf):
+        count = s.recv_into(view[received:])
+        if not count:
             return None
-        data += d
-    return data
+        received += count
+    return buf
+
+
+def get_module_connection(module):
+    """Return the connection shared by every RPC made from this module.
+
+    Used as a context manager, the connection keeps one socket open for the
+    RPCs made inside the with block. ansible-connection serves one client
+    socket at a time, so sharing the connection keeps the helpers from
+    opening a second socket, which would never be answered, inside a block.
+    """
+    if not hasattr(module, "_awplus_socket_connection"):
+        module._awplus_socket_connection = Connection(module._socket_path)
+    return module._awplus_socket_connection
+
+
+@contextmanager
+def resource_connection(module):
+    """Run the body of the with block over one socket to ansible-connection.
+
+    The netcommon ConfigBase and FactsBase classes use module._connection
+    when it is set, so a resource module run inside the block makes every
+    RPC, from gathering the facts to sending the commands, on the socket of
+    the shared module connection. Without a socket path, as in the unit
+    tests, the block runs on whatever connection netcommon finds.
+    """
+    if module._socket_path is None:
+        yield None
+        return
+    connection = get_module_connection(module)
+    if not hasattr(module, "_connection"):
+        module._connection = connection
+    with connection:
+        yield connection
 
 
 def exec_command(module, command):
-    connection = Connection(module._socket_path)
+    connection = get_module_connection(module)
     try:
         out = connection.exec_command(command)
     except ConnectionError as exc:
@@ -98,15 +145,21 @@ def exec_command(module, command):
     return 0, out, ""
 
 
+# Request ids only need to be unique per socket, so a per-process prefix and a
+# counter replace generating a uuid for every call.
+_REQUEST_ID_PREFIX = uuid.uuid4().hex
+_REQUEST_IDS = itertools.count(1)
+
+
 def request_builder(method_, *args, **kwargs):
-    reqid = str(uuid.uuid4())
+    reqid = f"{_REQUEST_ID_PREFIX}-{next(_REQUEST_IDS)}"
     req = {"jsonrpc": "2.0", "method": method_, "id": reqid}
     req["params"] = (args, kwargs)
 
     return req
 
 
-class ConnectionError(Exception):
+class ConnectionError(_ConnectionError):
     def __init__(self, message, *args, **kwargs):
         super(ConnectionError, self).__init__(message)
         for k, v in iteritems(kwargs):
@@ -118,6 +171,23 @@ class Connection(object):
         if socket_path is None:
             raise AssertionError("socket_path must be a value")
         self.socket_path = socket_path
+        self._socket = None
+        self._scopes = 0
+        self._single_reply = False
+
+    def __enter__(self):
+        """Keep one socket open for the RPCs made until the matching exit.
+
+        Nothing else is served by ansible-connection while the socket is
+        open, so the block should only make a run of RPCs.
+        """
+        self._scopes += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        self._scopes -= 1
+        if not self._scopes:
+            self.close()
 
     def __getattr__(self, name):
         try:
@@ -198,21 +268,85 @@ class Connection(object):
         return response["result"]
 
     def send(self, data):
+        data = to_bytes(data)
         try:
-            sf = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            sf.connect(self.socket_path)
-
-            send_data(sf, to_bytes(data))
-            response = recv_data(sf)
-
+            response = self._send(data)
         except socket.error as e:
-            sf.close()
+            self.close()
             raise ConnectionError(
                 "unable to connect to socket",
                 err=to_text(e, errors="surrogate_then_replace"),
                 exception=traceback.format_exc(),
             )
 
-        sf.close()
+        if not self._scopes or self._single_reply:
+            self.close()
 
         return to_text(response, errors="surrogate_or_strict")
+
+    def _send(self, data):
+        """Send one request, on the socket kept open by the enclosing with
+        block if there is one.
+
+        ansible-connection answers any number of requests on an accepted
+        socket. Builds that hang up after a single reply are detected when
+        the kept socket is found closed before the next request is written;
+        that request goes out on a fresh socket and later requests get one
+        socket each. A request that was written is never sent again, as it
+        may already have changed the device.
+        """
+        if self._socket is not None and self._peer_closed():
+            self._single_reply = True
+            self.close()
+
+        reused = self._socket is not None
+        if not reused:
+            self._socket = self._connect()
+
+        try:
+            send_data(self._socket, data)
+        except (BrokenPipeError, ConnectionResetError):
+            # closed since the check above; the peer read none of the request
+            if not reused:
+                raise
+            self._single_reply = True
+            self.close()
+            self._socket = self._connect()
+            send_data(self._socket, data)
+
+        response = recv_data(self._socket)
+        if response is None:
+            self.close()
+            raise ConnectionError(
+                "ansible-connection closed the socket without answering the request"
+            )
+        return response
+
+    def _peer_closed(self):
+        """Whether ansible-connection has closed the kept socket.
+
+        Nothing is sent to the client between replies, so a kept socket that
+        reads as ready has been closed at the other end.
+        """
+        readable, _writable, _errored = select.select([self._socket], [], [], 0)
+        if not readable:
+            return False
+        try:
+            return not self._socket.recv(1, socket.MSG_PEEK)
+        except socket.error:
+            return True
+
+    def _connect(self):
+        sf = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sf.connect(self.socket_path)
+        except socket.error:
+            sf.close()
+            raise
+        return sf
+
+    def close(self):
+        """Close the socket to ansible-connection, if one is open."""
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
@@ -47,4 +47,7 @@ class FactsArgs(object):  # pylint: disable=R0903
         'gather_subset': dict(default=['!config'], type='list'),
         'gather_network_resources': dict(choices=choices,
                                          type='list'),
+        'resource_cache': dict(default=False, type='bool'),
+        'resource_cache_dir': dict(type='path'),
+        'resource_cache_key': dict(type='str'),
     }
@@ -17,11 +17,62 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
     to_list,
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.facts import Facts
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.utils import get_after_facts
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
 import re
 
+# The ace fields that identify an entry, in the order they appear in its command.
+ACE_KEY_FIELDS = (
+    'action', 'protocols', 'source_addr', 'source_port_protocol',
+    'destination_addr', 'destination_port_protocol', 'ICMP_type_number',
+)
+
+
+def freeze(value):
+    """ Convert nested dicts and lists into hashable tuples
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, freeze(val)) for key, val in value.items()))
+    if isinstance(value, list):
+        return tuple(freeze(val) for val in value)
+    return value
+
+
+def ace_key(ace):
+    """ Build a hashable key for an ace, ignoring its sequence number
+
+    :param ace: the ace, with empty values removed
+    :rtype: A tuple
+    :returns: the canonical key of the ace
+    """
+    return tuple(freeze(ace.get(field)) for field in ACE_KEY_FIELDS)
+
+
+def index_acls(have):
+    """ Index the existing acls by afi and name
+
+    :param have: the current configuration as a dictionary
+    :rtype: A dictionary
+    :returns: the existing acls keyed by (afi, name)
+    """
+    h_acls = have.get("acls") if have != [] else []
+    return {(h_acl.get('afi'), h_acl.get('name')): h_acl for h_acl in h_acls}
+
+
+def index_aces(aces):
+    """ Index aces by their key
+
+    :param aces: the aces, with empty values removed
+    :rtype: A dictionary
+    :returns: the first ace with each key
+    """
+    aces_by_key = {}
+    for ace in aces or []:
+        aces_by_key.setdefault(ace_key(ace), ace)
+    return aces_by_key
+
 
 class Acl(ConfigBase):
     """
@@ -71,11 +122,9 @@ class Acl(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_acl_facts = self.get_acl_facts()
-
         result['before'] = existing_acl_facts
         if result['changed']:
-            result['after'] = changed_acl_facts
+            result['after'] = get_after_facts(self._module, existing_acl_facts, self.get_acl_facts)
 
         result['warnings'] = warnings
         return result
@@ -239,6 +288,97 @@ class Acl(ConfigBase):
         )
         return command
 
+    def generate_ace_delta_commands(self, w_aces, h_acl, acl_type):
+        """ Generates the minimal ace commands to turn the aces of an existing
+            ACL into the desired ones
+
+        An existing ace is kept when the desired one has the same sequence
+        number, or has none and is in the same order as the kept aces.
+
+        :param w_aces: the desired aces
+        :param h_acl: the existing ACL
+        :param acl_type: the type of ACL
+        :rtype: A list
+        :returns: the commands removing the stale aces then adding the new ones
+        """
+        h_aces = h_acl.get('ace') or []
+        h_index = index_aces(h_aces)
+        w_aces = [utils.remove_empties(ace) for ace in w_aces or []]
+        claimed = set(ace['ace_ID'] for ace in w_aces if 'ace_ID' in ace)
+        kept = set()
+        added = []
+        last_seq = None
+        appending = False
+        for ace in w_aces:
+            ace_ID = ace.get('ace_ID')
+            h_seq = h_index.get(ace_key(ace), {}).get('ace_ID')
+            if ace_ID is not None:
+                if h_seq == ace_ID:
+                    kept.add(h_seq)
+                    continue
+                added.append(f'{ace_ID} {self.generate_ace_commands(ace, acl_type)}')
+                continue
+            # unnumbered aces are appended, so only keep them while in order
+            if (h_seq is not None and not appending and h_seq not in claimed and h_seq not in kept
+                    and (last_seq is None or h_seq > last_seq)):
+                kept.add(h_seq)
+                last_seq = h_seq
+                continue
+            appending = True
+            added.append(self.generate_ace_commands(ace, acl_type))
+
+        h_acl_type = h_acl.get('type').lower()
+        commands = []
+        for h_ace in h_aces:
+            if h_ace.get('ace_ID') is None or h_ace.get('ace_ID') not in kept:
+                commands.append(f'no {self.generate_ace_commands(h_ace, h_acl_type)}')
+        commands.extend(added)
+        return commands
+
+    def generate_replace_acl_commands(self, w_afi, w_acl, h_acl):
+        """ Generates the commands to replace an ACL with the desired one,
+            changing only the aces that differ
+
+        :param w_afi: the desired ACL afi
+        :param w_acl: the desired ACL
+        :param h_acl: the existing ACL, or None
+        :rtype: A list
+        :returns: the commands necessary to replace the ACL
+        """
+        commands = []
+        w_name = w_acl.get('name')
+        w_acl_type = w_acl.get('acl_type').lower()
+        w_aces = w_acl.get('aces')
+        if h_acl is not None and h_acl.get('type').lower() != w_acl_type:
+            # the type of an ACL can't be changed, so recreate it
+            commands.append(f"no {self.generate_acl_header_commands(w_name, h_acl.get('type').lower(), w_afi)}")
+            h_acl = None
+
+        # hardware acls have a different command layout
+        if w_acl_type == 'hardware' and w_name.isnumeric():
+            if len(w_aces) > 1:
+                self._module.fail_json(msg="only one ace allowed for numbered hardware acls")
+            if h_acl is not None:
+                if list(index_aces(h_acl.get('ace'))) == [ace_key(utils.remove_empties(w_aces[0]))]:
+                    return commands
+                commands.append(f"no {self.generate_acl_header_commands(w_name, w_acl_type, w_afi)}")
+            ace_cmd = self.generate_ace_commands(w_aces[0], w_acl_type)
+            commands.append(f"{'' if w_afi == 'ipv4' else 'ipv6'} access-list {w_name} {ace_cmd}")
+            return commands
+
+        header = self.generate_acl_header_commands(w_name, w_acl_type, w_afi)
+        if h_acl is None:
+            commands.append(header)
+            if w_aces is not None:
+                for ace in w_aces:
+                    commands.append(self.generate_ace_commands(ace, w_acl_type))
+        else:
+            ace_commands = self.generate_ace_delta_commands(w_aces, h_acl, w_acl_type)
+            if ace_commands:  # only add commands if needed
+                commands.append(header)
+                commands.extend(ace_commands)
+        return commands
+
     def set_state(self, want, have):
         """ Select the appropriate function based on the state provided
 
@@ -274,34 +414,13 @@ class Acl(ConfigBase):
                   to the desired configuration
         """
         commands = []
-        h_acls = have.get("acls") if have != [] else []
+        h_index = index_acls(have)
         for w_acls in want:
+            w_afi = w_acls.get('afi').lower()
             for w_acl in w_acls.get('acls'):
-                w_aces = w_acl.get('aces')
-                w_acl_type = w_acl.get('acl_type').lower()
-                for h_acl in h_acls:
-                    if w_acl.get('name') == h_acl.get('name'):
-                        w_afi = w_acls.get('afi').lower()
-                        # hardware acls have a different command layout
-                        if w_acl_type == 'hardware' and w_acl.get('name').isnumeric():
-                            if len(w_aces) > 1:
-                                self._module.fail_json(msg="only one ace allowed for numbered hardware acls")
-                            ace = w_aces[0]
-                            w_name = w_acl.get('name')
-                            ace_cmd = self.generate_ace_commands(ace, w_acl_type)
-                            commands.append(f"{'' if w_afi == 'ipv4' else 'ipv6'} access-list {w_name} {ace_cmd}")
-                        else:
-                            w_name = w_acl.get('name')
-                            commands.append(self.generate_acl_header_commands(w_name, w_acl_type, w_afi))
-                            h_aces = h_acl.get('ace')
-                            if h_aces is not None:
-                                for h_ace in h_aces:
-                                    ace_cmd = self.generate_ace_commands(h_ace, h_acl.get('type').lower())
-                                    commands.append(f'no {ace_cmd}')
-                            if w_aces is not None:
-                                for ace in w_aces:
-                                    ace_cmd = self.generate_ace_commands(ace, w_acl_type)
-                                    commands.append(ace_cmd)
+                h_acl = h_index.get((w_acls.get('afi'), w_acl.get('name')))
+                if h_acl is not None:
+                    commands.extend(self.generate_replace_acl_commands(w_afi, w_acl, h_acl))
         return commands
 
     def _state_overridden(self, want, have):
@@ -312,39 +431,25 @@ class Acl(ConfigBase):
                   to the desired configuration
         """
         commands = []
-        h_acls = have.get("acls") if have != [] else []
-        # removing existing acls
-        for h_acl in h_acls:
-            h_acl_type = h_acl.get('type').lower()
-            h_afi = h_acl.get('afi').lower()
-            h_name = h_acl.get('name')
-            commands.append(f"no {self.generate_acl_header_commands(h_name, h_acl_type, h_afi)}")
-        # adding new acls
+        h_index = index_acls(have)
+        w_keys = set()
+        if want is not None:
+            for item in want:
+                for w_acl in item.get('acls') or []:
+                    w_keys.add((item.get('afi'), w_acl.get('name')))
+        # removing acls that aren't wanted
+        for key, h_acl in h_index.items():
+            if key not in w_keys:
+                h_acl_type = h_acl.get('type').lower()
+                h_afi = h_acl.get('afi').lower()
+                commands.append(f"no {self.generate_acl_header_commands(h_acl.get('name'), h_acl_type, h_afi)}")
+        # replacing the existing acls and adding new ones
         if want is not None:
             for item in want:
-                w_acls = item.get('acls')
                 w_afi = item.get('afi').lower()
-                if w_acls is not None:
-                    for w_acl in w_acls:
-                        w_acl_type = w_acl.get('acl_type').lower()
-                        w_aces = w_acl.get('aces')
-
-                        if w_acl_type == 'hardware' and w_acl.get('name').isnumeric():
-                            w_name = w_acl.get('name')
-
-                            if len(w_aces) > 1:
-                                self._module.fail_json(msg="only one ace allowed for numbered hardware acls")
-
-                            cmd = self.generate_ace_commands(w_aces[0], w_acl_type)
-                            commands.append(f"{'' if w_afi == 'ipv4' else 'ipv6'} access-list {w_name} {cmd}")
-                        else:
-                            w_name = w_acl.get('name')
-
-                            commands.append(self.generate_acl_header_commands(w_name, w_acl_type, w_afi))
-                            if w_aces is not None:
-                                for ace in w_aces:
-                                    ace_cmd = self.generate_ace_commands(ace, w_acl_type)
-                                    commands.append(ace_cmd)
+                for w_acl in item.get('acls') or []:
+                    h_acl = h_index.get((item.get('afi'), w_acl.get('name')))
+                    commands.extend(self.generate_replace_acl_commands(w_afi, w_acl, h_acl))
 
         return commands
 
@@ -356,54 +461,42 @@ class Acl(ConfigBase):
                   the current configuration
         """
         commands = []
-        h_acls = have.get("acls") if have != [] else []
+        h_index = index_acls(have)
         for item in want:
             w_acls = item.get('acls')
             w_afi = item.get('afi').lower()
 
             for w_acl in w_acls:
-                existing_acl = False
                 w_aces = w_acl.get('aces')
                 w_acl_type = w_acl.get('acl_type').lower()
-                for h_acl in h_acls:
+                w_name = w_acl.get('name')
+                h_acl = h_index.get((item.get('afi'), w_name))
+                if h_acl is not None:  # an ace exists within the acl so modify the aces
                     cmd = []
-                    if w_acl.get('name') == h_acl.get('name'):  # an ace exists within the acl so modify the aces
-                        existing_acl = True
-                        w_acl_type = w_acl.get('acl_type').lower()
-                        h_aces = h_acl.get('ace') if h_acl.get('ace') is not None else []
-
-                        if w_acl_type == 'hardware' and w_acl.get('name').isnumeric():
-                            w_name = w_acl.get('name')
-                            # need to check that user only adds one ace for a numbered hardware acl
-                            if len(w_aces) > 1:
-                                self._module.fail_json(msg="only one ace allowed for numbered hardware acls")
-                            ace_cmd = self.generate_ace_commands(w_aces[0], w_acl_type)
-                            commands.append(f"{'' if w_afi == 'ipv4' else 'ipv6'} access-list {w_name} {ace_cmd}")
-
-                        else:
-                            w_name = w_acl.get('name')
-
-                            cmd.append(self.generate_acl_header_commands(w_name, w_acl_type, w_afi))
-                            if w_aces is not None:
-                                for ace in w_aces:
-                                    ace_dict = dict(ace)
-                                    ace_dict = utils.remove_empties(ace_dict)
-                                    ace_ID = ace.get('ace_ID')
-                                    if "ace_ID" in ace_dict:
-                                        ace_dict.pop("ace_ID")  # need version of ace without ace_ID
-
-                                    else:
-                                        self._module.fail_json(msg="'ace_ID' is required when merging aces")
-                                    if ace_dict not in h_aces:
-                                        ace_cmd = self.generate_ace_commands(ace, w_acl_type)
-                                        cmd.append(f'{ace_ID} {ace_cmd}')
+                    if w_acl_type == 'hardware' and w_name.isnumeric():
+                        # need to check that user only adds one ace for a numbered hardware acl
+                        if len(w_aces) > 1:
+                            self._module.fail_json(msg="only one ace allowed for numbered hardware acls")
+                        ace_cmd = self.generate_ace_commands(w_aces[0], w_acl_type)
+                        commands.append(f"{'' if w_afi == 'ipv4' else 'ipv6'} access-list {w_name} {ace_cmd}")
+
+                    else:
+                        cmd.append(self.generate_acl_header_commands(w_name, w_acl_type, w_afi))
+                        if w_aces is not None:
+                            h_keys = index_aces(h_acl.get('ace'))
+                            for ace in w_aces:
+                                ace_dict = utils.remove_empties(ace)
+                                ace_ID = ace_dict.pop('ace_ID', None)  # need version of ace without ace_ID
+                                if ace_ID is None:
+                                    self._module.fail_json(msg="'ace_ID' is required when merging aces")
+                                if ace_key(ace_dict) not in h_keys:
+                                    ace_cmd = self.generate_ace_commands(ace, w_acl_type)
+                                    cmd.append(f'{ace_ID} {ace_cmd}')
 
                     if len(cmd) > 1:  # only add command if needed
                         commands.extend(cmd)
 
-                if not existing_acl:  # add a new acl if nothing exists
-                    w_acl_type = w_acl.get('acl_type').lower()
-                    w_name = w_acl.get('name')
+                else:  # add a new acl if nothing exists
                     if w_acl_type == 'hardware' and w_name.isnumeric():
                         # need to check that user only adds one ace for a numbered hardware acl
                         if len(w_aces) > 1:
@@ -427,32 +520,29 @@ class Acl(ConfigBase):
                   of the provided objects
         """
         commands = []
-        h_acls = have.get("acls") if have != [] else []
+        h_index = index_acls(have)
         for item in want:
             w_acls = item.get('acls')
             w_afi = item.get('afi').lower()
 
             for w_acl in w_acls:
                 w_aces = w_acl.get('aces')
-                for h_acl in h_acls:
-                    if w_acl.get('name') == h_acl.get('name'):
-                        w_acl_type = w_acl.get('acl_type').lower()
-                        w_name = w_acl.get('name')
-                        if w_aces is None or w_acl_type == 'hardware':  # delete the acl if no ace is provided
-                            commands.append(f"no {self.generate_acl_header_commands(w_name, w_acl_type, w_afi)}")
-                        else:  # delete the specified ace entry only
-                            cmd = []
-                            cmd.append(self.generate_acl_header_commands(w_name, w_acl_type, w_afi))
-                            for w_ace in w_aces:
-                                h_aces = h_acl.get('ace')
-                                if h_aces is not None:
-                                    for h_ace in h_acl.get('ace'):
-
-                                        w_ace = utils.remove_empties(w_ace)
-                                        if h_ace == w_ace:
-                                            ace_cmd = self.generate_ace_commands(w_ace, w_acl_type)
-                                            cmd.append(f"no {ace_cmd}")
-                            if len(cmd) > 1:  # only add command if needed
-                                commands.extend(cmd)
+                h_acl = h_index.get((item.get('afi'), w_acl.get('name')))
+                if h_acl is not None:
+                    w_acl_type = w_acl.get('acl_type').lower()
+                    w_name = w_acl.get('name')
+                    if w_aces is None or w_acl_type == 'hardware':  # delete the acl if no ace is provided
+                        commands.append(f"no {self.generate_acl_header_commands(w_name, w_acl_type, w_afi)}")
+                    else:  # delete the specified ace entry only
+                        cmd = []
+                        cmd.append(self.generate_acl_header_commands(w_name, w_acl_type, w_afi))
+                        h_keys = index_aces(h_acl.get('ace'))
+                        for w_ace in w_aces:
+                            w_ace = utils.remove_empties(w_ace)
+                            if ace_key(w_ace) in h_keys:
+                                ace_cmd = self.generate_ace_commands(w_ace, w_acl_type)
+                                cmd.append(f"no {ace_cmd}")
+                        if len(cmd) > 1:  # only add command if needed
+                            commands.extend(cmd)
 
         return commands
@@ -17,7 +17,8 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
     to_list,
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.facts import Facts
-import re
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.utils import get_after_facts
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.references import get_device_references
 
 
 class Acl_interfaces(ConfigBase):
@@ -68,11 +69,9 @@ class Acl_interfaces(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_acl_interfaces_facts = self.get_acl_interfaces_facts()
-
         result['before'] = existing_acl_interfaces_facts
         if result['changed']:
-            result['after'] = changed_acl_interfaces_facts
+            result['after'] = get_after_facts(self._module, existing_acl_interfaces_facts, self.get_acl_interfaces_facts)
 
         result['warnings'] = warnings
         return result
@@ -271,15 +270,14 @@ class Acl_interfaces(ConfigBase):
                 commands.insert(0, f"interface {interface_name}")
         return commands
 
-    def get_acl(self, name):
-        """ Gets the ACL configuration
+    def get_acl_type(self, name):
+        """ Gets the type of an ACL
 
         :param name: The name of the ACL
         :rtype: string
-        :returns: The configuration of the ACL
+        :returns: The type of the ACL, e.g. 'Hardware', or None if it doesn't exist
         """
-        connection = self._connection
-        return connection.get(f"show access-list {name}")
+        return get_device_references(self._module, self._connection).acl_type(name)
 
     def get_structure_info(self, interface_structure_dict):
         """ Creates a dictionary with structure so that want and have can be compared directly
@@ -296,12 +294,8 @@ class Acl_interfaces(ConfigBase):
                 acl_list = config.get('acl_names') if config.get('acl_names') is not None else []
                 valid_acls = []
                 for acl_name in acl_list:
-                    # get the ACL configuration for each name
-                    have_acl = self.get_acl(acl_name)
-                    # extract the header from the returned ACL
-                    acl_header = re.findall(r'(\S+) (IP|IPv6) access list (\d+|\S+)', have_acl)
                     # only want to add acls to list if its a hardware acl
-                    if acl_header != [] and 'Hardware' in acl_header[0]:
+                    if self.get_acl_type(acl_name) == 'Hardware':
                         valid_acls.append(acl_name)
                 port_info_dictionary[port_name] = valid_acls
         return port_info_dictionary
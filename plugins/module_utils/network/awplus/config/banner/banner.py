@@ -21,6 +21,7 @@ from ansible.module_utils.six import (
     iteritems
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.facts import Facts
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.utils import get_after_facts
 
 
 class Banner(ConfigBase):
@@ -70,11 +71,9 @@ class Banner(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_banner_facts = self.get_banner_facts()
-
         result['before'] = existing_banner_facts
         if result['changed']:
-            result['after'] = changed_banner_facts
+            result['after'] = get_after_facts(self._module, existing_banner_facts, self.get_banner_facts)
 
         result['warnings'] = warnings
         return result
@@ -28,6 +28,7 @@ from ansible.module_utils.common.network import (
     to_subnet,
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.facts import Facts
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.utils import get_after_facts
 
 
 class Bgp(ConfigBase):
@@ -76,11 +77,9 @@ class Bgp(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_bgp_facts = self.get_bgp_facts()
-
         result['before'] = existing_bgp_facts
         if result['changed']:
-            result['after'] = changed_bgp_facts
+            result['after'] = get_after_facts(self._module, existing_bgp_facts, self.get_bgp_facts)
 
         return result
 
@@ -23,6 +23,7 @@ from ansible.module_utils.six import (
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.facts import Facts
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.utils import (
+    get_after_facts,
     remove_duplicate_interface,
 )
 
@@ -74,11 +75,9 @@ class Interfaces(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_interfaces_facts = self.get_interfaces_facts()
-
         result['before'] = existing_interfaces_facts
         if result['changed']:
-            result['after'] = changed_interfaces_facts
+            result['after'] = get_after_facts(self._module, existing_interfaces_facts, self.get_interfaces_facts)
 
         result['warnings'] = warnings
         return result
@@ -22,8 +22,18 @@ from ansible.module_utils.six import (
     iteritems
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.facts import Facts
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.l2_interfaces.l2_interfaces import (
+    L2_interfacesFacts,
+)
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.utils import (
+    compress_interface_commands,
+    get_after_facts,
+    int_range_to_list,
+)
 import re
 
+VLAN_ID_RE = re.compile(r'^(\d+)\s', re.M)
+
 
 class L2_interfaces(ConfigBase):
     """
@@ -42,13 +52,14 @@ class L2_interfaces(ConfigBase):
     def __init__(self, module):
         super(L2_interfaces, self).__init__(module)
 
-    def get_l2_interfaces_facts(self):
+    def get_l2_interfaces_facts(self, data=None):
         """ Get the 'facts' (the current configuration)
 
+        :param data: previously collected interface configuration
         :rtype: A dictionary
         :returns: The current configuration as a dictionary
         """
-        facts, _warnings = Facts(self._module).get_facts(self.gather_subset, self.gather_network_resources)
+        facts, _warnings = Facts(self._module).get_facts(self.gather_subset, self.gather_network_resources, data)
         l2_interfaces_facts = facts['ansible_network_resources'].get('l2_interfaces')
         if not l2_interfaces_facts:
             return {}
@@ -64,8 +75,11 @@ class L2_interfaces(ConfigBase):
         warnings = list()
         commands = list()
 
-        existing_l2_interfaces_facts = self.get_l2_interfaces_facts()
-        commands.extend(self.set_config(existing_l2_interfaces_facts))
+        # The interface configuration is also where stackports are found, so
+        # fetch it once for both.
+        run_conf = L2_interfacesFacts(self._module).get_run_conf(self._connection)
+        existing_l2_interfaces_facts = self.get_l2_interfaces_facts(run_conf)
+        commands.extend(self.set_config(existing_l2_interfaces_facts, run_conf))
         if commands:
             if not self._module.check_mode:
                 warning = self._connection.edit_config(commands).get('response')
@@ -75,33 +89,33 @@ class L2_interfaces(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_l2_interfaces_facts = self.get_l2_interfaces_facts()
-
         result['before'] = existing_l2_interfaces_facts
         if result['changed']:
-            result['after'] = changed_l2_interfaces_facts
+            result['after'] = get_after_facts(self._module, existing_l2_interfaces_facts, self.get_l2_interfaces_facts)
 
         result['warnings'] = warnings
         return result
 
-    def set_config(self, existing_l2_interfaces_facts):
+    def set_config(self, existing_l2_interfaces_facts, run_conf):
         """ Collect the configuration from the args passed to the module,
             collect the current configuration (as a dict from facts)
 
+        :param run_conf: the interface running configuration
         :rtype: A list
         :returns: the commands necessary to migrate the current configuration
                   to the desired configuration
         """
         want = self._module.params['config']
         have = existing_l2_interfaces_facts
-        resp = self.set_state(want, have)
-        return to_list(resp)
+        resp = self.set_state(want, have, run_conf)
+        return compress_interface_commands(to_list(resp))
 
-    def set_state(self, want, have):
+    def set_state(self, want, have, run_conf):
         """ Select the appropriate function based on the state provided
 
         :param want: the desired configuration as a dictionary
         :param have: the current configuration as a dictionary
+        :param run_conf: the interface running configuration
         :rtype: A list
         :returns: the commands necessary to migrate the current configuration
                   to the desired configuration
@@ -111,23 +125,25 @@ class L2_interfaces(ConfigBase):
         want = param_list_to_dict(want) if want else dict()
         have = param_list_to_dict(have) if have else dict()
 
-        connection = self._connection
+        stackports = get_stackports(run_conf, have)
+        # Only deleting configuration never needs to know which vlans exist.
+        device_vlans = get_device_vlans(self._connection) if state != 'deleted' else set()
         if state == 'overridden':
-            kwargs = {'self': self, 'want': want, 'have': have, 'connection': connection}
+            kwargs = {'self': self, 'want': want, 'have': have, 'stackports': stackports, 'device_vlans': device_vlans}
             commands = self._state_overridden(**kwargs)
         elif state == 'deleted':
-            kwargs = {'self': self, 'want': want, 'have': have, 'connection': connection}
+            kwargs = {'self': self, 'want': want, 'have': have, 'stackports': stackports}
             commands = self._state_deleted(**kwargs)
         elif state == 'merged':
-            kwargs = {'self': self, 'want': want, 'have': have, 'connection': connection}
+            kwargs = {'self': self, 'want': want, 'have': have, 'stackports': stackports, 'device_vlans': device_vlans}
             commands = self._state_merged(**kwargs)
         elif state == 'replaced':
-            kwargs = {'self': self, 'want': want, 'have': have, 'connection': connection}
+            kwargs = {'self': self, 'want': want, 'have': have, 'stackports': stackports, 'device_vlans': device_vlans}
             commands = self._state_replaced(**kwargs)
         return commands
 
     @staticmethod
-    def _state_replaced(self, want, have, connection):
+    def _state_replaced(self, want, have, stackports, device_vlans):
         """ The command generator when state is replaced
 
         :rtype: A list
@@ -138,12 +154,12 @@ class L2_interfaces(ConfigBase):
 
         for name, want_dict in iteritems(want):
             if name in have:
-                if not check_stackports(connection, name):
-                    commands.extend(_do_replace(name, want_dict, have[name], self._module, connection))
+                if not check_stackports(stackports, name):
+                    commands.extend(_do_replace(name, want_dict, have[name], self._module, device_vlans))
         return commands
 
     @staticmethod
-    def _state_overridden(self, want, have, connection):
+    def _state_overridden(self, want, have, stackports, device_vlans):
         """ The command generator when state is overridden
 
         :rtype: A list
@@ -154,15 +170,15 @@ class L2_interfaces(ConfigBase):
 
         for name, have_dict in iteritems(have):
             if name in want:
-                if not check_stackports(connection, name):
-                    commands.extend(_do_replace(name, want[name], have_dict, self._module, connection))
+                if not check_stackports(stackports, name):
+                    commands.extend(_do_replace(name, want[name], have_dict, self._module, device_vlans))
             else:
                 want_dict = {'name': name}
-                commands.extend(_do_delete(name, want_dict, have_dict, connection))
+                commands.extend(_do_delete(name, want_dict, have_dict, stackports))
         return commands
 
     @staticmethod
-    def _state_merged(self, want, have, connection):
+    def _state_merged(self, want, have, stackports, device_vlans):
         """ The command generator when state is merged
 
         :rtype: A list
@@ -173,13 +189,13 @@ class L2_interfaces(ConfigBase):
 
         for name, want_dict in iteritems(want):
             if name in have:
-                if not check_stackports(connection, name):
+                if not check_stackports(stackports, name):
                     have_dict = have[name]
-                    commands.extend(_set_config(name, want_dict, have_dict, self._module, connection))
+                    commands.extend(_set_config(name, want_dict, have_dict, self._module, device_vlans))
         return commands
 
     @staticmethod
-    def _state_deleted(self, want, have, connection):
+    def _state_deleted(self, want, have, stackports):
         """ The command generator when state is deleted
 
         :rtype: A list
@@ -190,28 +206,53 @@ class L2_interfaces(ConfigBase):
         for name, want_dict in iteritems(want):
             if name in have:
                 have_dict = have[name]
-                commands.extend(_do_delete(name, want_dict, have_dict, connection))
+                commands.extend(_do_delete(name, want_dict, have_dict, stackports))
         return commands
 
 
-def check_stackports(connection, name):
+def get_stackports(run_conf, int_list):
+    """ Collects the ports configured as stacking ports.
+
+        :param run_conf: the output of 'show running-config interface'
+        :param int_list: list of valid interface names
+        :rtype: set
+        :returns: The names of the stacking ports
+    """
+    stackports = set()
+    for resource in run_conf.split('!'):
+        match = re.search(r'interface (\S+)', resource)
+        if match and re.search(r'stackport', resource):
+            stackports.update(int_range_to_list(match.group(1), int_list) or [])
+    return stackports
+
+
+def check_stackports(stackports, name):
     """ Checks whether a port is a stackport.
 
-        :param connection: the device connection
+        :param stackports: the names of the stacking ports
         :param name: the name of the interface
         :rtype: bool
         :returns: True if the interface is configured as
                   a stacking port, False otherwise
     """
+    return name in stackports
 
-    port_conf = connection.get(f"show running-config interface {name}")
-    return True if re.search(r'stackport', port_conf) else False
 
+def get_device_vlans(connection):
+    """ Collects the IDs of the vlans that exist on the host device
 
-def check_vlan_conf(connection, vlans):
+        :param connection: the device connection
+        :rtype: set
+        :returns: The vlan IDs listed by 'show vlan brief'
+    """
+    vlan_brief = connection.get('show vlan brief')
+    return set(int(vlan_id) for vlan_id in VLAN_ID_RE.findall(vlan_brief))
+
+
+def check_vlan_conf(device_vlans, vlans):
     """ Checks whether the incoming vlans are available on the host device
 
-        :param connection: the device connection
+        :param device_vlans: the vlan IDs that exist on the device
         :param vlan: the list of vlans to check
         :rtype: list
         :returns: A list of valid vlans that exist on the device
@@ -227,14 +268,13 @@ def check_vlan_conf(connection, vlans):
                 vlans_list = [int(vlan)]
 
             for vlan_item in vlans_list:
-                result = connection.get(f"show vlan {vlan_item}") if vlan_item is not None and vlan_item != 0 else ''
-                if result != '':
+                if vlan_item in device_vlans:
                     valid_vlans.append(vlan_item)
 
     return valid_vlans
 
 
-def _do_delete(name, want_dict, have_dict, connection):
+def _do_delete(name, want_dict, have_dict, stackports):
     """
     Carry out actions for deleting the configuration for a port.
     """
@@ -255,11 +295,11 @@ def _do_delete(name, want_dict, have_dict, connection):
 
     # Delete requested components
     if w_vlan and h_vlan:
-        if not check_stackports(connection, name):
+        if not check_stackports(stackports, name):
             if int(w_vlan) == int(h_vlan):
                 p_cmd.append('no switchport access vlan')
     if w_native_vlan_flag and h_native_vlan_flag:
-        if not check_stackports(connection, name):
+        if not check_stackports(stackports, name):
             if int(w_native_vlan) == int(h_native_vlan):
                 p_cmd.append('no switchport trunk native vlan')
     if w_allowed_vlans and h_allowed_vlans:
@@ -267,10 +307,10 @@ def _do_delete(name, want_dict, have_dict, connection):
         w_allowed_vlans = [item.strip() for item in w_allowed_vlans]
         for dv in h_allowed_vlans:
             if dv in w_allowed_vlans:
-                if not check_stackports(connection, name):
+                if not check_stackports(stackports, name):
                     p_cmd.append(f'switchport trunk allowed vlan remove {dv}')
     if not (w_vlan or w_native_vlan_flag or w_allowed_vlans) and (h_access or h_trunk):
-        if not check_stackports(connection, name):
+        if not check_stackports(stackports, name):
             p_cmd.append('switchport mode access')
             p_cmd.append('no switchport access vlan')
     if p_cmd:
@@ -278,7 +318,7 @@ def _do_delete(name, want_dict, have_dict, connection):
     return p_cmd
 
 
-def _do_replace(name, want_dict, have_dict, module, connection):
+def _do_replace(name, want_dict, have_dict, module, device_vlans):
     """
     Carry out actions for replacing entire configuration of a port. This is used for
     both replaced and overridden operations.
@@ -311,7 +351,7 @@ def _do_replace(name, want_dict, have_dict, module, connection):
 
     # Set VLAN in access mode
     if w_vlan and (not h_vlan or h_vlan != w_vlan):
-        w_vlan = check_vlan_conf(connection, [w_vlan])
+        w_vlan = check_vlan_conf(device_vlans, [w_vlan])
         if w_vlan:
             p_cmd.append(f'switchport access vlan {w_vlan[0]}')
 
@@ -319,7 +359,7 @@ def _do_replace(name, want_dict, have_dict, module, connection):
     if ((w_native_vlan_flag and (not h_native_vlan_flag or h_native_vlan != w_native_vlan))
             or (w_native_vlan is None and h_native_vlan not in (0, 1, None))):
         if w_native_vlan != 0:
-            w_native_vlan = check_vlan_conf(connection, [w_native_vlan])
+            w_native_vlan = check_vlan_conf(device_vlans, [w_native_vlan])
         else:
             w_native_vlan = [w_native_vlan]
         if w_native_vlan or w_native_vlan == 0:
@@ -330,7 +370,7 @@ def _do_replace(name, want_dict, have_dict, module, connection):
         if h_allowed_vlans:
             h_allowed_vlans = [int(item) for item in h_allowed_vlans]
         # need to check that wanted allowed vlans are configured
-        w_allowed_vlans = check_vlan_conf(connection, w_allowed_vlans)
+        w_allowed_vlans = check_vlan_conf(device_vlans, w_allowed_vlans)
 
         for rv in w_allowed_vlans:
             if rv not in h_allowed_vlans:
@@ -344,7 +384,7 @@ def _do_replace(name, want_dict, have_dict, module, connection):
     return p_cmd
 
 
-def _set_config(name, want, have, module, connection):
+def _set_config(name, want, have, module, device_vlans):
     commands = []
 
     diff = dict_diff(have, want)
@@ -356,7 +396,7 @@ def _set_config(name, want, have, module, connection):
         if not have.get('access'):
             commands.append('switchport mode access')
         if value['vlan'] != have.get('access', {}).get('vlan'):
-            vlan = check_vlan_conf(connection, [value['vlan']]) if value['vlan'] != 0 else [0]
+            vlan = check_vlan_conf(device_vlans, [value['vlan']]) if value['vlan'] != 0 else [0]
             if vlan:
                 commands.append(f"switchport access vlan {vlan[0]}")
 
@@ -366,7 +406,7 @@ def _set_config(name, want, have, module, connection):
             commands.append('switchport mode trunk')
         if value.get('allowed_vlans'):
             # need to check that wanted vlan is configured
-            valid_vlan_list = check_vlan_conf(connection, value.get('allowed_vlans'))
+            valid_vlan_list = check_vlan_conf(device_vlans, value.get('allowed_vlans'))
 
             for vlan in valid_vlan_list:
                 h_allowed_vlans = have.get('trunk', {}).get('allowed_vlans', [])
@@ -374,7 +414,7 @@ def _set_config(name, want, have, module, connection):
                 if vlan not in h_allowed_vlans:
                     commands.append(f"switchport trunk allowed vlan add {vlan}")
         if value.get('native_vlan') is not None and value.get('native_vlan') != have.get('trunk', {}).get('native_vlan'):
-            native_vlan = check_vlan_conf(connection, [value['native_vlan']]) if value['native_vlan'] != 0 else [0]
+            native_vlan = check_vlan_conf(device_vlans, [value['native_vlan']]) if value['native_vlan'] != 0 else [0]
             if native_vlan:
                 commands.append(f'switchport trunk native vlan {"none" if native_vlan[0] == 0 else native_vlan[0]}')
 
@@ -26,6 +26,7 @@ from ansible.module_utils.six import (
 from ansible.module_utils.common.network import is_masklen
 
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.facts import Facts
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.utils import get_after_facts
 
 
 class L3_interfaces(ConfigBase):
@@ -74,11 +75,9 @@ class L3_interfaces(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_l3_interfaces_facts = self.get_l3_interfaces_facts()
-
         result['before'] = existing_l3_interfaces_facts
         if result['changed']:
-            result['after'] = changed_l3_interfaces_facts
+            result['after'] = get_after_facts(self._module, existing_l3_interfaces_facts, self.get_l3_interfaces_facts)
 
         return result
 
@@ -22,6 +22,8 @@ from ansible.module_utils.six import (
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.facts import Facts
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.utils import (
+    compress_interface_commands,
+    get_after_facts,
     remove_duplicate_interface,
 )
 
@@ -72,11 +74,9 @@ class Lacp_interfaces(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_lacp_interfaces_facts = self.get_lacp_interfaces_facts()
-
         result['before'] = existing_lacp_interfaces_facts
         if result['changed']:
-            result['after'] = changed_lacp_interfaces_facts
+            result['after'] = get_after_facts(self._module, existing_lacp_interfaces_facts, self.get_lacp_interfaces_facts)
 
         return result
 
@@ -91,7 +91,7 @@ class Lacp_interfaces(ConfigBase):
         want = self._module.params['config']
         have = existing_lacp_interfaces_facts
         resp = self.set_state(want, have)
-        return to_list(resp)
+        return compress_interface_commands(to_list(resp))
 
     def set_state(self, want, have):
         """ Select the appropriate function based on the state provided
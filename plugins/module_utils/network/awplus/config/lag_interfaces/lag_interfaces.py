@@ -17,6 +17,7 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
     to_list,
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.facts import Facts
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.utils import get_after_facts
 
 
 class Lag_interfaces(ConfigBase):
@@ -65,11 +66,9 @@ class Lag_interfaces(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_lag_interfaces_facts = self.get_lag_interfaces_facts()
-
         result['before'] = existing_lag_interfaces_facts
         if result['changed']:
-            result['after'] = changed_lag_interfaces_facts
+            result['after'] = get_after_facts(self._module, existing_lag_interfaces_facts, self.get_lag_interfaces_facts)
 
         return result
 
@@ -20,7 +20,7 @@ from ansible.module_utils.six import (
     iteritems
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.facts import Facts
-from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.utils import get_lldp_defaults
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.utils import get_after_facts, get_lldp_defaults
 
 
 class Lldp_global(ConfigBase):
@@ -70,11 +70,9 @@ class Lldp_global(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_lldp_global_facts = self.get_lldp_global_facts()
-
         result['before'] = existing_lldp_global_facts
         if result['changed']:
-            result['after'] = changed_lldp_global_facts
+            result['after'] = get_after_facts(self._module, existing_lldp_global_facts, self.get_lldp_global_facts)
 
         result['warnings'] = warnings
         return result
@@ -23,6 +23,8 @@ from ansible.module_utils.six import (
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.facts import Facts
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.utils import (
+    compress_interface_commands,
+    get_after_facts,
     remove_duplicate_interface,
 )
 
@@ -74,11 +76,9 @@ class Lldp_interfaces(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_lldp_interfaces_facts = self.get_lldp_interfaces_facts()
-
         result['before'] = existing_lldp_interfaces_facts
         if result['changed']:
-            result['after'] = changed_lldp_interfaces_facts
+            result['after'] = get_after_facts(self._module, existing_lldp_interfaces_facts, self.get_lldp_interfaces_facts)
 
         result['warnings'] = warnings
         return result
@@ -94,7 +94,7 @@ class Lldp_interfaces(ConfigBase):
         want = self._module.params['config']
         have = existing_lldp_interfaces_facts
         resp = self.set_state(want, have)
-        return to_list(resp)
+        return compress_interface_commands(to_list(resp))
 
     def set_state(self, want, have):
         """ Select the appropriate function based on the state provided
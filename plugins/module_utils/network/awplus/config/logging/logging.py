@@ -18,6 +18,7 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
     remove_empties,
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.facts import Facts
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.utils import get_after_facts
 
 
 class Logging(ConfigBase):
@@ -67,11 +68,9 @@ class Logging(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_logging_facts = self.get_logging_facts()
-
         result['before'] = existing_logging_facts
         if result['changed']:
-            result['after'] = changed_logging_facts
+            result['after'] = get_after_facts(self._module, existing_logging_facts, self.get_logging_facts)
 
         result['warnings'] = warnings
         return result
@@ -20,6 +20,7 @@ from ansible.module_utils.six import (
     iteritems
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.facts import Facts
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.utils import get_after_facts
 
 parm_to_keyword = {'source_address': 'source-address',
                    'peer_address': 'peer-address',
@@ -82,10 +83,9 @@ class Mlag(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_mlag_facts = self.get_mlag_facts()
         result['before'] = existing_mlag_facts
         if result['changed']:
-            result['after'] = changed_mlag_facts
+            result['after'] = get_after_facts(self._module, existing_mlag_facts, self.get_mlag_facts)
 
         return result
 
@@ -18,6 +18,7 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
     to_list,
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.facts import Facts
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.utils import get_after_facts
 
 
 class Mlag_interfaces(ConfigBase):
@@ -66,11 +67,9 @@ class Mlag_interfaces(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_mlag_interfaces_facts = self.get_mlag_interfaces_facts()
-
         result['before'] = existing_mlag_interfaces_facts
         if result['changed']:
-            result['after'] = changed_mlag_interfaces_facts
+            result['after'] = get_after_facts(self._module, existing_mlag_interfaces_facts, self.get_mlag_interfaces_facts)
 
         return result
 
@@ -16,6 +16,7 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
     to_list,
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.facts import Facts
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.utils import get_after_facts
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.utils.utils import clean_address_string
 
 parm_to_keyword = {'inactivity_timer': 'inactivity',
@@ -76,11 +77,9 @@ class Openflow(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_openflow_facts = self.get_openflow_facts()
-
         result['before'] = existing_openflow_facts
         if result['changed']:
-            result['after'] = changed_openflow_facts
+            result['after'] = get_after_facts(self._module, existing_openflow_facts, self.get_openflow_facts)
 
         return result
 
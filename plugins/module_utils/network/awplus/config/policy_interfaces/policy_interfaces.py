@@ -17,8 +17,8 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
     to_list,
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.facts import Facts
-
-import re
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.utils import get_after_facts
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.references import get_device_references
 
 
 class Policy_interfaces(ConfigBase):
@@ -68,11 +68,9 @@ class Policy_interfaces(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_policy_interfaces_facts = self.get_policy_interfaces_facts()
-
         result['before'] = existing_policy_interfaces_facts
         if result['changed']:
-            result['after'] = changed_policy_interfaces_facts
+            result['after'] = get_after_facts(self._module, existing_policy_interfaces_facts, self.get_policy_interfaces_facts)
 
         result['warnings'] = warnings
         return result
@@ -243,6 +241,5 @@ class Policy_interfaces(ConfigBase):
         result = False
         # check for any unsupported characters in name
         if name and not any([item in name for item in [' ', '\\', '|']]):
-            pol_maps = self._connection.get(f"show policy-map {name}")
-            result = re.search(r"POLICY-MAP-NAME: (\S+)", pol_maps)
-        return True if result else False
+            result = get_device_references(self._module, self._connection).has_policy_map(name)
+        return result
@@ -14,6 +14,8 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.c
 )
 
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.facts import Facts
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.utils import get_after_facts
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.references import get_device_references
 
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     to_list,
@@ -22,8 +24,6 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
     remove_empties,
 )
 
-import re
-
 
 class Policy_maps(ConfigBase):
     """
@@ -72,11 +72,9 @@ class Policy_maps(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_policy_maps_facts = self.get_policy_maps_facts()
-
         result['before'] = existing_policy_maps_facts
         if result['changed']:
-            result['after'] = changed_policy_maps_facts
+            result['after'] = get_after_facts(self._module, existing_policy_maps_facts, self.get_policy_maps_facts)
 
         result['warnings'] = warnings
         return result
@@ -750,10 +748,7 @@ class Policy_maps(ConfigBase):
         :rtype: A bool
         :returns: True if a class exists, False otherwise
         """
-        connection = self._connection
-        result = connection.get(f"show class-map {name}")
-        comp = re.search(r'CLASS-MAP-NAME: (\S+)', result)
-        return True if comp else False
+        return get_device_references(self._module, self._connection).has_class_map(name)
 
     def round_policer_values(self, item):
         """ rounds policer parameters (cir, cbs, pir, pbs)
@@ -20,6 +20,7 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
     remove_empties,
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.facts import Facts
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.utils import get_after_facts
 
 
 class Premark_dscps(ConfigBase):
@@ -69,11 +70,9 @@ class Premark_dscps(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_premark_dscps_facts = self.get_premark_dscps_facts()
-
         result['before'] = existing_premark_dscps_facts
         if result['changed']:
-            result['after'] = changed_premark_dscps_facts
+            result['after'] = get_after_facts(self._module, existing_premark_dscps_facts, self.get_premark_dscps_facts)
 
         result['warnings'] = warnings
         return result
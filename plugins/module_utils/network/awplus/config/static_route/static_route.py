@@ -23,11 +23,11 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
 )
 
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.facts import Facts
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.utils import get_after_facts
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.references import get_device_references
 
 from copy import deepcopy
 
-import re
-
 from ipaddress import (
     IPv4Network,
     NetmaskValueError
@@ -90,11 +90,9 @@ class Static_route(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_static_route_facts = self.get_static_route_facts()
-
         result['before'] = existing_static_route_facts
         if result['changed']:
-            result['after'] = changed_static_route_facts
+            result['after'] = get_after_facts(self._module, existing_static_route_facts, self.get_static_route_facts)
 
         result['warnings'] = warnings
         return result
@@ -303,11 +301,7 @@ class Static_route(ConfigBase):
         :rtype: A bool
         :returns: True if the VRF exists on the device, False otherwise
         """
-        connection = self._connection
-        result = connection.get(f"show ip vrf {vrf}")
-        pattern = f'VRF {vrf} does not exist'
-        comp = re.search(pattern, result)
-        return True if not comp else False
+        return get_device_references(self._module, self._connection).has_vrf(vrf)
 
     def _check_config(self, w_item):
         """ Checks that the incoming config is valid
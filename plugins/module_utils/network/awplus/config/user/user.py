@@ -23,6 +23,7 @@ from ansible.module_utils.six import (
     iteritems
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.facts import Facts
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.utils import get_after_facts
 
 
 class User(ConfigBase):
@@ -70,11 +71,9 @@ class User(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_user_facts = self.get_user_facts()
-
         result['before'] = existing_user_facts
         if result['changed']:
-            result['after'] = changed_user_facts
+            result['after'] = get_after_facts(self._module, existing_user_facts, self.get_user_facts)
 
         return result
 
@@ -22,6 +22,7 @@ from ansible.module_utils.six import (
     iteritems
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.facts import Facts
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.utils import get_after_facts
 
 
 class Vlans(ConfigBase):
@@ -71,11 +72,9 @@ class Vlans(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_vlans_facts = self.get_vlans_facts()
-
         result['before'] = existing_vlans_facts
         if result['changed']:
-            result['after'] = changed_vlans_facts
+            result['after'] = get_after_facts(self._module, existing_vlans_facts, self.get_vlans_facts)
 
         result['warnings'] = warnings
         return result
@@ -17,6 +17,7 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
     to_list,
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.facts import Facts
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.utils import get_after_facts
 
 
 class Vrfs(ConfigBase):
@@ -73,11 +74,9 @@ class Vrfs(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_vrfs_facts = self.get_vrfs_facts()
-
         result['before'] = existing_vrfs_facts
         if result['changed']:
-            result['after'] = changed_vrfs_facts
+            result['after'] = get_after_facts(self._module, existing_vrfs_facts, self.get_vrfs_facts)
 
         result['warnings'] = warnings
         return result
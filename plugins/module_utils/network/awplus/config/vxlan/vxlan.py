@@ -18,6 +18,7 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
 )
 from ansible.module_utils.six import iteritems
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.facts import Facts
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.utils import get_after_facts
 
 
 class Vxlan(ConfigBase):
@@ -68,11 +69,9 @@ class Vxlan(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_vxlan_facts = self.get_vxlan_facts()
-
         result['before'] = existing_vxlan_facts
         if result['changed']:
-            result['after'] = changed_vxlan_facts
+            result['after'] = get_after_facts(self._module, existing_vxlan_facts, self.get_vxlan_facts)
 
         return result
 
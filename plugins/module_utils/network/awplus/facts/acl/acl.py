@@ -16,6 +16,11 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
     utils,
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.acl.acl import AclArgs
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.utils import iter_lines
+
+ACL_HEADER_RE = re.compile(r'(\S+) (IP|IPv6) access list (\S+)')
+ACE_ACTIONS = frozenset(AclArgs.argument_spec['config']['options']['acls']['options']['aces']['options']['action']['choices'])
+STANDARD_ACE_ACTIONS = frozenset(('permit', 'deny'))
 
 
 class AclFacts(object):
@@ -129,6 +134,7 @@ class AclFacts(object):
         :returns: ace facts
         """
         ace = dict()
+        seq = ''
         action = ''
         protocol = ''
         wild_card_mask_dest = ''
@@ -138,72 +144,45 @@ class AclFacts(object):
         ICMP_num = ''
         dest_port_protocol = dict()
         source_port_protocol = dict()
-        line = ' '.join(line.split())
+        values = line.split()
+        count = len(values)
+        numbered = count > 2 and values[0].isdigit()
 
         if acl_type == "Standard":
-            acl_match = re.findall(r"(\d+) (deny|permit) (\S+) (\S+)", line)
-            if not acl_match:
-                acl_match = re.findall(r"(\d+) (deny|permit) (\S+)", line)
-
-            if acl_match:
-                values = acl_match[0]
+            if numbered and values[1] in STANDARD_ACE_ACTIONS:
+                seq = values[0]
                 action = values[1]
-                source = values[2] + ' ' + values[3] if len(values) == 4 else values[2]
-        elif re.search(r'tcp|udp', line):
-            values = line.split(' ')  # Split the ace by the spaces
+                source = ' '.join(values[2:4])
+        elif 'tcp' in line or 'udp' in line:
+            seq = values[0]
             action = values[1]
             protocol = values[2]
             source = values[3]
             source_port_protocol, dest_port_protocol, dest = self.render_tcp_udp_config(values)
 
-        else:
-            acl_match = None
+        elif numbered and count >= 5 and values[1] in ACE_ACTIONS:
+            seq = values[0]
+            action = values[1]
+            protocol = values[2]
+            source = values[3]
 
-            if re.search(r'icmp-type', line):
+            if count >= 7 and values[5] == 'icmp-type' and values[6].isdigit():
                 # handles icmp acls
-                acl_match = re.findall(
-                    r'(\d+) (permit|deny|copy-to-cpu|copy-to-mirror|send-to-mirror|send-to-cpu) '
-                    r'(\S+) (\S+) (\S+) icmp-type (\d+)', line
-                )
-            elif re.search(r'(any)', line):
-                # if destination is any
-                acl_match = re.findall(
-                    r'(\d+) (permit|deny|copy-to-cpu|copy-to-mirror|send-to-mirror|send-to-cpu) '
-                    r'(\S+) (\S+) (\S+) (\S+)', line
-                )
-
+                dest = values[4]
+                ICMP_num = values[6]
+            elif count >= 6 and ('any' in line or count >= 7):
+                # the source has a wild card mask, as does the destination if it isn't any
+                wild_card_mask_source = ' ' + values[4]
+                dest = values[5]
+                if 'any' not in line:
+                    wild_card_mask_dest = ' ' + values[6]
             else:
-                # if destination has address and wild card mask
-                acl_match = re.findall(
-                    r'(\d+) (permit|deny|copy-to-cpu|copy-to-mirror|send-to-mirror|send-to-cpu) '
-                    r'(\S+) (\S+) (\S+) (\S+) (\S+)', line
-                )
-            if not acl_match:
                 # if the address prefix is used for addresses
-                acl_match = re.findall(
-                    r'(\d+) (permit|deny|copy-to-cpu|copy-to-mirror|send-to-mirror|send-to-cpu) '
-                    r'(\S+) (\S+) (\S+)', line
-                )
-
-            if acl_match:
-                # assign parameters
-                values = acl_match[0]
-                action = values[1]
-                protocol = values[2]
-                source = values[3]
-
-                if re.search(r'icmp-type', line):
-                    # assign parameters if icmp-type is found
-                    dest = values[4]
-                    ICMP_num = values[5]
-
-                else:
-                    # assign parameters if icmp-type is not found
-                    dest = values[5] if len(acl_match[0]) != 5 else values[4]
-                    wild_card_mask_dest = ' ' + values[6] if len(acl_match[0]) == 7 else ''
-                    wild_card_mask_source = ' ' + values[4] if len(acl_match[0]) != 5 else ''
+                dest = values[4]
 
         # map parameters to ace dictonary
+        if seq.isdigit():
+            ace["ace_ID"] = int(seq)
         ace["source_addr"] = source + wild_card_mask_source
         if source_port_protocol != {}:
             ace["source_port_protocol"] = [source_port_protocol]
@@ -218,6 +197,31 @@ class AclFacts(object):
             ace["ICMP_type_number"] = int(ICMP_num)
         return ace
 
+    def parse_acls(self, lines):
+        """ Parse the acls from the lines of the show access-list output
+        :param lines: iterable of the output lines
+        :rtype: generator
+        :returns: the acl facts, one acl at a time
+        """
+        acl = None
+        for line in lines:
+            if 'access list' in line:
+                # an acl header starts the next acl
+                if acl is not None:
+                    yield acl
+                acl = None
+                name_match = ACL_HEADER_RE.search(line)
+                if name_match:
+                    acl = dict()
+                    acl["type"] = name_match.group(1)
+                    acl["afi"] = 'IPv4' if name_match.group(2) == 'IP' else 'IPv6'
+                    acl["name"] = name_match.group(3)
+                    acl["ace"] = []
+            elif acl is not None and '   ' in line:
+                acl["ace"].append(self.render_ace_config(line, acl["type"]))
+        if acl is not None:
+            yield acl
+
     def render_acl_config(self, data):
         """
         Render config as dictionary structure and delete keys
@@ -226,61 +230,4 @@ class AclFacts(object):
         :rtype: list
         :returns: list of acls
         """
-        acl_list = []
-        acl_facts = []
-
-        # order list into form [[acl_name, [ace1, ace2], [acl_name, [ace1, ace2]]]]
-        result = re.split(r'Hardware|Standard|Extended|Named', data)
-        if result:
-            for item in result:
-                ace_list = []
-                name = ''
-                item = item.split('\n')
-
-                for line in item:
-                    if re.search(r'access list', line):
-                        name = line
-                    elif re.search(r'(   )', line):
-                        ace_list.append(line)
-                if name != '':
-                    acl_list.append([name, ace_list])
-
-        # update ACL names so that acl type is also included
-        result = data.split('\n')
-        acls_names = []
-        for item in result:
-            if re.search(r'access list', item):
-                acls_names.append(item)
-
-        temp_acl_list = acl_list
-        for count, item in enumerate(temp_acl_list):
-            for acl_name in acls_names:
-                acl_name_match = re.search(r'(\S+) (IP|IPv6) access list (\d+|\S+)', acl_name)
-
-                item_name_match = re.search(r'(IP|IPv6) access list (\d+|\S+)', item[0])
-                check_acl_name = acl_name_match.group(3) if acl_name_match else None
-                item_name = item_name_match.group(2) if item_name_match else None
-
-                if check_acl_name == item_name and check_acl_name and item_name:
-                    acl_list[count][0] = acl_name
-
-        # render each acl
-        for item in acl_list:
-            ace_list = []
-            type_name = item[0]
-            ace = item[1]
-            acl = dict()
-
-            name_match = re.search(r'(\S+) (IP|IPv6) access list (\d+|\S+)', type_name)
-            if name_match:
-                # assign parameters
-                acl["type"] = name_match.group(1)
-                acl["afi"] = 'IPv4' if name_match.group(2) == 'IP' else 'IPv6'
-                acl["name"] = name_match.group(3)
-            for entry in ace:
-                # render each ace in acl
-                ace_list.append(self.render_ace_config(entry, acl['type']))
-
-            acl["ace"] = ace_list
-            acl_facts.append(acl)
-        return acl_facts
+        return list(self.parse_acls(iter_lines(data)))
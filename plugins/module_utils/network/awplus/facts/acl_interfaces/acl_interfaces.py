@@ -59,7 +59,7 @@ class Acl_interfacesFacts(object):
             data = self.get_running_config(connection)
         int_brief = self.get_port_list(connection)
         int_brief = int_brief.splitlines()
-        int_list = [i.split()[0].strip() for i in int_brief][1:]
+        int_list = set(i.split()[0].strip() for i in int_brief[1:])
 
         # split the config into instances of the resource
         objs = []
@@ -85,7 +85,7 @@ class Acl_interfacesFacts(object):
 
         :param spec: The facts tree, generated from the argspec
         :param conf: The configuration
-        :param int_list: List of all interfaces.
+        :param int_list: Set of all interfaces.
         :rtype: dictionary
         :returns: The generated config
         """
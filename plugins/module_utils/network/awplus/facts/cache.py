@@ -0,0 +1,74 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2023 Allied Telesis
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+The controller side cache of parsed resource facts
+The resource facts of a device are stored with a fingerprint of its
+running-config, and are reused for as long as the fingerprint is unchanged.
+"""
+import hashlib
+import json
+import os
+import re
+import tempfile
+
+from ansible.module_utils._text import to_bytes
+
+# Bumped whenever the parsed facts change shape, so older entries are ignored.
+CACHE_FORMAT = 1
+CACHE_KEY_RE = re.compile(r'[^\w.-]')
+
+
+def config_fingerprint(running_config):
+    """ Fingerprint a running-config
+
+    :param running_config: the running-config of the device
+    :rtype: string
+    :returns: the fingerprint
+    """
+    return hashlib.sha256(to_bytes(running_config, errors='surrogate_or_strict')).hexdigest()
+
+
+class ResourceFactsCache(object):
+    """ The resource facts of one device, cached in a JSON file
+    """
+
+    def __init__(self, cache_dir, key):
+        self.path = os.path.join(os.path.expanduser(cache_dir), CACHE_KEY_RE.sub('_', key) + '.json')
+
+    def load(self, fingerprint):
+        """ Load the cached resource facts
+
+        :param fingerprint: the fingerprint of the current running-config
+        :rtype: dictionary
+        :returns: the resource facts by subset, empty if the cache is missing or stale
+        """
+        try:
+            with open(self.path) as cache_file:
+                entry = json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return {}
+        if not isinstance(entry, dict) or entry.get('format') != CACHE_FORMAT or entry.get('fingerprint') != fingerprint:
+            return {}
+        return entry.get('resources') or {}
+
+    def store(self, fingerprint, resources):
+        """ Replace the cached resource facts
+
+        :param fingerprint: the fingerprint of the running-config they were parsed from
+        :param resources: the resource facts by subset
+        """
+        cache_dir = os.path.dirname(self.path)
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+        entry = {'format': CACHE_FORMAT, 'fingerprint': fingerprint, 'resources': resources}
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as cache_file:
+                json.dump(entry, cache_file)
+            os.rename(tmp_path, self.path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
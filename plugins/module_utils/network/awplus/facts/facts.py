@@ -8,10 +8,17 @@ The facts class for awplus
 this file validates each subset of facts and selectively
 calls the appropriate facts gathering function
 """
+import re
 
+from ansible.module_utils._text import to_text
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.facts.facts import (
     FactsBase,
 )
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.config_tree import ConfigTree
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.cache import (
+    ResourceFactsCache,
+    config_fingerprint,
+)
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.acl.acl import AclFacts
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.acl_interfaces.acl_interfaces import Acl_interfacesFacts
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.banner.banner import BannerFacts
@@ -44,6 +51,98 @@ from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplu
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.legacy.base import Default, Hardware, Config, Interfaces
 
 
+RUNNING_CONFIG = 'show running-config'
+
+# Running-config views that are the top level blocks starting with the given
+# keyword, i.e. "show running-config interface" is every interface block.
+RUNNING_CONFIG_SECTIONS = dict(
+    interface='interface ',
+    bgp='router bgp',
+    lldp='lldp ',
+)
+RUNNING_CONFIG_FILTER_RE = re.compile(r'\|\s*(include|grep|begin)\s+(.+)$')
+
+
+class ConfigSnapshot(object):
+    """ A read-through wrapper around the device connection used while
+    gathering facts.
+
+    The full running-config is transferred at most once, the filtered
+    running-config views asked for by the resource fact classes are derived
+    from that copy locally, and any other command is only sent to the device
+    the first time it is asked for.
+    """
+
+    def __init__(self, connection):
+        self._connection = connection
+        self._outputs = {}
+        self._tree = None
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+    def get(self, command, *args, **kwargs):
+        if args or kwargs:
+            return self._connection.get(command, *args, **kwargs)
+        if command not in self._outputs:
+            out = self.running_config_view(command)
+            if out is None:
+                out = self._connection.get(command)
+            self._outputs[command] = out
+        return self._outputs[command]
+
+    def running_config(self):
+        return self.get(RUNNING_CONFIG)
+
+    def config_tree(self):
+        """ The running-config parsed into sections, built once and shared
+        by every view derived from it.
+
+        :rtype: ConfigTree
+        :returns: the running-config tree
+        """
+        if self._tree is None:
+            self._tree = ConfigTree(self.running_config())
+        return self._tree
+
+    def running_config_view(self, command):
+        """ Derive the output of a filtered running-config command from the
+        full running-config.
+
+        :param command: the show command
+        :rtype: string
+        :returns: the command output, or None if it has to come from the device
+        """
+        if not command.startswith(RUNNING_CONFIG + ' '):
+            return None
+        view = command[len(RUNNING_CONFIG):].strip()
+
+        match = RUNNING_CONFIG_FILTER_RE.match(view)
+        if match:
+            pattern = re.compile(match.group(2).strip())
+            lines = self.running_config().splitlines()
+            if match.group(1) == 'begin':
+                for index, line in enumerate(lines):
+                    if pattern.search(line):
+                        return '\n'.join(lines[index:])
+                return ''
+            return '\n'.join([line for line in lines if pattern.search(line)])
+
+        if view in RUNNING_CONFIG_SECTIONS:
+            return self.sections(RUNNING_CONFIG_SECTIONS[view])
+        return None
+
+    def sections(self, keyword):
+        """ Collect the top level running-config blocks starting with keyword,
+        each block followed by a '!' line as the device does.
+
+        :param keyword: the start of the block header line
+        :rtype: string
+        :returns: the matching blocks
+        """
+        return self.config_tree().section_text(keyword)
+
+
 FACT_LEGACY_SUBSETS = dict(
     default=Default,
     hardware=Hardware,
@@ -90,6 +189,81 @@ class Facts(FactsBase):
 
     def __init__(self, module):
         super(Facts, self).__init__(module)
+        if self._connection is not None:
+            self._connection = ConfigSnapshot(self._connection)
+        self._cache = None
+        if module.params.get('resource_cache') and self._connection is not None:
+            self._cache = ResourceFactsCache(module.params['resource_cache_dir'], module.params['resource_cache_key'])
+
+    def get_network_resources_facts(self, facts_resource_obj_map, resource_facts_type=None, data=None):
+        """ Collect the resource facts
+
+        Each subset is populated into its own facts tree from the shared
+        config snapshot, so the running-config is fetched once for all of
+        them, and the trees are merged in the order the subsets were
+        selected. With the resource cache enabled, subsets parsed by an
+        earlier run from the same running-config are taken from the cache
+        instead.
+
+        :param facts_resource_obj_map: The resource fact classes by subset
+        :param resource_facts_type: List of resource fact types
+        :param data: previously collected conf
+        """
+        if not resource_facts_type:
+            resource_facts_type = self._gather_network_resources
+
+        restorun_subsets = self.gen_runable(
+            resource_facts_type,
+            frozenset(facts_resource_obj_map.keys()),
+            resource_facts=True,
+        )
+        if not restorun_subsets:
+            return
+
+        self.ansible_facts['ansible_net_gather_network_resources'] = list(restorun_subsets)
+        instances = list()
+        for key in restorun_subsets:
+            fact_cls_obj = facts_resource_obj_map.get(key)
+            if fact_cls_obj:
+                instances.append((key, fact_cls_obj(self._module)))
+            else:
+                self._warnings.extend(["network resource fact gathering for '%s' is not supported" % key])
+
+        fingerprint = None
+        cached = {}
+        if self._cache is not None and instances and not data:
+            try:
+                fingerprint = config_fingerprint(self._connection.running_config())
+            except Exception as exc:
+                self._module.fail_json(msg=to_text(exc))
+            cached = self._cache.load(fingerprint)
+
+        results = dict((key, cached[key]) for key, inst in instances if key in cached)
+        pending = [(key, inst) for key, inst in instances if key not in results]
+
+        def populate(inst):
+            facts = {'ansible_network_resources': {}}
+            inst.populate_facts(self._connection, facts, data)
+            return facts['ansible_network_resources']
+
+        # One subset at a time: the fact classes validate their facts with
+        # netcommon validate_config, which swaps the process-wide module
+        # arguments, so they can't be populated from parallel threads.
+        for key, inst in pending:
+            try:
+                results[key] = populate(inst)
+            except Exception as exc:
+                self._module.fail_json(msg=to_text(exc))
+
+        for key, inst in instances:
+            self.ansible_facts['ansible_network_resources'].update(results[key])
+
+        if fingerprint is not None and pending:
+            cached.update(results)
+            try:
+                self._cache.store(fingerprint, cached)
+            except (IOError, OSError) as exc:
+                self._warnings.append(f"unable to update the resource facts cache: {to_text(exc)}")
 
     def get_facts(self, legacy_facts_type=None, resource_facts_type=None, data=None):
         """ Collect the facts for awplus
@@ -17,7 +17,9 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.interfaces.interfaces import InterfacesArgs
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.utils import (
-    int_range_to_list
+    int_range_to_list,
+    prune_empties,
+    spec_record_factory,
 )
 
 
@@ -38,6 +40,7 @@ class InterfacesFacts(object):
             facts_argument_spec = spec
 
         self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.new_record = spec_record_factory(self.generated_spec)
 
     def get_run_conf(self, connection):
         return connection.get("show running-config interface")
@@ -57,20 +60,21 @@ class InterfacesFacts(object):
         if not data:
             # typically data is populated from the current device configuration
             data = self.get_run_conf(connection)
-        int_list = self.get_int_brief(connection)
+        # Ordered like show interface brief, with O(1) lookups and removals.
+        int_list = dict.fromkeys(self.get_int_brief(connection))
 
         resources = data.split('!')
 
         objs = []
         for resource in resources:
             if resource:
-                obj = self.render_config(self.generated_spec, resource, int_list)
+                obj = self.render_config(self.new_record, resource, int_list)
                 if obj:
                     objs.extend(obj)
 
         if int_list:  # add interfaces not shown in running-config
-            for interface in int_list:
-                obj = self.render_config(self.generated_spec, "interface " + interface, deepcopy(int_list))
+            for interface in list(int_list):
+                obj = self.render_config(self.new_record, "interface " + interface, int_list)
                 if obj:
                     objs.extend(obj)
 
@@ -78,16 +82,17 @@ class InterfacesFacts(object):
         facts = {}
         if objs:
             params = utils.validate_config(self.argument_spec, {'config': objs})
-            facts['interfaces'] = [utils.remove_empties(cfg) for cfg in params['config']]
+            facts['interfaces'] = [prune_empties(cfg) for cfg in params['config']]
 
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
 
-    def render_config(self, spec, conf, int_list):
+    def render_config(self, new_record, conf, int_list):
         """ Render config for either a range or a single interface
 
-        :param spec: The facts tree, generated from the argspec
+        :param new_record: Builds an empty facts tree, generated from the argspec
         :param conf: The configuration
+        :param int_list: The interfaces not rendered yet, as dict keys
         :rtype: dictionary
         :returns: The generated config as a list
         """
@@ -102,20 +107,20 @@ class InterfacesFacts(object):
 
         for interface in interfaces:
             if interface in int_list:
-                intf_configs.append(self.parse_config(spec, conf, interface))
-                int_list.remove(interface)
+                intf_configs.append(self.parse_config(new_record, conf, interface))
+                del int_list[interface]
         return intf_configs
 
-    def parse_config(self, spec, conf, intf):
+    def parse_config(self, new_record, conf, intf):
         """ Render config as dictionary structure and delete keys
           from spec for null values
 
-        :param spec: The facts tree, generated from the argspec
+        :param new_record: Builds an empty facts tree, generated from the argspec
         :param conf: The configuration
         :rtype: dictionary
         :returns: The generated config
         """
-        config = deepcopy(spec)
+        config = new_record()
         config["name"] = intf
         config["description"] = utils.parse_conf_arg(conf, "description")
         if utils.parse_conf_arg(conf, "speed"):
@@ -125,4 +130,4 @@ class InterfacesFacts(object):
         config["duplex"] = utils.parse_conf_arg(conf, "duplex")
         enabled = utils.parse_conf_cmd_arg(conf, "shutdown", False)
         config["enabled"] = enabled if enabled is not None else True
-        return utils.remove_empties(config)
+        return prune_empties(config)
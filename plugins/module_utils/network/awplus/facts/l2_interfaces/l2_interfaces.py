@@ -56,7 +56,7 @@ class L2_interfacesFacts(object):
         """
         if not data:
             data = self.get_run_conf(connection)
-        int_list = self.get_int_brief(connection)
+        int_list = set(self.get_int_brief(connection))
 
         resources = data.split('!')
 
@@ -15,6 +15,10 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.utils import (
+    prune_empties,
+    spec_record_factory,
+)
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.l3_interfaces.l3_interfaces import L3_interfacesArgs
 
 
@@ -35,6 +39,7 @@ class L3_interfacesFacts(object):
             facts_argument_spec = spec
 
         self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.new_record = spec_record_factory(self.generated_spec)
 
     def get_device_data(self, connection):
         return connection.get('show running-config')
@@ -55,7 +60,7 @@ class L3_interfacesFacts(object):
         objs = []
         for resource in resources:
             if resource:
-                obj = self.render_config(self.generated_spec, resource)
+                obj = self.render_config(self.new_record, resource)
                 if obj:
                     objs.append(obj)
 
@@ -65,22 +70,22 @@ class L3_interfacesFacts(object):
             params = utils.validate_config(self.argument_spec, {'config': objs})
             facts['l3_interfaces'] = []
             for cfg in params['config']:
-                facts['l3_interfaces'].append(utils.remove_empties(cfg))
+                facts['l3_interfaces'].append(prune_empties(cfg))
 
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
 
-    def render_config(self, spec, conf):
+    def render_config(self, new_record, conf):
         """
         Render config as dictionary structure and delete keys
           from spec for null values
 
-        :param spec: The facts tree, generated from the argspec
+        :param new_record: Builds an empty facts tree, generated from the argspec
         :param conf: The configuration
         :rtype: dictionary
         :returns: The generated config
         """
-        config = deepcopy(spec)
+        config = new_record()
         lines = conf.split('\n')
         lines = [line for line in lines if line]
 
@@ -119,4 +124,4 @@ class L3_interfacesFacts(object):
             config['ipv4'] = ipv4
             config['ipv6'] = ipv6
             config['vrf'] = vrf
-        return utils.remove_empties(config)
+        return prune_empties(config)
@@ -57,7 +57,7 @@ class Lacp_interfacesFacts(object):
         if not data:
             # typically data is populated from the current device configuration
             data = self.get_run_conf(connection)
-        int_list = self.get_int_brief(connection)
+        int_list = set(self.get_int_brief(connection))
 
         resources = data.split('!')
 
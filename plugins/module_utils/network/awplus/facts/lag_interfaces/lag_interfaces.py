@@ -60,7 +60,7 @@ class Lag_interfacesFacts(object):
         """
         if not data:
             data = self.get_run_conf(connection)
-        int_list = self.get_int_brief(connection)
+        int_list = set(self.get_int_brief(connection))
 
         # split the config into instances of the resource
         objs = []
@@ -95,7 +95,7 @@ class Lag_interfacesFacts(object):
 
         :param spec: The facts tree, generated from the argspec
         :param conf: The configuration
-        :param int_list: List of all interfaces.
+        :param int_list: Set of all interfaces.
         :rtype: dictionary
         :returns: The generated config
         """
@@ -20,6 +20,7 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.awplus import (
     run_commands,
     get_capabilities,
+    iter_command_lines,
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.utils.utils import (
     normalize_interface,
@@ -145,7 +146,6 @@ class Config(FactsBase):
 class Interfaces(FactsBase):
 
     COMMANDS = [
-        "show interface",
         "show ip interface",
         "show ipv6 interface",
         "show ip irdp interface",
@@ -159,27 +159,30 @@ class Interfaces(FactsBase):
         self.facts["all_ipv6_addresses"] = list()
         self.facts["neighbors"] = {}
 
-        data = self.responses[0]
-        if data:
-            interfaces = self.parse_interfaces(data)
+        # "show interface" runs to several pages per port on a large stack,
+        # so it is read from the connection a chunk at a time.
+        interfaces = self.parse_interfaces(
+            iter_command_lines(self.module, "show interface")
+        )
+        if interfaces:
             self.facts["interfaces"] = self.populate_interfaces(interfaces)
 
-        data = self.responses[1]
+        data = self.responses[0]
         if data:
             data = self.parse_ip_interfaces(data)
             self.populate_ipv4_interfaces(data)
 
-        data = self.responses[2]
+        data = self.responses[1]
         if data:
             data = self.parse_ip_interfaces(data)
             self.populate_ipv6_interfaces(data)
 
-        data = self.responses[3]
+        data = self.responses[2]
         if data:
             data = self.parse_irdp_interfaces(data)
             self.populate_line_protocol(data)
 
-        data = self.responses[4]
+        data = self.responses[3]
         lldp_errs = ["Invalid input", "LLDP is not enabled"]
 
         if data and not any(err in data for err in lldp_errs):
@@ -282,20 +285,20 @@ class Interfaces(FactsBase):
                     parsed[key] = line
         return parsed
 
-    def parse_interfaces(self, data):
+    def parse_interfaces(self, lines):
         parsed = dict()
         key = ""
-        for line in data.split("\n"):
+        for line in lines:
             if len(line) == 0:
                 continue
             elif line[0] == " ":
-                parsed[key] += f"\n{line}"
+                parsed[key].append(line)
             else:
                 match = re.match(r"^Interface (\S+)", line)
                 if match:
                     key = match.group(1)
-                    parsed[key] = line
-        return parsed
+                    parsed[key] = [line]
+        return dict((key, "\n".join(value)) for key, value in iteritems(parsed))
 
     def parse_irdp_interfaces(self, data):
         parsed = dict()
@@ -58,7 +58,7 @@ class Lldp_interfacesFacts(object):
         """
         if not data:
             data = self.get_device_data(connection)
-        int_list = self.get_int_brief(connection)
+        int_list = set(self.get_int_brief(connection))
 
         resources = data.split("!")
 
@@ -17,6 +17,24 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.policy_maps.policy_maps import Policy_mapsArgs
 
+POLICY_MAP_RE = re.compile(r'policy-map (\S+)')
+DEFAULT_ACTION_RE = re.compile(r'Default class-map action: (\S+)')
+DESCRIPTION_RE = re.compile(r'Description: (.+)')
+TRUST_STATE_RE = re.compile(r'Trust state: (\S+)')
+SINGLE_RATE_RE = re.compile(r'(\d+) (\d+) (\d+)')
+TWIN_RATE_RE = re.compile(r'(\d+) (\d+) (\d+) (\d+)')
+
+# One pattern for every classifier line, the outer group names the attribute
+CLASSIFIER_LINE_RE = re.compile(
+    r'(?P<class>^ class (?P<class_name>\S+))'
+    r'|(?P<policer>^  police (?P<police_type>single-rate|twin-rate) (?P<rates>.+) action (?P<police_action>\S+))'
+    r'|(?P<remark_map>remark-map bandwidth-class (?P<class_in>\S+) to new-dscp (?P<new_dscp>\d+)'
+    r' new-bandwidth-class (?P<new_class>\S+))'
+    r'|(?P<remark>remark new-cos (?P<new_cos>\d+) (?P<apply>\S+))'
+    r'|(?P<pbr_next_hop>set ip next-hop (?P<next_hop>\S+))'
+    r'|(?P<storm>storm-(?P<storm_key>protection|action|window|rate|downtime)(?: (?P<storm_value>\S+))?)'
+)
+
 
 class Policy_mapsFacts(object):
     """ The awplus policy_maps fact class
@@ -64,7 +82,7 @@ class Policy_mapsFacts(object):
 
         # split the config into instances of the resource
         data = re.split(r'POLICY-MAP-NAME:', data)
-        class_data = class_data.split('!')
+        class_data = self.index_policy_map_blocks(class_data)
 
         objs = []
         for resource in data:
@@ -82,6 +100,22 @@ class Policy_mapsFacts(object):
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
 
+    @staticmethod
+    def index_policy_map_blocks(conf):
+        """
+        Index the running-config blocks by the policy map they configure
+
+        :param conf: The running-config, from the first policy map
+        :rtype: dictionary
+        :returns: The lines of the blocks of each policy map, by name
+        """
+        blocks = {}
+        for block in conf.split('!'):
+            pol_name_match = POLICY_MAP_RE.search(block)
+            if pol_name_match:
+                blocks.setdefault(pol_name_match.group(1), []).append(block.split('\n'))
+        return blocks
+
     def render_config(self, spec, conf, class_data):
         """
         Render config as dictionary structure and delete keys
@@ -89,6 +123,7 @@ class Policy_mapsFacts(object):
 
         :param spec: The facts tree, generated from the argspec
         :param conf: The configuration
+        :param class_data: The class configuration, indexed by policy map
         :rtype: dictionary
         :returns: The generated config
         """
@@ -100,17 +135,17 @@ class Policy_mapsFacts(object):
             # policy config
             config['name'] = policy_conf[0].lstrip()
             for item in result:
-                default_action_match = re.search(r'Default class-map action: (\S+)', item)
+                default_action_match = DEFAULT_ACTION_RE.search(item)
                 if default_action_match:
                     default_action = default_action_match.group(1)
                     default_action = default_action.replace('-', '_')
                     config['default_action'] = default_action
 
-                description_match = re.search(r'Description: (.+)', item)
+                description_match = DESCRIPTION_RE.search(item)
                 if description_match:
                     config['description'] = description_match.group(1)
 
-                trust_dscp_match = re.search(r'Trust state: (\S+)', item)
+                trust_dscp_match = TRUST_STATE_RE.search(item)
                 if trust_dscp_match:
                     config['trust_dscp'] = True if trust_dscp_match.group(1) == 'DSCP' else False
             # get class config
@@ -123,103 +158,74 @@ class Policy_mapsFacts(object):
         Render config for classifiers
 
         :param name: The name of the policy map
-        :param conf: The class configuration of each policy map
+        :param conf: The class configuration, indexed by policy map
         :rtype: list
         :returns: The classifier config for the policy-map
         """
         results = []
-        policer = dict()
-        remark_maps = []
 
-        for classifier in conf:
-
-            pol_name_match = re.search(r'policy-map (\S+)', classifier)
-            if pol_name_match:
-                # need to make sure name obtained matches the policy name obtained from parent function
-                if pol_name_match.group(1) == name:
-                    result = dict()
-                    for item in classifier.split('\n'):
-
-                        # class name
-                        class_name_match = re.search(r'^ class (\S+)', item)
-                        if class_name_match:
-                            # append classifier to results and clear variables for next classifier
-                            if result:
-                                results.append(result)
-                                result = dict()
-                                remark_map = dict()
-                                remark_maps = []
-                                policer = dict()
-                            result['name'] = class_name_match.group(1)
-
-                        # policer facts
-                        policer_match = re.match(r'  police (single-rate|twin-rate) (.+) action (\S+)', item)
-                        if policer_match:
-                            policer['type'] = policer_match.group(1).replace('-', '_')
-                            policer['action'] = policer_match.group(3).replace('-', '_')
-                            rate_type = policer_match.group(2)
-                            if policer['type'] == 'single_rate':
-                                sr_match = re.search(r'(\d+) (\d+) (\d+)', rate_type)
-                                if sr_match:
-                                    policer['cir'] = sr_match.group(1)
-                                    policer['cbs'] = sr_match.group(2)
-                                    policer['ebs'] = sr_match.group(3)
-                            elif policer['type'] == 'twin_rate':
-                                tr_match = re.search(r'(\d+) (\d+) (\d+) (\d+)', rate_type)
-                                if tr_match:
-                                    policer['cir'] = tr_match.group(1)
-                                    policer['pir'] = tr_match.group(2)
-                                    policer['cbs'] = tr_match.group(3)
-                                    policer['pbs'] = tr_match.group(4)
-
-                        # remark_map facts
-                        remark_map_match = re.search(r'remark-map bandwidth-class (\S+) to new-dscp (\d+) new-bandwidth-class (\S+)', item)
-                        if remark_map_match:
-                            remark_map = {}
-                            remark_map['class_in'] = remark_map_match.group(1)
-                            remark_map['new_dscp'] = remark_map_match.group(2)
-                            remark_map['new_class'] = remark_map_match.group(3)
-                            remark_maps.append(remark_map)
-
-                        # remark facts
-                        remark_new_cos_match = re.search(r'remark new-cos (\d+) (\S+)', item)
-                        if remark_new_cos_match:
-                            result['remark'] = {'new_cos': remark_new_cos_match.group(1), 'apply': remark_new_cos_match.group(2)}
-
-                        # pbr_next_hop facts
-                        ip_next_hop_match = re.search(r'set ip next-hop (\S+)', item)
-                        if ip_next_hop_match:
-                            result['pbr_next_hop'] = ip_next_hop_match.group(1)
-
-                        # storm facts
-                        storm_protection_match = re.search(r'storm-protection', item)
-                        if storm_protection_match:
-                            result['storm_protection'] = True
-
-                        storm_action_match = re.search(r'storm-action (\S+)', item)
-                        if storm_action_match:
-                            action = storm_action_match.group(1)
-                            action = action.replace('disable', '_disable')
-                            action = action.replace('down', '_down')
-                            result['storm_action'] = action
-
-                        storm_window_match = re.search(r'storm-window (\S+)', item)
-                        if storm_window_match:
-                            result['storm_window'] = storm_window_match.group(1)
-
-                        storm_rate_match = re.search(r'storm-rate (\S+)', item)
-                        if storm_rate_match:
-                            result['storm_rate'] = storm_rate_match.group(1)
-
-                        storm_downtime_match = re.search(r'storm-downtime (\S+)', item)
-                        if storm_downtime_match:
-                            result['storm_downtime'] = storm_downtime_match.group(1)
-
-                        if policer:
-                            result['policer'] = policer
-                        if remark_maps:
-                            result['remark_map'] = remark_maps
-
-                    # append the last classifier to results
-                    results.append(result)
+        for classifier in conf.get(name, []):
+            result = dict()
+            policer = dict()
+            remark_maps = []
+            for item in classifier:
+                match = CLASSIFIER_LINE_RE.search(item)
+                if not match:
+                    continue
+                kind = match.lastgroup
+
+                if kind == 'class':
+                    # append classifier to results and clear variables for next classifier
+                    if result:
+                        results.append(result)
+                        result = dict()
+                        remark_maps = []
+                        policer = dict()
+                    result['name'] = match.group('class_name')
+
+                elif kind == 'policer':
+                    policer['type'] = match.group('police_type').replace('-', '_')
+                    policer['action'] = match.group('police_action').replace('-', '_')
+                    rate_type = match.group('rates')
+                    if policer['type'] == 'single_rate':
+                        sr_match = SINGLE_RATE_RE.search(rate_type)
+                        if sr_match:
+                            policer['cir'] = sr_match.group(1)
+                            policer['cbs'] = sr_match.group(2)
+                            policer['ebs'] = sr_match.group(3)
+                    elif policer['type'] == 'twin_rate':
+                        tr_match = TWIN_RATE_RE.search(rate_type)
+                        if tr_match:
+                            policer['cir'] = tr_match.group(1)
+                            policer['pir'] = tr_match.group(2)
+                            policer['cbs'] = tr_match.group(3)
+                            policer['pbs'] = tr_match.group(4)
+                    result['policer'] = policer
+
+                elif kind == 'remark_map':
+                    remark_map = {}
+                    remark_map['class_in'] = match.group('class_in')
+                    remark_map['new_dscp'] = match.group('new_dscp')
+                    remark_map['new_class'] = match.group('new_class')
+                    remark_maps.append(remark_map)
+                    result['remark_map'] = remark_maps
+
+                elif kind == 'remark':
+                    result['remark'] = {'new_cos': match.group('new_cos'), 'apply': match.group('apply')}
+
+                elif kind == 'pbr_next_hop':
+                    result['pbr_next_hop'] = match.group('next_hop')
+
+                elif match.group('storm_key') == 'protection':
+                    result['storm_protection'] = True
+
+                elif match.group('storm_value') is not None:
+                    value = match.group('storm_value')
+                    if match.group('storm_key') == 'action':
+                        value = value.replace('disable', '_disable')
+                        value = value.replace('down', '_down')
+                    result['storm_' + match.group('storm_key')] = value
+
+            # append the last classifier to results
+            results.append(result)
         return results
@@ -15,8 +15,15 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.utils import (
+    prune_empties,
+    spec_record_factory,
+)
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.vlans.vlans import VlansArgs
 
+VLAN_RE = re.compile(r'^(?P<vlan_id>\d+)\s+(?P<name>\S+)\s+\S+\s+(?P<state>\S+).*')
+VLAN_STATES = VlansArgs.argument_spec['config']['options']['state']['choices']
+
 
 class VlansFacts(object):
     """ The awplus vlans fact class
@@ -35,6 +42,7 @@ class VlansFacts(object):
             facts_argument_spec = spec
 
         self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.new_record = spec_record_factory(self.generated_spec)
 
     def get_run_conf(self, connection):
         return connection.get('show vlan all')
@@ -56,34 +64,37 @@ class VlansFacts(object):
         objs = []
         for resource in resources:
             if resource:
-                obj = self.render_config(self.generated_spec, resource)
+                obj = self.render_config(self.new_record, resource)
                 if obj:
                     objs.append(obj)
 
         ansible_facts['ansible_network_resources'].pop('vlans', None)
         facts = {}
-        if objs:
+        if objs and all(obj['state'] in VLAN_STATES for obj in objs):
+            # The records are parsed with the types the argspec asks for, so
+            # validating them again would only cost time.
+            facts['vlans'] = objs
+        elif objs:
             params = utils.validate_config(self.argument_spec, {'config': objs})
-            facts['vlans'] = [utils.remove_empties(cfg) for cfg in params['config']]
+            facts['vlans'] = [prune_empties(cfg) for cfg in params['config']]
 
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
 
-    def render_config(self, spec, conf):
+    def render_config(self, new_record, conf):
         """
         Render config as dictionary structure and delete keys
           from spec for null values
 
-        :param spec: The facts tree, generated from the argspec
+        :param new_record: Builds an empty facts tree, generated from the argspec
         :param conf: The configuration
         :rtype: dictionary
         :returns: The generated config
         """
-        config = deepcopy(spec)
-        vlan = re.compile(r'^(?P<vlan_id>\d+)\s+(?P<name>\S+)\s+\S+\s+(?P<state>\S+).*')
-        match = vlan.match(conf)
+        config = new_record()
+        match = VLAN_RE.match(conf)
         if match:
-            config['vlan_id'] = match.group('vlan_id')
+            config['vlan_id'] = int(match.group('vlan_id'))
             config['name'] = match.group('name')
             config['state'] = match.group('state').lower()
-        return utils.remove_empties(config)
+        return prune_empties(config)
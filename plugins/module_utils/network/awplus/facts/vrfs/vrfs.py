@@ -15,6 +15,10 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.utils import (
+    prune_empties,
+    spec_record_factory,
+)
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.vrfs.vrfs import VrfsArgs
 
 
@@ -35,6 +39,7 @@ class VrfsFacts(object):
             facts_argument_spec = spec
 
         self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.new_record = spec_record_factory(self.generated_spec)
 
     def get_data(self, connection):
         return connection.get('show running-config')
@@ -54,7 +59,7 @@ class VrfsFacts(object):
         objs = []
         for resource in data.split('!'):
             if resource and resource.lstrip().startswith('ip vrf'):
-                obj = self.render_config(self.generated_spec, resource)
+                obj = self.render_config(self.new_record, resource)
                 if obj:
                     objs.append(obj)
 
@@ -67,17 +72,17 @@ class VrfsFacts(object):
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
 
-    def render_config(self, spec, conf):
+    def render_config(self, new_record, conf):
         """
         Render config as dictionary structure and delete keys
           from spec for null values
 
-        :param spec: The facts tree, generated from the argspec
+        :param new_record: Builds an empty facts tree, generated from the argspec
         :param conf: The configuration
         :rtype: dictionary
         :returns: The generated config
         """
-        config = deepcopy(spec)
+        config = new_record()
 
         for conf_line in conf.splitlines():
             ls = conf_line.strip()
@@ -114,4 +119,4 @@ class VrfsFacts(object):
                     else:
                         config['route_target'].append(new_rt)
 
-        return utils.remove_empties(config)
+        return prune_empties(config)
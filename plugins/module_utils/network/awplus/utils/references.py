@@ -0,0 +1,99 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2023 Allied Telesis
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Lookups of the objects (class-maps, policy-maps, ACLs and VRFs) that the
+resource modules refer to by name.
+Each kind of object is listed from the device the first time it is asked
+about, and every later check is answered from that list.
+"""
+import re
+
+CLASS_MAP_NAME_RE = re.compile(r'CLASS-MAP-NAME: (\S+)')
+POLICY_MAP_NAME_RE = re.compile(r'POLICY-MAP-NAME: (\S+)')
+ACL_HEADER_RE = re.compile(r'(\S+) (IP|IPv6) access list (\S+)')
+VRF_RE = re.compile(r'^ip vrf (\S+)', re.M)
+
+
+def get_device_references(module, connection):
+    """ Get the object lookups shared by everything run for a module
+
+    :param module: the module being run
+    :param connection: the device connection
+    :rtype: DeviceReferences
+    :returns: the lookups for the device the module runs against
+    """
+    references = getattr(module, '_awplus_device_references', None)
+    if references is None:
+        references = DeviceReferences(connection)
+        module._awplus_device_references = references
+    return references
+
+
+class DeviceReferences(object):
+    """ Answers whether named objects exist on the device, fetching each
+    catalogue of objects at most once
+    """
+
+    def __init__(self, connection):
+        self._connection = connection
+        self._class_maps = None
+        self._policy_maps = None
+        self._acls = None
+        self._vrfs = None
+
+    def class_maps(self):
+        """ The class-maps on the device
+
+        :rtype: A set
+        :returns: the class-map names
+        """
+        if self._class_maps is None:
+            self._class_maps = set(CLASS_MAP_NAME_RE.findall(self._connection.get("show class-map")))
+        return self._class_maps
+
+    def policy_maps(self):
+        """ The policy-maps on the device
+
+        :rtype: A set
+        :returns: the policy-map names
+        """
+        if self._policy_maps is None:
+            self._policy_maps = set(POLICY_MAP_NAME_RE.findall(self._connection.get("show policy-map")))
+        return self._policy_maps
+
+    def acls(self):
+        """ The ACLs on the device
+
+        :rtype: A dictionary
+        :returns: the type of each ACL by name, e.g. 'Hardware'
+        """
+        if self._acls is None:
+            self._acls = {}
+            for acl_type, _afi, name in ACL_HEADER_RE.findall(self._connection.get("show access-list")):
+                self._acls.setdefault(name, acl_type)
+        return self._acls
+
+    def vrfs(self):
+        """ The VRFs configured on the device
+
+        :rtype: A set
+        :returns: the VRF names
+        """
+        if self._vrfs is None:
+            self._vrfs = set(VRF_RE.findall(self._connection.get("show running-config | include ^ip vrf")))
+        return self._vrfs
+
+    def has_class_map(self, name):
+        return name in self.class_maps()
+
+    def has_policy_map(self, name):
+        return name in self.policy_maps()
+
+    def acl_type(self, name):
+        return self.acls().get(name)
+
+    def has_vrf(self, name):
+        return name in self.vrfs()
@@ -6,6 +6,7 @@
 
 # utils
 import re
+from copy import deepcopy
 
 
 def remove_command_from_config_list(interface, cmd, commands):
@@ -144,69 +145,219 @@ def get_interface_type(interface):
         return "unknown"
 
 
+# An interface name split into the part shared by a range ("port1.0.", "vlan")
+# and the trailing instance number that varies across it.
+INTERFACE_NAME_RE = re.compile(r"(([a-z]+)(?:(\d+)\.(\d+)\.)?)(\d+)$", re.I)
+RANGE_END_RE = re.compile(r"(?:\d+\.\d+\.)?(\d+)$")
+
+
+def interface_key(name):
+    """ Split an interface name into a sortable key.
+    :param name: interface name, e.g. port1.0.12 or vlan10
+    :rtype: tuple
+    :returns: (type, stack, slot, port) for switch ports, (type, instance)
+              for other interfaces, or None if the name is not recognised
+    """
+    match = INTERFACE_NAME_RE.match(name)
+    if not match:
+        return None
+    if match.group(3) is None:
+        return (match.group(2), int(match.group(5)))
+    return (match.group(2), int(match.group(3)), int(match.group(4)), int(match.group(5)))
+
+
 def int_range_to_list(range_string, int_list):
     """ For a given interface range and list of possible interfaces,
     return a list of the interfaces in the range (as strings).
     :param range_string: interface range as generated by show running-config
-    :param int_list: list of valid interface strings (show int brief)
+    :param int_list: valid interface strings (show int brief); pass a set
+                     when expanding many ranges against the same interfaces
     :rtype: list
     :returns: list of interfaces or None (if errors)
     """
-    # Take care of case where we have comma-separated interfaces (use recursion)
-    if ',' in range_string:
-        ret_list = []
-        intranges = range_string.split(',')
-        for intrange in intranges:
-            sub_list = int_range_to_list(intrange, int_list)
-            if sub_list is None:
+    ret_list = []
+    for intrange in range_string.split(','):
+        # Take care of case when it's not a range.
+        if '-' not in intrange:
+            if intrange not in int_list:
                 return None
-            ret_list.extend(sub_list)
-        return ret_list
-
-    # Take care of case when it's not a range.
-    if '-' not in range_string:
-        if range_string in int_list:
-            return [range_string]
-        else:
-            return None
-
-    # It's a range, work out how to expand the range.
-    ints = range_string.split('-')
-    if len(ints) != 2:
-        return None
+            ret_list.append(intrange)
+            continue
 
-    # ints[0] is a type and instance, ints[1] is just an instance
-    # Find out how many numbers appear in the instance.
-    n_inst = 3
-    match = re.match(r"([a-z]+)(\d+).(\d+).(\d+)", ints[0], re.I)
-    if not match:
-        n_inst = 1
-        match = re.match(r"([a-z]+)(\d+)", ints[0], re.I)
-        if not match:
-            return None
-    match1 = re.match(r"(\d+).(\d+).(\d+)", ints[1], re.I)
-    if match1:
-        if n_inst != 3:
+        start, end = intrange.split('-', 1)
+        match = INTERFACE_NAME_RE.match(start)
+        end_match = RANGE_END_RE.match(end)
+        if not match or not end_match:
             return None
-    else:
-        match1 = re.match(r"(\d+)", ints[1], re.I)
-        if not match or n_inst != 1:
+        # Both ends have the stack and slot numbers, or neither does.
+        if (match.group(3) is None) != (end_match.group(0) == end_match.group(1)):
             return None
 
-    # Optimise by only allowing the last number to vary.
-    # This is how the config comes out.
-    ret_list = []
-    if n_inst == 3:
-        base_name = match.group(1) + match.group(2) + '.' + match.group(3) + '.'
-    else:
+        # Only the last number varies. This is how the config comes out.
         base_name = match.group(1)
-    for i in range(int(match.group(n_inst + 1)), int(match1.group(n_inst)) + 1):
-        int_name = base_name + str(i)
-        if int_name in int_list:
-            ret_list.append(int_name)
+        for i in range(int(match.group(5)), int(end_match.group(1)) + 1):
+            int_name = base_name + str(i)
+            if int_name in int_list:
+                ret_list.append(int_name)
     return ret_list
 
 
+def int_list_to_range(interfaces):
+    """ For a given list of interfaces, return the range string covering them,
+    in the form show running-config uses (the reverse of int_range_to_list).
+    e.g. port1.0.1, port1.0.2, port1.0.3, port1.0.5 -> port1.0.1-1.0.3,port1.0.5
+    :param interfaces: list of interface strings
+    :rtype: str
+    :returns: comma-separated interfaces and interface ranges
+    """
+    ranges = []
+    unknown = []
+    instances = {}
+    for name in interfaces:
+        match = INTERFACE_NAME_RE.match(name)
+        if match:
+            instances.setdefault(match.group(1), set()).add(int(match.group(5)))
+        elif name not in unknown:
+            unknown.append(name)
+
+    for base_name in sorted(instances, key=lambda base: interface_key(base + '0')):
+        # The end of a range repeats the stack and slot but not the type.
+        end_prefix = re.sub(r"^[a-z]+", "", base_name, flags=re.I)
+        numbers = sorted(instances[base_name])
+        first = prev = numbers[0]
+        for number in numbers[1:] + [None]:
+            if number == prev + 1:
+                prev = number
+                continue
+            if first == prev:
+                ranges.append(f"{base_name}{first}")
+            else:
+                ranges.append(f"{base_name}{first}-{end_prefix}{prev}")
+            first = prev = number
+    return ','.join(ranges + unknown)
+
+
+def compress_interface_commands(commands):
+    """ Merge interface blocks with identical commands into range blocks.
+    Commands are "interface <name>" lines, each followed by the lines to run
+    on that interface. A merged block takes the place of the first block in
+    its group, so blocks for one interface keep their order. Lines before
+    the first interface block are left in place and nothing is merged
+    across them.
+    e.g. interface port1.0.1, lldp notification, interface port1.0.2,
+    lldp notification -> interface port1.0.1-1.0.2, lldp notification
+    :param commands: list of commands
+    :rtype: list
+    :returns: the commands with identical interface blocks merged
+    """
+    compressed = []
+    groups = {}
+
+    def flush():
+        for (_kind, body), names in groups.items():
+            compressed.append(f"interface {int_list_to_range(names)}")
+            compressed.extend(body)
+        groups.clear()
+
+    blocks = []
+    for command in commands:
+        if command.startswith('interface '):
+            blocks.append((command[len('interface '):], []))
+        elif blocks and blocks[-1][0] is not None:
+            blocks[-1][1].append(command)
+        else:
+            blocks.append((None, command))
+
+    seen = set()
+    for name, body in blocks:
+        if name is None:
+            flush()
+            seen.clear()
+            compressed.append(body)
+            continue
+        if name in seen:
+            # A second block for an interface must stay after its first one.
+            flush()
+            seen.clear()
+        seen.add(name)
+        key = interface_key(name)
+        # Only single interfaces of the same type are merged into one range.
+        kind = key[0] if key else name
+        groups.setdefault((kind, tuple(body)), []).append(name)
+    flush()
+    return compressed
+
+
+def spec_record_factory(generated_spec):
+    """ Precompile a facts spec into a function returning fresh copies of it.
+    The copies are the same as deepcopy(generated_spec) gives, but only the
+    nested dicts and lists are rebuilt; everything else is one dict copy.
+    :param generated_spec: The facts tree, generated from the argspec
+    :rtype: function
+    :returns: function taking no arguments and returning a new facts tree
+    """
+    template = dict(generated_spec)
+    nested = [(key, spec_record_factory(val)) for key, val in template.items() if isinstance(val, dict)]
+    mutable = [key for key, val in template.items() if isinstance(val, list)]
+
+    def new_record():
+        record = template.copy()
+        for key, factory in nested:
+            record[key] = factory()
+        for key in mutable:
+            record[key] = deepcopy(template[key])
+        return record
+    return new_record
+
+
+EMPTY_VALUES = (None, [], {}, (), "")
+
+
+def prune_empties(cfg_dict):
+    """ Remove the keys that have null values from a facts tree.
+    Gives the same result as remove_empties from netcommon without building
+    a dict for every key kept.
+    :param cfg_dict: A dictionary parsed in the facts system
+    :rtype: dictionary
+    :returns: A dictionary without the keys that have null values
+    """
+    final_cfg = {}
+    if not cfg_dict:
+        return final_cfg
+
+    for key, val in cfg_dict.items():
+        if val is None:
+            continue
+        if isinstance(val, dict):
+            val = prune_empties(val)
+            if val:
+                final_cfg[key] = val
+        elif isinstance(val, list) and val and all(isinstance(x, dict) for x in val):
+            final_cfg[key] = [prune_empties(x) for x in val]
+        elif val not in EMPTY_VALUES:
+            final_cfg[key] = val
+    return final_cfg
+
+
+def iter_lines(text):
+    """ Yield the lines of a command output one at a time.
+    Unlike splitlines the whole output is never copied into a list, so large
+    outputs can be parsed while holding only one line at a time.
+    :param text: The command output
+    :rtype: generator
+    :returns: the lines of the output, without line endings
+    """
+    start = 0
+    end = len(text)
+    while start < end:
+        stop = text.find('\n', start)
+        if stop == -1:
+            stop = end
+        line = text[start:stop]
+        yield line[:-1] if line.endswith('\r') else line
+        start = stop + 1
+
+
 def get_lldp_defaults():
     defaults = {
         'enabled': False,
@@ -220,3 +371,16 @@ def get_lldp_defaults():
         'tx_delay': 2,
     }
     return defaults
+
+
+def get_after_facts(module, before, get_facts):
+    """ The facts to report as 'after' for a task that changed the device.
+    Nothing reaches the device in check mode, so the facts are only read
+    again after a real change.
+    :param module: The AnsibleModule
+    :param before: The facts gathered before the change
+    :param get_facts: Function gathering the facts from the device
+    :rtype: A list or dictionary
+    :returns: the facts after the change
+    """
+    return before if module.check_mode else get_facts()
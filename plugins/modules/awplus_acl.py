@@ -66,6 +66,9 @@ options:
               ace_ID:
                 description:
                   - Defines the ace ID for a filter entry in an ACL.
+                  - With I(state=replaced) or I(state=overridden) an existing entry
+                    is only left in place if it has the same ace ID, or if no
+                    ace ID is given and it keeps its order in the ACL.
                 type: int
               protocols:
                 description:
@@ -360,6 +363,7 @@ commands:
 
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import resource_connection
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.acl.acl import AclArgs
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.config.acl.acl import Acl
 
@@ -373,7 +377,8 @@ def main():
     module = AnsibleModule(argument_spec=AclArgs.argument_spec,
                            supports_check_mode=True)
 
-    result = Acl(module).execute_module()
+    with resource_connection(module):
+        result = Acl(module).execute_module()
     module.exit_json(**result)
 
 
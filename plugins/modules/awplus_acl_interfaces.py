@@ -262,6 +262,7 @@ commands:
 
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import resource_connection
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.acl_interfaces.acl_interfaces import Acl_interfacesArgs
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.config.acl_interfaces.acl_interfaces import Acl_interfaces
 
@@ -275,7 +276,8 @@ def main():
     module = AnsibleModule(argument_spec=Acl_interfacesArgs.argument_spec,
                            supports_check_mode=True)
 
-    result = Acl_interfaces(module).execute_module()
+    with resource_connection(module):
+        result = Acl_interfaces(module).execute_module()
     module.exit_json(**result)
 
 
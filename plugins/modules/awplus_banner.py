@@ -158,6 +158,7 @@ commands:
 
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import resource_connection
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.banner.banner import BannerArgs
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.config.banner.banner import Banner
 
@@ -176,7 +177,8 @@ def main():
                            required_if=required_if,
                            supports_check_mode=True)
 
-    result = Banner(module).execute_module()
+    with resource_connection(module):
+        result = Banner(module).execute_module()
     module.exit_json(**result)
 
 
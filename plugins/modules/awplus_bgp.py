@@ -446,6 +446,7 @@ commands:
 
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import resource_connection
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.bgp.bgp import BgpArgs
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.config.bgp.bgp import Bgp
 
@@ -459,7 +460,8 @@ def main():
     module = AnsibleModule(argument_spec=BgpArgs.argument_spec,
                            supports_check_mode=True)
 
-    result = Bgp(module).execute_module()
+    with resource_connection(module):
+        result = Bgp(module).execute_module()
     module.exit_json(**result)
 
 
@@ -327,6 +327,7 @@ commands:
 
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import resource_connection
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.class_maps.class_maps import Class_mapsArgs
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.config.class_maps.class_maps import Class_maps
 
@@ -340,7 +341,8 @@ def main():
     module = AnsibleModule(argument_spec=Class_mapsArgs.argument_spec,
                            supports_check_mode=True)
 
-    result = Class_maps(module).execute_module()
+    with resource_connection(module):
+        result = Class_maps(module).execute_module()
     module.exit_json(**result)
 
 
@@ -20,6 +20,9 @@ description:
     before returning or timing out if the condition is not met.
   - This module does not support running commands in configuration mode.
     Please use M(alliedtelesis.awplus.awplus_config) to configure AlliedWare Plus devices.
+  - When every command is a C(show) command without a prompt, the commands are run
+    from the controller over the persistent connection without starting the module
+    on the host, which makes large inventory-wide C(show) runs much faster.
 version_added: 1.0.0
 options:
   commands:
@@ -125,6 +128,7 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.parsing import Conditional
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import transform_commands, to_lines
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.awplus import (
+    add_perf_records,
     run_commands,
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.awplus import (
@@ -201,6 +205,7 @@ def main():
 
     result.update({"stdout": responses, "stdout_lines": list(to_lines(responses))})
 
+    add_perf_records(module, result)
     module.exit_json(**result)
 
 
@@ -129,6 +129,11 @@ options:
         C(never), the running-config will never be copied to the
         startup-config.  If the argument is set to C(changed), then the running-config
         will only be copied to the startup-config if the task has made a change.
+      - With C(modified) the two configurations are compared by digests taken
+        by the persistent connection. The running-config is read on every
+        run, while the startup-config digest is kept by the connection until
+        it runs a command that could change the startup-config, such as the
+        save itself.
     type: str
     default: never
     choices: ['always', 'never', 'modified', 'changed']
@@ -250,8 +255,10 @@ from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection im
     ConnectionError,
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.awplus import (
+    add_perf_records,
     run_commands,
     get_config,
+    clear_config_cache,
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.awplus import (
     get_connection,
@@ -287,14 +294,53 @@ def get_candidate_config(module):
     return candidate
 
 
-def get_running_config(module, current_config=None):
+class ConfigStore(object):
+    """ keeps the configurations fetched from the device during the run
+
+        Each configuration is fetched at most once while it is unchanged.
+        The running-config fetched before the device configuration is
+        changed is kept as the before snapshot, and the running-config is
+        fetched again only when it is next asked for.
+    """
+
+    def __init__(self, module):
+        self._module = module
+        self._running = None
+        self._startup = None
+        self.before = None
+        self.changed = False
+
+    def running(self):
+        """ gets the running-config as it is now """
+        if self._running is None:
+            self._running = get_config(self._module)
+            if not self.changed:
+                self.before = self._running
+        return self._running
+
+    def startup(self):
+        """ gets the startup-config as it is now """
+        if self._startup is None:
+            self._startup = run_commands(self._module, "show startup-config")[0]
+        return self._startup
+
+    def config_changed(self):
+        """ records that the running-config has been changed """
+        self.changed = True
+        self._running = None
+        clear_config_cache()
+
+    def config_saved(self):
+        """ records that the running-config has been copied to the
+            startup-config """
+        self._startup = self._running
+
+
+def get_running_config(module, store):
     """ gets the current configuration of the device """
     running = module.params["running_config"]
     if not running:
-        if current_config:
-            running = current_config
-        else:
-            running = get_config(module)
+        running = store.running()
     return running
 
 
@@ -302,12 +348,22 @@ def edit_runconfig(connection, commands):
     connection.edit_config(candidate=commands)
 
 
-def save_config(module, result):
+def get_config_digests(connection, ignore_lines):
+    """ gets digests of the running-config and startup-config kept by the
+        connection, or None if the connection can't provide them """
+    try:
+        return connection.get_config_digests(ignore_lines=ignore_lines)
+    except ConnectionError:
+        return None
+
+
+def save_config(module, result, store):
     """ copies the running-config into the file set as the
         current startup-config file """
     result["changed"] = True
     if not module.check_mode:
         run_commands(module, "copy running-config startup-config\r")
+        store.config_saved()
     else:
         module.warn(
             "Skipping command `copy running-config startup-config`"
@@ -387,15 +443,13 @@ def main():
     result["warnings"] = warnings
 
     diff_ignore_lines = module.params["diff_ignore_lines"]
-    config = None
-    contents = None
     connection = get_connection(module)
+    store = ConfigStore(module)
 
     if module.params["backup"] or (
         module._diff and module.params["diff_against"] == "running"
     ):
-        contents = get_config(module)
-        config = NetworkConfig(indent=1, contents=contents)
+        contents = store.running()
         if module.params["backup"]:
             result["__backup__"] = contents
             backup_options = module.params["backup_options"]
@@ -415,7 +469,7 @@ def main():
         path = module.params["parents"]
 
         candidate = get_candidate_config(module)
-        running = get_running_config(module, contents)
+        running = get_running_config(module, store)
 
         try:
             response = connection.get_diff(
@@ -447,44 +501,47 @@ def main():
             # send the configuration commands to the device and merge
             # them with the current running config
             if not module.check_mode:
-                if commands:
-                    edit_runconfig(connection, commands)
-                if banner_diff:
-                    connection.edit_banner(
-                        candidate=json.dumps(banner_diff),
-                        multiline_delimiter=module.params["multiline_delimiter"],
-                    )
+                try:
+                    if commands:
+                        edit_runconfig(connection, commands)
+                    if banner_diff:
+                        connection.edit_banner(
+                            candidate=json.dumps(banner_diff),
+                            multiline_delimiter=module.params["multiline_delimiter"],
+                        )
+                finally:
+                    store.config_changed()
 
             result["changed"] = True
 
-    running_config = module.params["running_config"]
-    startup_config = None
-
     if module.params["save_when"] == "always":
-        save_config(module, result)
+        save_config(module, result, store)
     elif module.params["save_when"] == "modified":
-        output = run_commands(module, ["show running-config", "show startup-config"])
-
-        running_config = NetworkConfig(
-            indent=1, contents=output[0], ignore_lines=diff_ignore_lines
-        )
-        startup_config = NetworkConfig(
-            indent=1, contents=output[1], ignore_lines=diff_ignore_lines
-        )
+        digests = get_config_digests(connection, diff_ignore_lines)
+        if digests:
+            if digests["running"] != digests["startup"]:
+                save_config(module, result, store)
+        else:
+            running_config = NetworkConfig(
+                indent=1, contents=store.running(), ignore_lines=diff_ignore_lines
+            )
+            startup_config = NetworkConfig(
+                indent=1, contents=store.startup(), ignore_lines=diff_ignore_lines
+            )
 
-        if running_config.sha1 != startup_config.sha1:
-            save_config(module, result)
+            if running_config.sha1 != startup_config.sha1:
+                save_config(module, result, store)
     elif module.params["save_when"] == "changed" and result["changed"]:
-        save_config(module, result)
+        save_config(module, result, store)
 
     if module._diff:
-        if not running_config:
-            output = run_commands(module, "show running-config")
-            contents = output[0]
+        # the running_config argument stands in for the device's until
+        # the task changes it
+        if module.params["running_config"] and not store.changed:
+            contents = module.params["running_config"]
         else:
-            contents = running_config
+            contents = store.running()
 
-        # recreate the object in order to process diff_ignore_lines
         running_config = NetworkConfig(
             indent=1, contents=contents, ignore_lines=diff_ignore_lines
         )
@@ -496,14 +553,10 @@ def main():
                 )
                 contents = None
             else:
-                contents = config.config_text
+                contents = store.before
 
         elif module.params["diff_against"] == "startup":
-            if not startup_config:
-                output = run_commands(module, "show startup-config")
-                contents = output[0]
-            else:
-                contents = startup_config.config_text
+            contents = store.startup()
 
         elif module.params["diff_against"] == "intended":
             contents = module.params["intended_config"]
@@ -528,6 +581,7 @@ def main():
                     }
                 )
 
+    add_perf_records(module, result)
     module.exit_json(**result)
 
 
@@ -48,6 +48,32 @@ options:
         specific subset should not be collected.
     required: false
     version_added: 1.1.0
+  resource_cache:
+    description:
+      - When true, the network resource facts parsed from a device are saved
+        on the controller together with a fingerprint of its running-config.
+        Later runs reuse the saved facts of each subset for as long as the
+        running-config is unchanged instead of parsing them again.
+      - Facts that reflect the operational state of the device rather than
+        its configuration are also reused, so only enable this where the
+        configuration is what matters.
+    type: bool
+    required: false
+    default: false
+  resource_cache_dir:
+    description:
+      - The directory the resource facts are saved in.
+      - Defaults to C(awplus_resources) in the fact cache directory
+        (C(fact_caching_connection)) when C(fact_caching) is the C(jsonfile)
+        or C(yaml) plugin, otherwise to C(~/.ansible/awplus_resources).
+    type: path
+    required: false
+  resource_cache_key:
+    description:
+      - The name the resource facts of the device are saved under.
+      - Defaults to the inventory hostname.
+    type: str
+    required: false
 """
 
 EXAMPLES = """
@@ -73,6 +99,12 @@ EXAMPLES = """
   alliedtelesis.awplus.awplus_facts:
     gather_subset: min
     gather_network_resources: lag_interfaces
+
+- name: Only parse the resources again if the configuration has changed
+  alliedtelesis.awplus.awplus_facts:
+    gather_subset: min
+    gather_network_resources: all
+    resource_cache: true
 """
 
 RETURN = """
@@ -83,6 +115,7 @@ RETURN = """
 """
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import resource_connection
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.facts.facts import FactsArgs
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.facts import Facts
 
@@ -95,11 +128,13 @@ def main():
     """
 
     module = AnsibleModule(argument_spec=FactsArgs.argument_spec,
+                           required_if=[('resource_cache', True, ('resource_cache_dir', 'resource_cache_key'))],
                            supports_check_mode=True)
     warnings = ['default value for `gather_subset` '
                 'will be changed to `min` from `!config` v2.11 onwards']
 
-    result = Facts(module).get_facts()
+    with resource_connection(module):
+        result = Facts(module).get_facts()
 
     ansible_facts, additional_warnings = result
     warnings.extend(additional_warnings)
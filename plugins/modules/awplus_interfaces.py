@@ -422,6 +422,7 @@ commands:
 
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import resource_connection
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.interfaces.interfaces import InterfacesArgs
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.config.interfaces.interfaces import Interfaces
 
@@ -441,7 +442,8 @@ def main():
                            required_if=required_if,
                            supports_check_mode=True)
 
-    result = Interfaces(module).execute_module()
+    with resource_connection(module):
+        result = Interfaces(module).execute_module()
     module.exit_json(**result)
 
 
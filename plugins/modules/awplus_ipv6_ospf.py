@@ -70,6 +70,7 @@ from ansible_collections.alliedtelesis.awplus.plugins.module_utils.utils.complex
     get_commands,
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.awplus import (
+    add_perf_records,
     get_config,
     load_config,
     awplus_argument_spec,
@@ -144,6 +145,7 @@ def main():
             load_config(module, commands)
         result["changed"] = True
 
+    add_perf_records(module, result)
     module.exit_json(**result)
 
 
@@ -338,6 +338,7 @@ commands:
 
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import resource_connection
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.l2_interfaces.l2_interfaces import L2_interfacesArgs
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.config.l2_interfaces.l2_interfaces import L2_interfaces
 
@@ -351,7 +352,8 @@ def main():
     module = AnsibleModule(argument_spec=L2_interfacesArgs.argument_spec,
                            supports_check_mode=True)
 
-    result = L2_interfaces(module).execute_module()
+    with resource_connection(module):
+        result = L2_interfaces(module).execute_module()
     module.exit_json(**result)
 
 
@@ -344,6 +344,7 @@ commands:
 
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import resource_connection
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.l3_interfaces.l3_interfaces import L3_interfacesArgs
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.config.l3_interfaces.l3_interfaces import L3_interfaces
 
@@ -357,7 +358,8 @@ def main():
     module = AnsibleModule(argument_spec=L3_interfacesArgs.argument_spec,
                            supports_check_mode=True)
 
-    result = L3_interfaces(module).execute_module()
+    with resource_connection(module):
+        result = L3_interfaces(module).execute_module()
     module.exit_json(**result)
 
 
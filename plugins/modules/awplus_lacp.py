@@ -137,6 +137,7 @@ commands:
 
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import resource_connection
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.lacp.lacp import LacpArgs
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.config.lacp.lacp import Lacp
 
@@ -150,7 +151,8 @@ def main():
     module = AnsibleModule(argument_spec=LacpArgs.argument_spec,
                            supports_check_mode=True)
 
-    result = Lacp(module).execute_module()
+    with resource_connection(module):
+        result = Lacp(module).execute_module()
     module.exit_json(**result)
 
 
@@ -403,6 +403,7 @@ commands:
 
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import resource_connection
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.lacp_interfaces.lacp_interfaces import Lacp_interfacesArgs
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.config.lacp_interfaces.lacp_interfaces import Lacp_interfaces
 
@@ -422,7 +423,8 @@ def main():
                            required_if=required_if,
                            supports_check_mode=True)
 
-    result = Lacp_interfaces(module).execute_module()
+    with resource_connection(module):
+        result = Lacp_interfaces(module).execute_module()
     module.exit_json(**result)
 
 
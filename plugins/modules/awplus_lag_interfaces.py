@@ -338,6 +338,7 @@ commands:
 
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import resource_connection
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.lag_interfaces.lag_interfaces import Lag_interfacesArgs
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.config.lag_interfaces.lag_interfaces import Lag_interfaces
 
@@ -351,7 +352,8 @@ def main():
     module = AnsibleModule(argument_spec=Lag_interfacesArgs.argument_spec,
                            supports_check_mode=True)
 
-    result = Lag_interfaces(module).execute_module()
+    with resource_connection(module):
+        result = Lag_interfaces(module).execute_module()
     module.exit_json(**result)
 
 
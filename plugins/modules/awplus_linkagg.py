@@ -105,6 +105,7 @@ from copy import deepcopy
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import remove_default_spec
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.awplus import (
+    add_perf_records,
     get_config,
     load_config,
 )
@@ -333,6 +334,7 @@ def main():
             load_config(module, commands)
         result["changed"] = True
 
+    add_perf_records(module, result)
     module.exit_json(**result)
 
 
@@ -232,6 +232,7 @@ commands:
 
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import resource_connection
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.lldp_global.lldp_global import Lldp_globalArgs
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.config.lldp_global.lldp_global import Lldp_global
 
@@ -251,7 +252,8 @@ def main():
                            supports_check_mode=True,
                            required_if=required_if,)
 
-    result = Lldp_global(module).execute_module()
+    with resource_connection(module):
+        result = Lldp_global(module).execute_module()
     module.exit_json(**result)
 
 
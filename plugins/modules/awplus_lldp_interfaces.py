@@ -297,6 +297,7 @@ commands:
 
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import resource_connection
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.lldp_interfaces.lldp_interfaces import Lldp_interfacesArgs
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.config.lldp_interfaces.lldp_interfaces import Lldp_interfaces
 
@@ -310,7 +311,8 @@ def main():
     module = AnsibleModule(argument_spec=Lldp_interfacesArgs.argument_spec,
                            supports_check_mode=True)
 
-    result = Lldp_interfaces(module).execute_module()
+    with resource_connection(module):
+        result = Lldp_interfaces(module).execute_module()
     module.exit_json(**result)
 
 
@@ -211,6 +211,7 @@ commands:
 
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import resource_connection
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.logging.logging import LoggingArgs
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.config.logging.logging import Logging
 
@@ -230,7 +231,8 @@ def main():
                            required_if=required_if,
                            supports_check_mode=True)
 
-    result = Logging(module).execute_module()
+    with resource_connection(module):
+        result = Logging(module).execute_module()
     module.exit_json(**result)
 
 
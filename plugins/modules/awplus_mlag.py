@@ -232,6 +232,7 @@ commands:
 
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import resource_connection
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.mlag.mlag import MlagArgs
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.config.mlag.mlag import Mlag
 
@@ -245,7 +246,8 @@ def main():
     module = AnsibleModule(argument_spec=MlagArgs.argument_spec,
                            supports_check_mode=True)
 
-    result = Mlag(module).execute_module()
+    with resource_connection(module):
+        result = Mlag(module).execute_module()
     module.exit_json(**result)
 
 
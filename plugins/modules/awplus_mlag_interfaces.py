@@ -169,6 +169,7 @@ commands:
 
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import resource_connection
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.mlag_interfaces.mlag_interfaces import Mlag_interfacesArgs
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.config.mlag_interfaces.mlag_interfaces import Mlag_interfaces
 
@@ -182,7 +183,8 @@ def main():
     module = AnsibleModule(argument_spec=Mlag_interfacesArgs.argument_spec,
                            supports_check_mode=True)
 
-    result = Mlag_interfaces(module).execute_module()
+    with resource_connection(module):
+        result = Mlag_interfaces(module).execute_module()
     module.exit_json(**result)
 
 
@@ -201,6 +201,7 @@ commands:
 
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import resource_connection
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.ntp.ntp import NtpArgs
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.config.ntp.ntp import Ntp
 
@@ -220,7 +221,8 @@ def main():
                            required_if=required_if,
                            supports_check_mode=True)
 
-    result = Ntp(module).execute_module()
+    with resource_connection(module):
+        result = Ntp(module).execute_module()
     module.exit_json(**result)
 
 
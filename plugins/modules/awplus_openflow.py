@@ -425,6 +425,7 @@ commands:
 
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import resource_connection
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.openflow.openflow import OpenflowArgs
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.config.openflow.openflow import Openflow
 
@@ -438,7 +439,8 @@ def main():
     module = AnsibleModule(argument_spec=OpenflowArgs.argument_spec,
                            supports_check_mode=True)
 
-    result = Openflow(module).execute_module()
+    with resource_connection(module):
+        result = Openflow(module).execute_module()
     module.exit_json(**result)
 
 
@@ -380,6 +380,7 @@ from ansible_collections.alliedtelesis.awplus.plugins.module_utils.utils.complex
     get_param,
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.awplus import (
+    add_perf_records,
     get_config,
     load_config,
     awplus_argument_spec,
@@ -837,6 +838,7 @@ def main():
             load_config(module, commands)
         result["changed"] = True
 
+    add_perf_records(module, result)
     module.exit_json(**result)
 
 
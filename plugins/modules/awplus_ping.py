@@ -118,6 +118,7 @@ import re
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.awplus import (
+    add_perf_records,
     run_commands,
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.awplus import (
@@ -241,6 +242,7 @@ def main():
         results["rtt"] = rtt
 
     validate_results(module, float(loss), results)
+    add_perf_records(module, results)
     module.exit_json(**results)
 
 
@@ -264,6 +264,7 @@ commands:
 
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import resource_connection
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.policy_interfaces.policy_interfaces import Policy_interfacesArgs
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.config.policy_interfaces.policy_interfaces import Policy_interfaces
 
@@ -277,7 +278,8 @@ def main():
     module = AnsibleModule(argument_spec=Policy_interfacesArgs.argument_spec,
                            supports_check_mode=True)
 
-    result = Policy_interfaces(module).execute_module()
+    with resource_connection(module):
+        result = Policy_interfaces(module).execute_module()
     module.exit_json(**result)
 
 
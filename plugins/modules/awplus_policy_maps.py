@@ -436,6 +436,7 @@ commands:
 
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import resource_connection
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.policy_maps.policy_maps import Policy_mapsArgs
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.config.policy_maps.policy_maps import Policy_maps
 
@@ -449,7 +450,8 @@ def main():
     module = AnsibleModule(argument_spec=Policy_mapsArgs.argument_spec,
                            supports_check_mode=True)
 
-    result = Policy_maps(module).execute_module()
+    with resource_connection(module):
+        result = Policy_maps(module).execute_module()
     module.exit_json(**result)
 
 
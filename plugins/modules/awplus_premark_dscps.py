@@ -234,6 +234,7 @@ commands:
 
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import resource_connection
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.premark_dscps.premark_dscps import Premark_dscpsArgs
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.config.premark_dscps.premark_dscps import Premark_dscps
 
@@ -247,7 +248,8 @@ def main():
     module = AnsibleModule(argument_spec=Premark_dscpsArgs.argument_spec,
                            supports_check_mode=True)
 
-    result = Premark_dscps(module).execute_module()
+    with resource_connection(module):
+        result = Premark_dscps(module).execute_module()
     module.exit_json(**result)
 
 
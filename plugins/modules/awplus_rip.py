@@ -75,6 +75,7 @@ from ansible_collections.alliedtelesis.awplus.plugins.module_utils.awplus import
     awplus_argument_spec,
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.awplus import (
+    add_perf_records,
     get_config,
     load_config,
 )
@@ -258,6 +259,7 @@ def main():
             load_config(module, commands)
         result["changed"] = True
 
+    add_perf_records(module, result)
     module.exit_json(**result)
 
 
@@ -332,6 +332,7 @@ commands:
 
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import resource_connection
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.static_lag_interfaces.static_lag_interfaces import (
     Static_lag_interfacesArgs
 )
@@ -349,7 +350,8 @@ def main():
     module = AnsibleModule(argument_spec=Static_lag_interfacesArgs.argument_spec,
                            supports_check_mode=True)
 
-    result = Static_lag_interfaces(module).execute_module()
+    with resource_connection(module):
+        result = Static_lag_interfaces(module).execute_module()
     module.exit_json(**result)
 
 
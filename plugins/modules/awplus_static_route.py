@@ -255,6 +255,7 @@ commands:
 
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import resource_connection
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.static_route.static_route import Static_routeArgs
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.config.static_route.static_route import Static_route
 
@@ -268,7 +269,8 @@ def main():
     module = AnsibleModule(argument_spec=Static_routeArgs.argument_spec,
                            supports_check_mode=True)
 
-    result = Static_route(module).execute_module()
+    with resource_connection(module):
+        result = Static_route(module).execute_module()
     module.exit_json(**result)
 
 
@@ -101,6 +101,7 @@ import re
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.awplus import (
+    add_perf_records,
     get_config,
     load_config,
 )
@@ -286,6 +287,7 @@ def main():
             load_config(module, commands)
         result["changed"] = True
 
+    add_perf_records(module, result)
     module.exit_json(**result)
 
 
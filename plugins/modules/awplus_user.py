@@ -195,6 +195,7 @@ commands:
 
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import resource_connection
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.user.user import UserArgs
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.config.user.user import User
 
@@ -208,7 +209,8 @@ def main():
     module = AnsibleModule(argument_spec=UserArgs.argument_spec,
                            supports_check_mode=True)
 
-    result = User(module).execute_module()
+    with resource_connection(module):
+        result = User(module).execute_module()
     module.exit_json(**result)
 
 
@@ -268,6 +268,7 @@ commands:
 
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import resource_connection
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.vlans.vlans import VlansArgs
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.config.vlans.vlans import Vlans
 
@@ -287,7 +288,8 @@ def main():
                            required_if=required_if,
                            supports_check_mode=True)
 
-    result = Vlans(module).execute_module()
+    with resource_connection(module):
+        result = Vlans(module).execute_module()
     module.exit_json(**result)
 
 
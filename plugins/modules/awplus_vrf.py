@@ -226,6 +226,7 @@ from ansible_collections.alliedtelesis.awplus.plugins.module_utils.awplus import
     awplus_argument_spec,
 )
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.awplus import (
+    add_perf_records,
     load_config,
     get_config,
     get_connection,
@@ -387,8 +388,9 @@ def get_intf_info(module):
 
 
 def map_config_to_obj(module):
-    config = get_config(module)
-    intfobj = get_intf_info(module)
+    with get_connection(module):
+        config = get_config(module)
+        intfobj = get_intf_info(module)
 
     blocks = config.split("!")
     vrfs = []
@@ -578,6 +580,7 @@ def main():
 
     check_declarative_intent_params(want, module, result)
 
+    add_perf_records(module, result)
     module.exit_json(**result)
 
 
@@ -274,6 +274,7 @@ commands:
 
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import resource_connection
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.vrfs.vrfs import VrfsArgs
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.config.vrfs.vrfs import Vrfs
 
@@ -287,7 +288,8 @@ def main():
     module = AnsibleModule(argument_spec=VrfsArgs.argument_spec,
                            supports_check_mode=True)
 
-    result = Vrfs(module).execute_module()
+    with resource_connection(module):
+        result = Vrfs(module).execute_module()
     module.exit_json(**result)
 
 
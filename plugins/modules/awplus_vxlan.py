@@ -210,6 +210,7 @@ commands:
 
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import resource_connection
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.argspec.vxlan.vxlan import VxlanArgs
 from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.config.vxlan.vxlan import Vxlan
 
@@ -223,7 +224,8 @@ def main():
     module = AnsibleModule(argument_spec=VxlanArgs.argument_spec,
                            supports_check_mode=True)
 
-    result = Vxlan(module).execute_module()
+    with resource_connection(module):
+        result = Vxlan(module).execute_module()
     module.exit_json(**result)
 
 
@@ -35,28 +35,101 @@ from ansible.utils.display import Display
 display = Display()
 
 
+# The prompt is matched at the end of the response, and the error patterns
+# anywhere in it. Those marked True are matched regardless of case. Only
+# whether an error pattern matches matters, so none of them extend a match
+# beyond what decides it.
+PROMPT_PATTERNS = [
+    br"[\r\n]?[\w\+\-\.:\/\[\]]+(?:\([^\)]+\)){0,3}(?:[>#]) ?$",
+]
+ERROR_PATTERNS = [
+    (br"% ?Error", False),
+    # (br"^% \w+", False),
+    (br"% ?Bad secret", False),
+    (br"[\r\n%] Bad passwords", False),
+    (br"invalid input", True),
+    (br"(?:incomplete|ambiguous) command", True),
+    (br"connection timed out", True),
+    (br"[^\r\n] not found", False),
+    (br"'[^']' +returned error code: ?\d+", False),
+    (br"Bad mask", True),
+    (br"% ?(\S+) ?overlaps with ?(\S+)", True),
+    (br"[%\S] ?Error: ?\s", True),
+    (br"[%\S] ?Informational: ?\s", True),
+    (br"Command authorization failed", False),
+]
+
+
+class PromptMatcher(object):
+    """ Finds the prompt at the end of a response. The prompt can't span a
+    line break, so only the last line is searched rather than every
+    position of what may be a very long response.
+    """
+
+    def __init__(self, patterns):
+        self.pattern = b"|".join(patterns)
+        self._regex = re.compile(self.pattern)
+
+    def search(self, response):
+        return self._regex.search(response, max(response.rfind(b"\n", 0, len(response) - 1), 0))
+
+
+class ErrorMatcher(object):
+    """ Finds any of the error patterns in a response with one combined
+    pattern. Between resets the response only grows as it is received and
+    is searched again each time, so only what was added since the previous
+    search, from the line break before it, is searched again.
+    """
+
+    # network_cli with paramiko passes a window of the last 256 bytes
+    # received rather than the whole response, so buffers up to that size
+    # are always searched whole.
+    WINDOW = 256
+
+    def __init__(self, patterns):
+        self.pattern = b"|".join((b"(?i:%s)" if nocase else b"(?:%s)") % pattern for pattern, nocase in patterns)
+        self._regex = re.compile(self.pattern)
+        self.reset()
+
+    def reset(self):
+        """ Start on a new response """
+        self._searched = 0
+        self._match = None
+
+    def search(self, response):
+        size = len(response)
+        pos = 0
+        if self._searched and self.WINDOW < size and self._searched <= size:
+            if self._match is not None:
+                return self._match
+            pos = max(response.rfind(b"\n", 0, self._searched), 0)
+
+        self._match = self._regex.search(response, pos)
+        self._searched = size
+        return self._match
+
+
 class TerminalModule(TerminalBase):
 
-    terminal_stdout_re = [
-        re.compile(br"[\r\n]?[\w\+\-\.:\/\[\]]+(?:\([^\)]+\)){0,3}(?:[>#]) ?$")
-    ]
-
-    terminal_stderr_re = [
-        re.compile(br"% ?Error"),
-        # re.compile(br"^% \w+", re.M),
-        re.compile(br"% ?Bad secret"),
-        re.compile(br"[\r\n%] Bad passwords"),
-        re.compile(br"invalid input", re.I),
-        re.compile(br"(?:incomplete|ambiguous) command", re.I),
-        re.compile(br"connection timed out", re.I),
-        re.compile(br"[^\r\n]+ not found"),
-        re.compile(br"'[^']' +returned error code: ?\d+"),
-        re.compile(br"Bad mask", re.I),
-        re.compile(br"% ?(\S+) ?overlaps with ?(\S+)", re.I),
-        re.compile(br"[%\S] ?Error: ?[\s]+", re.I),
-        re.compile(br"[%\S] ?Informational: ?[\s]+", re.I),
-        re.compile(br"Command authorization failed"),
-    ]
+    terminal_stdout_re = [PromptMatcher(PROMPT_PATTERNS)]
+
+    def __init__(self, *args, **kwargs):
+        super(TerminalModule, self).__init__(*args, **kwargs)
+        self._terminal_stderr_re = [ErrorMatcher(ERROR_PATTERNS)]
+
+    @property
+    def terminal_stderr_re(self):
+        """ The error matchers, reset for a new response. network_cli reads
+        them once at the start of each receive.
+        """
+        for matcher in self._terminal_stderr_re:
+            if isinstance(matcher, ErrorMatcher):
+                matcher.reset()
+        return self._terminal_stderr_re
+
+    @terminal_stderr_re.setter
+    def terminal_stderr_re(self, value):
+        self._terminal_stderr_re = value
 
     def on_open_shell(self):
         try:
@@ -0,0 +1,111 @@
+"""
+Benchmark for computing the commands of the awplus_acl states.
+
+Diffs a synthetic hardware ACL with a thousand or more entries against a wanted
+ACL that keeps half of them and adds as many new ones. The baseline scans
+every existing ACL and ACE list for each wanted entry, as the merged and
+deleted states did before they indexed the existing ACLs by (afi, name) and
+their ACEs by a hashable key.
+
+Run from a directory where the collection is importable, e.g.
+    python tests/benchmark/bench_acl_diff.py [ace_count]
+"""
+import sys
+import timeit
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
+    utils,
+)
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.config.acl.acl import Acl
+
+
+class BenchModule(object):
+    params = {}
+
+    def fail_json(self, msg):
+        sys.exit(msg)
+
+
+def address(index):
+    return f"10.{index // 256 % 256}.{index % 256}.0/24"
+
+
+def synthetic_acls(count):
+    """ An existing ACL with count aces and a wanted one sharing half of them """
+    have = {'acls': [
+        {'afi': 'IPv4', 'name': f'filter{index}', 'type': 'Hardware', 'ace': []} for index in range(50)
+    ]}
+    have['acls'].append({'afi': 'IPv4', 'name': 'border', 'type': 'Hardware', 'ace': [
+        {'action': 'permit', 'protocols': 'tcp', 'source_addr': address(index),
+         'destination_addr': 'any', 'destination_port_protocol': [{'eq': 443}]}
+        for index in range(count)
+    ]})
+    aces = []
+    for ace_ID, index in enumerate(range(count // 2, count + count // 2), 1):
+        aces.append({'ace_ID': ace_ID * 4, 'action': 'permit', 'protocols': 'tcp', 'source_addr': address(index),
+                     'source_port_protocol': None, 'destination_addr': 'any',
+                     'destination_port_protocol': [{'eq': 443, 'gt': None, 'lt': None, 'ne': None, 'range': None}],
+                     'ICMP_type_number': None})
+    want = [{'afi': 'IPv4', 'acls': [{'name': 'border', 'acl_type': 'hardware', 'aces': aces}]}]
+    return want, have
+
+
+def baseline_merged(acl, want, have):
+    """ The merged ace diff as it was before the acls were indexed """
+    commands = []
+    for item in want:
+        for w_acl in item.get('acls'):
+            for h_acl in have.get('acls'):
+                if w_acl.get('name') == h_acl.get('name'):
+                    h_aces = h_acl.get('ace') if h_acl.get('ace') is not None else []
+                    for ace in w_acl.get('aces'):
+                        ace_dict = utils.remove_empties(dict(ace))
+                        ace_ID = ace_dict.pop('ace_ID')
+                        if ace_dict not in h_aces:
+                            commands.append(f"{ace_ID} {acl.generate_ace_commands(ace, 'hardware')}")
+    return commands
+
+
+def baseline_deleted(acl, want, have):
+    """ The deleted ace diff as it was before the acls were indexed """
+    commands = []
+    for item in want:
+        for w_acl in item.get('acls'):
+            for h_acl in have.get('acls'):
+                if w_acl.get('name') == h_acl.get('name'):
+                    for w_ace in w_acl.get('aces'):
+                        for h_ace in h_acl.get('ace'):
+                            w_ace = utils.remove_empties(w_ace)
+                            w_ace.pop('ace_ID', None)
+                            if h_ace == w_ace:
+                                commands.append(f"no {acl.generate_ace_commands(w_ace, 'hardware')}")
+    return commands
+
+
+def current_merged(acl, want, have):
+    return acl._state_merged(want, have)[1:]
+
+
+def current_deleted(acl, want, have):
+    # the deleted state removes whole hardware acls, so diff it as extended
+    want = [dict(item, acls=[dict(w_acl, acl_type='extended') for w_acl in item['acls']]) for item in want]
+    return acl._state_deleted(want, have)[1:]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    want, have = synthetic_acls(count)
+    acl = Acl.__new__(Acl)
+    acl._module = BenchModule()
+
+    for state, baseline, current in (('merged', baseline_merged, current_merged),
+                                     ('deleted', baseline_deleted, current_deleted)):
+        if baseline(acl, want, have) != current(acl, want, have):
+            sys.exit(f"{state} commands differ from the baseline")
+        for name, func in (('baseline', baseline), ('current', current)):
+            best = min(timeit.repeat(lambda: func(acl, want, have), number=1, repeat=3))
+            print(f"{state:8} {name:10} {count} aces: {best * 1000:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark for building resource facts from device output.
+
+Compares the vlans facts of a switch with 4000 vlans built the old way
+(deepcopy of the generated spec for every line, netcommon's remove_empties
+and validate_config over the whole list) against VlansFacts, which uses a
+precompiled record factory and skips validating records it parsed itself.
+
+Run from a directory where the collection is importable, e.g.
+    python tests/benchmark/bench_fact_records.py [vlan_count]
+"""
+import re
+import sys
+import timeit
+from copy import deepcopy
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
+    utils,
+)
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.vlans.vlans import VlansFacts
+from ansible_collections.alliedtelesis.awplus.tests.unit.utils import set_module_args
+
+HEADER = (
+    "VLAN ID  Name            Type    State   Member ports\n"
+    "                                         (u)-Untagged, (t)-Tagged\n"
+    "======= ================ ======= ======= ====================================\n"
+)
+
+
+def show_vlan_all(count):
+    lines = [f"{vlan_id:<8} vlan{vlan_id:<12} STATIC  ACTIVE  port1.0.{vlan_id % 48 + 1}(t)" for vlan_id in range(1, count + 1)]
+    return HEADER + '\n'.join(lines)
+
+
+def baseline_vlans(facts, data):
+    """ The vlans fact parsing as it was before the record factory. """
+    objs = []
+    for resource in data.split('\n'):
+        if resource:
+            config = deepcopy(facts.generated_spec)
+            match = re.compile(r'^(?P<vlan_id>\d+)\s+(?P<name>\S+)\s+\S+\s+(?P<state>\S+).*').match(resource)
+            if match:
+                config['vlan_id'] = match.group('vlan_id')
+                config['name'] = match.group('name')
+                config['state'] = match.group('state').lower()
+            obj = utils.remove_empties(config)
+            if obj:
+                objs.append(obj)
+    params = utils.validate_config(facts.argument_spec, {'config': objs})
+    return [utils.remove_empties(cfg) for cfg in params['config']]
+
+
+def current_vlans(facts, data):
+    ansible_facts = {'ansible_network_resources': {}}
+    facts.populate_facts(None, ansible_facts, data)
+    return ansible_facts['ansible_network_resources']['vlans']
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+    data = show_vlan_all(count)
+    # validate_config needs the module argument context a module run has.
+    set_module_args({})
+    facts = VlansFacts(None)
+
+    if baseline_vlans(facts, data) != current_vlans(facts, data):
+        sys.exit("vlans facts differ from the baseline")
+
+    for name, func in (('baseline', baseline_vlans), ('current', current_vlans)):
+        best = min(timeit.repeat(lambda: func(facts, data), number=1, repeat=5))
+        print(f"{name:10} {count} vlans: {best * 1000:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+"""
+Benchmark of the awplus resource modules against a simulated switch.
+
+Runs awplus_facts for every resource, each state of the interfaces,
+l2_interfaces, vlans and acl modules, and a merged run of every other
+resource module, against a SimulatedSwitch at each scale point. For every
+run it reports the device round-trips, the bytes of show output read, the
+configuration lines sent, and the CPU and wall time the module took.
+
+Only the four modules run in every state read device output that grows
+with the scale point; they are where the time goes on a large switch. The
+merged runs size their arguments to the switch's ports, LAGs and vlans,
+but the show output of resources the simulator doesn't generate comes
+from the unit test fixtures and stays the same size, so those rows
+measure the per-item cost of building the commands more than parsing.
+
+Run from a directory where the collection is importable, e.g.
+    python tests/benchmark/bench_modules.py [--scale large] [--latency 5]
+        [--config-batch-size 20] [awplus_vlans ...]
+The latency is the simulated time in milliseconds the switch takes to
+answer each round-trip; with the default of 0 the wall time is all parsing
+and diffing. The config batch size is that of the cliconf
+config_batch_size option, the number of configuration lines written to
+the switch in one round-trip.
+"""
+import argparse
+import importlib
+import sys
+import time
+from unittest.mock import patch
+
+from ansible.module_utils import basic
+from ansible_collections.alliedtelesis.awplus.tests.benchmark.simulator import (
+    ACL_NAME,
+    PORTS_PER_LAG,
+    POLICY_MAP_NAME,
+    SimulatedSwitch,
+    ace_address,
+)
+from ansible_collections.alliedtelesis.awplus.tests.unit.utils import (
+    AnsibleExitJson,
+    AnsibleFailJson,
+    exit_json,
+    fail_json,
+    set_module_args,
+)
+
+# ports, vlans and ACL entries of each scale point
+SCALES = dict(
+    small=(48, 64, 100),
+    medium=(384, 1024, 1000),
+    large=(1000, 4094, 5000),
+)
+
+RESOURCE_CONNECTIONS = (
+    'ansible_collections.ansible.netcommon.plugins.module_utils.network.common.cfg.base.get_resource_connection',
+    'ansible_collections.ansible.netcommon.plugins.module_utils.network.common.facts.facts.get_resource_connection',
+    'ansible_collections.alliedtelesis.awplus.plugins.module_utils.awplus.get_module_connection',
+)
+
+
+def facts_args(switch):
+    return dict(gather_subset=['min'], gather_network_resources=['all'])
+
+
+def interfaces_args(switch):
+    return dict(config=[dict(name=name, description=f"changed {name}") for name in switch.ports])
+
+
+def l2_interfaces_args(switch):
+    return dict(config=[dict(name=name, access=dict(vlan=switch.port_vlan(index + 1)))
+                        for index, name in enumerate(switch.ports)])
+
+
+def vlans_args(switch):
+    return dict(config=[dict(vlan_id=vlan_id, name=f"renamed{vlan_id}") for vlan_id in range(2, switch.vlans + 1)])
+
+
+def acl_args(switch):
+    aces = [dict(ace_ID=(index + 1) * 4, action='permit', protocols='ip', source_addr=ace_address(index),
+                 destination_addr='any')
+            for index in range(switch.aces // 2, switch.aces + switch.aces // 2)]
+    return dict(config=[dict(afi='IPv4', acls=[dict(name=ACL_NAME, acl_type='hardware', aces=aces)])])
+
+
+def vlan_address(vlan_id):
+    return f"10.{vlan_id // 256}.{vlan_id % 256}.1/24"
+
+
+def lag_members(switch):
+    """ The ports of each LAG of the switch, PORTS_PER_LAG to a LAG """
+    return [(name[2:], switch.ports[index * PORTS_PER_LAG:(index + 1) * PORTS_PER_LAG]) for index, name in enumerate(switch.lags)]
+
+
+# The arguments of a merged run of each of the other resource modules, sized
+# to the switch where the module takes a list of ports or vlans.
+MERGED_ARGS = dict(
+    awplus_acl_interfaces=lambda switch: dict(config=[dict(name=name, acl_names=[ACL_NAME]) for name in switch.ports]),
+    awplus_banner=lambda switch: dict(config=[dict(banner='motd', text='bench banner')]),
+    awplus_bgp=lambda switch: dict(config=dict(bgp_as=100, router_id='192.0.2.2')),
+    awplus_class_maps=lambda switch: dict(config=[dict(name=f"bench{vlan_id}", dscp=vlan_id % 64, vlan=vlan_id)
+                                                  for vlan_id in range(2, switch.vlans + 1)]),
+    awplus_l3_interfaces=lambda switch: dict(config=[dict(name=f"vlan{vlan_id}", ipv4=[dict(address=vlan_address(vlan_id))])
+                                                     for vlan_id in range(2, switch.vlans + 1)]),
+    awplus_lacp=lambda switch: dict(config=dict(system=dict(priority=50))),
+    awplus_lacp_interfaces=lambda switch: dict(config=[dict(name=name, port_priority=2, timeout='short')
+                                                       for name in switch.ports]),
+    awplus_lag_interfaces=lambda switch: dict(config=[dict(name=lag_id, members=[dict(member=name, mode='active') for name in members])
+                                                      for lag_id, members in lag_members(switch)]),
+    awplus_lldp_global=lambda switch: dict(config=dict(holdtime_multiplier=6, timer=36)),
+    awplus_lldp_interfaces=lambda switch: dict(config=[dict(name=name, receive=True, tlv_select=dict(protocol_ids=True))
+                                                       for name in switch.ports]),
+    awplus_logging=lambda switch: dict(config=[dict(dest='console', facility='cron')]),
+    awplus_mlag=lambda switch: dict(config=dict(domains=[dict(domain_id=10, peer_link=switch.ports[-1], peer_address='1.1.1.1',
+                                                              source_address='1.1.1.2')])),
+    awplus_mlag_interfaces=lambda switch: dict(config=[dict(name=name, domain_id=10) for name in switch.lags]),
+    awplus_ntp=lambda switch: dict(config=dict(server=['10.75.33.6'])),
+    awplus_openflow=lambda switch: dict(config=dict(controllers=[dict(name='bench', protocol='tcp', address='192.0.2.8', l4_port=6653)],
+                                                    ports=switch.ports[:len(switch.ports) // 2])),
+    awplus_policy_maps=lambda switch: dict(config=[dict(name=POLICY_MAP_NAME, description='bench policy')]),
+    awplus_policy_interfaces=lambda switch: dict(config=[dict(int_name=name, policy_name=POLICY_MAP_NAME) for name in switch.ports]),
+    awplus_premark_dscps=lambda switch: dict(config=[dict(dscp_in=dscp, dscp_new=63 - dscp) for dscp in range(64)]),
+    awplus_static_lag_interfaces=lambda switch: dict(config=[{'name': lag_id, 'members': members, 'member-filters': True}
+                                                             for lag_id, members in lag_members(switch)]),
+    awplus_static_route=lambda switch: dict(config=[dict(afi='IPv4', address=vlan_address(vlan_id).replace('.1/', '.0/').replace('10.', '172.', 1),
+                                                         next_hop='192.168.1.254')
+                                                    for vlan_id in range(2, switch.vlans + 1)]),
+    awplus_user=lambda switch: dict(config=[dict(name='bench', privilege=8, hashed_password='$1$PObJROou$Zm2Gl325pWzbym0ngEAWf1')]),
+    awplus_vrfs=lambda switch: dict(config=[dict(name=f"bench{index}", id=str(index)) for index in range(1, 9)]),
+    awplus_vxlan=lambda switch: dict(config=dict(l2_vnis=[dict(vlan=vlan_id, vni=10000 + vlan_id) for vlan_id in range(2, switch.vlans + 1)])),
+)
+
+STATES = ('merged', 'replaced', 'overridden', 'deleted')
+SCENARIOS = [('awplus_facts', None, facts_args)] + [
+    (module, state, args)
+    for module, args in (('awplus_interfaces', interfaces_args),
+                         ('awplus_l2_interfaces', l2_interfaces_args),
+                         ('awplus_vlans', vlans_args),
+                         ('awplus_acl', acl_args))
+    for state in STATES
+] + [(module, 'merged', args) for module, args in sorted(MERGED_ARGS.items())]
+
+
+def import_module(module_name):
+    return importlib.import_module(f'ansible_collections.alliedtelesis.awplus.plugins.modules.{module_name}')
+
+
+def run_module(module_name, args, switch):
+    """ Run a module against the switch
+
+    :returns: the module result
+    """
+    module = import_module(module_name)
+    set_module_args(args)
+    patches = [patch(target, return_value=switch) for target in RESOURCE_CONNECTIONS]
+    patches.append(patch.multiple(basic.AnsibleModule, exit_json=exit_json, fail_json=fail_json))
+    for item in patches:
+        item.start()
+    try:
+        module.main()
+    except (AnsibleExitJson, AnsibleFailJson) as exc:
+        return exc.args[0]
+    finally:
+        for item in reversed(patches):
+            item.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--scale', action='append', choices=sorted(SCALES))
+    parser.add_argument('--latency', type=float, default=0.0, help='milliseconds per round-trip')
+    parser.add_argument('--config-batch-size', type=int, default=1, help='configuration lines per round-trip')
+    parser.add_argument('modules', nargs='*', help='only run these modules')
+    options = parser.parse_args()
+    # imported up front so that the first run of each module isn't charged for it
+    for module_name, state, build_args in SCENARIOS:
+        import_module(module_name)
+
+    print(f"{'module':28} {'state':10} {'scale':7} {'trips':>6} {'read kB':>9} {'sent':>6} {'cpu ms':>9} {'wall ms':>9}")
+    failed = False
+    for scale in options.scale or ['small', 'medium', 'large']:
+        ports, vlans, aces = SCALES[scale]
+        switch = SimulatedSwitch(ports, vlans, aces, latency=options.latency / 1000,
+                                 config_batch_size=options.config_batch_size)
+        for module_name, state, build_args in SCENARIOS:
+            if options.modules and module_name not in options.modules:
+                continue
+            args = build_args(switch)
+            if state:
+                args['state'] = state
+            switch.reset_stats()
+            cpu = time.process_time()
+            wall = time.perf_counter()
+            result = run_module(module_name, args, switch)
+            cpu = time.process_time() - cpu
+            wall = time.perf_counter() - wall
+            if result.get('failed'):
+                failed = True
+                print(f"{module_name} {state} failed: {result.get('msg')}", file=sys.stderr)
+            print(f"{module_name:28} {state or '-':10} {scale:7} {switch.round_trips:6} {switch.bytes_received / 1024:9.1f} "
+                  f"{switch.lines_sent:6} {cpu * 1000:9.1f} {wall * 1000:9.1f}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
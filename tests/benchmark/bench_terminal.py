@@ -0,0 +1,118 @@
+"""
+Benchmark for the prompt and error detection of the awplus terminal plugin.
+
+network_cli searches the whole response received so far for the prompt
+and for errors every time more of it arrives. With the error patterns
+tried one by one over the whole response, and the end anchored prompt
+pattern tried from every position, each check costs time in proportion
+to the output received so far. The terminal plugin's matchers search the
+last line for the prompt and only the newly received lines for errors,
+so each check costs about the same however large the output has grown.
+
+Simulates receiving a show running-config of each size in chunks, running
+both checks after every chunk as network_cli does, after checking that
+both ways find the same errors and prompts.
+
+Run from a directory where the collection is importable, e.g.
+    python tests/benchmark/bench_terminal.py [megabytes ...]
+"""
+import re
+import sys
+import time
+
+from ansible_collections.alliedtelesis.awplus.plugins.terminal.awplus import (
+    ERROR_PATTERNS,
+    PROMPT_PATTERNS,
+    ErrorMatcher,
+    PromptMatcher,
+)
+
+CHUNK = 65536
+# The plugin's patterns before they were combined, tried one by one
+BASELINE_STDOUT_RE = [
+    re.compile(br"[\r\n]?[\w\+\-\.:\/\[\]]+(?:\([^\)]+\)){0,3}(?:[>#]) ?$")
+]
+BASELINE_STDERR_RE = [
+    re.compile(br"% ?Error"),
+    re.compile(br"% ?Bad secret"),
+    re.compile(br"[\r\n%] Bad passwords"),
+    re.compile(br"invalid input", re.I),
+    re.compile(br"(?:incomplete|ambiguous) command", re.I),
+    re.compile(br"connection timed out", re.I),
+    re.compile(br"[^\r\n]+ not found"),
+    re.compile(br"'[^']' +returned error code: ?\d+"),
+    re.compile(br"Bad mask", re.I),
+    re.compile(br"% ?(\S+) ?overlaps with ?(\S+)", re.I),
+    re.compile(br"[%\S] ?Error: ?[\s]+", re.I),
+    re.compile(br"[%\S] ?Informational: ?[\s]+", re.I),
+    re.compile(br"Command authorization failed"),
+]
+# The baseline grows with the square of the output, so it is only run up to this size
+BASELINE_MAX_MB = 1
+
+
+def show_output(size):
+    lines = [b"show running-config"]
+    index = 0
+    while sum(len(line) + 1 for line in lines) < size:
+        lines += [b"interface port1.0.%d" % index, b" description uplink to the distribution layer %d" % index,
+                  b" switchport", b" switchport mode trunk", b" switchport trunk allowed vlan add 2-4094", b"!"]
+        index += 1
+    return b"\n".join(lines) + b"\nawplus#"
+
+
+def find(regexes, response):
+    for regex in regexes:
+        if regex.search(response):
+            return True
+    return False
+
+
+def receive(stdout_re, stderr_re, output):
+    """ Receive output a chunk at a time, checking it as network_cli does """
+    for regex in stderr_re:
+        if hasattr(regex, 'reset'):
+            regex.reset()
+    resp = b""
+    errored = prompted = False
+    for offset in range(0, len(output), CHUNK):
+        resp += output[offset:offset + CHUNK]
+        errored = find(stderr_re, resp) or errored
+        prompted = find(stdout_re, resp)
+    return errored, prompted
+
+
+def check(matchers):
+    """ Check the matchers find what the baseline finds """
+    output = show_output(200000)
+    samples = [output]
+    for error in (b"% Invalid input detected at '^' marker.", b"% Error: the VLAN does not exist",
+                  b"Informational: \n", b"command not found", b"% 10.0.0.0/8 overlaps with 10.1.0.0/16"):
+        for position in (20, CHUNK - 10, len(output) // 2, len(output) - 200):
+            line_end = output.index(b"\n", position)
+            samples.append(output[:line_end] + b"\n" + error + output[line_end:])
+    for sample in samples:
+        if receive(BASELINE_STDOUT_RE, BASELINE_STDERR_RE, sample) != receive(*matchers, sample):
+            sys.exit("detection differs from the baseline")
+
+
+def main():
+    sizes = [float(arg) for arg in sys.argv[1:]] or [0.5, 1, 2, 4]
+    current = ([PromptMatcher(PROMPT_PATTERNS)], [ErrorMatcher(ERROR_PATTERNS)])
+    check(current)
+
+    for size in sizes:
+        output = show_output(int(size * 1024 * 1024))
+        chunks = (len(output) + CHUNK - 1) // CHUNK
+        runs = [('current', current)]
+        if size <= BASELINE_MAX_MB:
+            runs.insert(0, ('baseline', (BASELINE_STDOUT_RE, BASELINE_STDERR_RE)))
+        for name, (stdout_re, stderr_re) in runs:
+            start = time.perf_counter()
+            receive(stdout_re, stderr_re, output)
+            elapsed = time.perf_counter() - start
+            print(f"{name:10} {size:5.1f} MB: {elapsed * 1000:9.1f} ms, {elapsed * 1e6 / chunks:8.1f} us per check")
+
+
+if __name__ == '__main__':
+    main()
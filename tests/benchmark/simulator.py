@@ -0,0 +1,298 @@
+"""
+A simulated AW+ switch for the benchmarks.
+
+SimulatedSwitch stands in for the persistent connection a module talks to
+(the cliconf RPCs get, get_config, run_commands, edit_config and
+get_capabilities). It answers show commands with output generated for a
+switch of the requested size (the running-config, interfaces, LAGs, vlans,
+the hardware ACL, the QoS interfaces and the premark-dscp map), falls back
+to the canned unit test fixtures named after the command
+(awplus_facts_show_system for "show system"), and counts every round-trip
+and byte it serves.
+
+A per-command latency can be set to model the time a real switch takes to
+answer, either one value for every command or by command prefix. It is
+charged on every round-trip, including those edit_config makes, which are
+counted the way the awplus cliconf plugin sends configuration: configure
+terminal, then the lines one to a trip or config_batch_size to a trip, then
+end.
+"""
+import json
+import os
+import re
+import time
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), '..', 'unit', 'modules', 'fixtures')
+PORTS_PER_MEMBER = 48
+PORTS_PER_LAG = 8
+ACL_NAME = 'bench_hw'
+POLICY_MAP_NAME = 'bench_policy'
+RUNNING_CONFIG_FILTER_RE = re.compile(r'show running-config \|\s*(include|grep|begin)\s+(.+)$')
+
+VLAN_HEADER = (
+    "VLAN ID  Name            Type    State   Member ports\n"
+    "                                         (u)-Untagged, (t)-Tagged\n"
+    "======= ================ ======= ======= ====================================\n"
+)
+
+
+def port_names(count):
+    """ The names of count switch ports, filling each stack member in turn """
+    return [f"port{index // PORTS_PER_MEMBER + 1}.0.{index % PORTS_PER_MEMBER + 1}" for index in range(count)]
+
+
+def ace_address(index):
+    return f"10.{index // 256 % 256}.{index % 256}.0/24"
+
+
+class SimulatedSwitch(object):
+    """ A switch with ports switchports in LAGs of PORTS_PER_LAG, vlans vlans
+    and an ACL of aces entries
+    """
+
+    def __init__(self, ports=48, vlans=64, aces=100, latency=0.0, config_batch_size=1):
+        self.ports = port_names(ports)
+        self.lags = [f"po{lag_id}" for lag_id in range(1, max(ports // PORTS_PER_LAG, 1) + 1)]
+        self.vlans = vlans
+        self.aces = aces
+        if isinstance(latency, dict):
+            self.latency = sorted(latency.items(), key=lambda item: -len(item[0]))
+        else:
+            self.latency = [('', latency)]
+        self.config_batch_size = config_batch_size
+        self._outputs = {}
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.round_trips = 0
+        self.bytes_received = 0
+        self.lines_sent = 0
+
+    # The device output
+
+    def port_vlan(self, index):
+        return index % (self.vlans - 1) + 2 if self.vlans > 1 else 1
+
+    def interface_config(self):
+        blocks = []
+        for index, name in enumerate(self.ports):
+            lines = [f"interface {name}", f" description bench port {index}", " switchport"]
+            if index % 2:
+                lines += [" switchport mode trunk", f" switchport trunk allowed vlan add {self.port_vlan(index)}"]
+            else:
+                lines += [" switchport mode access", f" switchport access vlan {self.port_vlan(index)}"]
+            blocks.append('\n'.join(lines) + '\n!')
+        for name in self.lags:
+            blocks.append(f"interface {name}\n switchport\n switchport mode access\n!")
+        blocks.append("interface vlan1\n ip address 192.168.1.1/24\n!")
+        return '\n'.join(blocks)
+
+    def acl_config(self):
+        lines = [f"access-list hardware {ACL_NAME}"]
+        lines += [f" permit ip {ace_address(index)} any" for index in range(self.aces)]
+        return '\n'.join(lines) + '\n!'
+
+    def running_config(self):
+        vlan_range = f"2-{self.vlans}" if self.vlans > 2 else "2"
+        return '\n'.join([
+            "!",
+            "service password-encryption",
+            "!",
+            "hostname bench",
+            "!",
+            "username manager privilege 15 password 8 $1$bJoVec4D$JwOJGPr7YqoExA0GVasdE0",
+            "!",
+            "log host 192.168.1.10",
+            "!",
+            "ntp server 192.168.1.10",
+            "!",
+            "lldp run",
+            "!",
+            self.acl_config(),
+            "vlan database",
+            f" vlan {vlan_range} state enable",
+            "!",
+            self.interface_config(),
+            "ip route 0.0.0.0/0 192.168.1.254",
+            "!",
+            "line con 0",
+            "line vty 0 4",
+            "!",
+            "end",
+        ])
+
+    def show_interface_brief(self):
+        lines = ["Interface             Status          Protocol"]
+        lines += [f"{name:<22}admin up        running" for name in self.ports + self.lags]
+        lines.append(f"{'vlan1':<22}admin up        running")
+        return '\n'.join(lines)
+
+    def show_vlan(self):
+        lines = [f"{1:<8} {'default':<16} STATIC  ACTIVE  {self.ports[0]}(u)"]
+        lines += [f"{vlan_id:<8} {'vlan' + str(vlan_id):<16} STATIC  ACTIVE" for vlan_id in range(2, self.vlans + 1)]
+        return VLAN_HEADER + '\n'.join(lines)
+
+    def show_access_list(self):
+        lines = [f"Hardware IP access list {ACL_NAME}"]
+        lines += [f"   {(index + 1) * 4} permit ip {ace_address(index)} any" for index in range(self.aces)]
+        return '\n'.join(lines)
+
+    def show_premark_dscp(self):
+        blocks = ["PREMARK-DSCP-MAP:"]
+        for dscp in range(64):
+            blocks.append('\n'.join([
+                f"    DSCP {dscp}",
+                "    --------------------------------",
+                f"    New DSCP               {dscp:<9}",
+                f"    New CoS                {0:<9}",
+                f"    New Bandwidth Class    {'green':<9}",
+            ]))
+        return '\n\n'.join(blocks) + '\n'
+
+    def show_qos_interface(self):
+        blocks = []
+        for name in self.ports:
+            blocks.append('\n'.join([
+                f"Interface: {name}",
+                "",
+                "  Number of egress queues: 8",
+                "  Trust Mode: Ports default priority",
+                "  Egress Traffic Shaping Overhead: 0",
+            ]))
+        return '\n\n'.join(blocks) + '\n'
+
+    def show_policy_map(self):
+        return '\n'.join([
+            f"POLICY-MAP-NAME: {POLICY_MAP_NAME}",
+            "    Interfaces:",
+            "    Default class-map action: permit",
+            "",
+            "    CLASS-MAP-NAME: default",
+            "",
+        ])
+
+    def sections(self, keyword):
+        blocks = []
+        for block in self.running_config().split('!\n'):
+            if block.startswith(keyword):
+                blocks.append(block + '!')
+        return '\n'.join(blocks)
+
+    def output(self, command):
+        """ The output of a show command, generated once per command """
+        command = ' '.join(command.split())
+        if command not in self._outputs:
+            self._outputs[command] = self._generate(command)
+        return self._outputs[command]
+
+    def _generate(self, command):
+        generated = {
+            'show running-config': self.running_config,
+            'show interface brief': self.show_interface_brief,
+            'show vlan all': self.show_vlan,
+            'show vlan brief': self.show_vlan,
+            'show access-list': self.show_access_list,
+            'show mls qos maps premark-dscp': self.show_premark_dscp,
+            'show mls qos interface': self.show_qos_interface,
+            'show policy-map': self.show_policy_map,
+            'show class-map': lambda: "    CLASS-MAP-NAME: default\n",
+            'show lacp sys-id': lambda: "% System Priority: 0x8000 (32768)\n% MAC Address: 0000.cd37.0000",
+        }
+        if command in generated:
+            return generated[command]()
+
+        if command == 'show running-config interface':
+            return self.sections('interface ')
+        if command == 'show running-config lldp':
+            return self.sections('lldp ')
+        match = RUNNING_CONFIG_FILTER_RE.match(command)
+        if match:
+            pattern = re.compile(match.group(2).strip())
+            lines = self.running_config().splitlines()
+            if match.group(1) == 'begin':
+                for index, line in enumerate(lines):
+                    if pattern.search(line):
+                        return '\n'.join(lines[index:])
+                return ''
+            return '\n'.join(line for line in lines if pattern.search(line))
+
+        fixture = os.path.join(FIXTURE_PATH, 'awplus_facts_' + command.replace(' ', '_'))
+        if os.path.exists(fixture):
+            with open(fixture) as fixture_file:
+                return fixture_file.read()
+        return ''
+
+    def _round_trip(self, command):
+        """ Count a round-trip to the switch and wait the latency of command """
+        for prefix, latency in self.latency:
+            if command.startswith(prefix):
+                if latency:
+                    time.sleep(latency)
+                break
+        self.round_trips += 1
+
+    def _respond(self, command):
+        self._round_trip(command)
+        out = self.output(command)
+        self.bytes_received += len(out)
+        return out
+
+    def _send_config_batch(self, commands):
+        """ A batch of two or more lines is written in one round-trip """
+        if len(commands) < 2:
+            for command in commands:
+                self._round_trip(command)
+        else:
+            self._round_trip(commands[0])
+
+    # The connection RPCs
+
+    def get(self, command=None, **kwargs):
+        return self._respond(command)
+
+    def get_config(self, source='running', flags=None, format=None):
+        command = f"show {source}-config {' '.join(flags or [])}".strip()
+        return self._respond(command)
+
+    def run_commands(self, commands=None, check_rc=True):
+        responses = []
+        for command in commands:
+            if isinstance(command, dict):
+                command = command['command']
+            responses.append(self._respond(command))
+        return responses
+
+    def edit_config(self, candidate=None, commit=True, replace=None, comment=None):
+        lines = []
+        for line in candidate:
+            if not isinstance(line, dict):
+                line = {'command': line}
+            if line['command'] != 'end' and not line['command'].startswith('!'):
+                lines.append(line)
+
+        self._round_trip('configure terminal')
+        batch = []
+        for line in lines:
+            # lines that answer a prompt are sent on their own
+            if len(line) > 1:
+                self._send_config_batch(batch)
+                batch = []
+                self._round_trip(line['command'])
+                continue
+            batch.append(line['command'])
+            if len(batch) == self.config_batch_size:
+                self._send_config_batch(batch)
+                batch = []
+        self._send_config_batch(batch)
+        self._round_trip('end')
+
+        requests = [line['command'] for line in lines]
+        self.lines_sent += len(requests)
+        return {'request': requests, 'response': [''] * len(requests)}
+
+    def get_capabilities(self):
+        return json.dumps({
+            'network_api': 'cliconf',
+            'rpc': ['get_config', 'edit_config', 'get', 'run_commands', 'get_diff'],
+            'device_info': {'network_os': 'awplus', 'network_os_hostname': 'bench'},
+        })
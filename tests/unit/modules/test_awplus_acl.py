@@ -776,7 +776,7 @@ class TestACLModule(TestAwplusModule):
         )
         commands = [
             "access-list extended test", "no deny tcp 192.143.87.0/24 lt 1 192.142.50.0/24 eq 50",
-            "no deny icmp 196.143.87.0/24 196.142.50.0/24 icmp-type 8", "deny tcp 170.42.45.0/24 lt 9 any gt 9"
+            "no deny icmp 196.143.87.0/24 196.142.50.0/24 icmp-type 8", "4 deny tcp 170.42.45.0/24 lt 9 any gt 9"
         ]
         self.execute_module(changed=True, commands=commands)
 
@@ -846,7 +846,7 @@ class TestACLModule(TestAwplusModule):
         commands = [
             "access-list 2001", "no deny ip 170.42.45.0 0.0.0.255 any",
             "no permit ip 141.143.42.0 0.0.0.255 any", "no permit ip 181.185.85.0 0.0.0.255 any",
-            "permit ip 192.182.99.0 0.0.0.255 any", "access-list 72", "deny 180.152.66.0 0.0.0.255"
+            "4 permit ip 192.182.99.0 0.0.0.255 any", "access-list 72", "deny 180.152.66.0 0.0.0.255"
         ]
         self.execute_module(changed=True, commands=commands)
 
@@ -895,12 +895,55 @@ class TestACLModule(TestAwplusModule):
         )
         commands = [
             "access-list 2001", "no deny ip 170.42.45.0 0.0.0.255 any", "no permit ip 141.143.42.0 0.0.0.255 any",
-            "no permit ip 181.185.85.0 0.0.0.255 any", "permit ip 192.182.99.0 0.0.0.255 any",
+            "no permit ip 181.185.85.0 0.0.0.255 any", "4 permit ip 192.182.99.0 0.0.0.255 any",
             "ipv6 access-list extended ipv6_test", "no deny icmp 2001:db8::/64 2001:db8::f/64",
             "deny icmp 2090:db8::/64 2001:db8::f/64"
         ]
         self.execute_module(changed=True, commands=commands)
 
+    def test_awplus_acl_replace_keeps_unchanged_aces(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        afi="IPv4",
+                        acls=[
+                            dict(
+                                name="2001",
+                                acl_type="extended",
+                                aces=[
+                                    dict(
+                                        source_addr="141.143.42.0 0.0.0.255",
+                                        destination_addr="any",
+                                        action="permit",
+                                        protocols="ip",
+                                        ace_ID=8
+                                    ),
+                                    dict(
+                                        source_addr="181.185.85.0 0.0.0.255",
+                                        destination_addr="any",
+                                        action="permit",
+                                        protocols="ip",
+                                        ace_ID=12
+                                    ),
+                                    dict(
+                                        source_addr="10.1.1.0 0.0.0.255",
+                                        destination_addr="any",
+                                        action="deny",
+                                        protocols="ip",
+                                        ace_ID=16
+                                    )
+                                ]
+                            )
+                        ]
+                    )
+                ],
+                state="replaced"
+            )
+        )
+        commands = ["access-list 2001", "no deny ip 170.42.45.0 0.0.0.255 any", "16 deny ip 10.1.1.0 0.0.0.255 any"]
+        self.execute_module(changed=True, commands=commands, sort=False)
+
     def test_awplus_acl_replace_numbered_tcp_acl(self):
         set_module_args(
             dict(
@@ -937,7 +980,7 @@ class TestACLModule(TestAwplusModule):
                 state="replaced"
             )
         )
-        commands = ["access-list 3000 permit udp 192.192.92.0/24 eq 2 any lt 5"]
+        commands = ["no access-list 3000", "access-list 3000 permit udp 192.192.92.0/24 eq 2 any lt 5"]
         self.execute_module(changed=True, commands=commands)
 
     def test_awplus_acl_replace_existing_acl_with_empty_ace(self):
@@ -994,7 +1037,7 @@ class TestACLModule(TestAwplusModule):
         commands = [
             "access-list extended test", "no deny tcp 192.143.87.0/24 lt 1 192.142.50.0/24 eq 50",
             "no deny icmp 196.143.87.0/24 196.142.50.0/24 icmp-type 8",
-            "permit icmp 172.192.92.0/24 192.192.92.0/24 icmp-type 8"
+            "4 permit icmp 172.192.92.0/24 192.192.92.0/24 icmp-type 8"
         ]
         self.execute_module(changed=True, commands=commands)
 
@@ -1053,10 +1096,53 @@ class TestACLModule(TestAwplusModule):
             )
         )
         commands = [
-            "no access-list 72", "no access-list 104", "no access-list 2001",
-            "no access-list extended test", "no ipv6 access-list extended ipv6_test",
-            "no access-list 3000", "no access-list hardware hardware_acl", "access-list 2001",
-            "permit ip 192.182.99.0 0.0.0.255 any"
+            "no access-list 72", "no access-list 104", "no access-list extended test",
+            "no ipv6 access-list extended ipv6_test", "no access-list 3000", "no access-list hardware hardware_acl",
+            "access-list 2001", "no deny ip 170.42.45.0 0.0.0.255 any", "no permit ip 141.143.42.0 0.0.0.255 any",
+            "no permit ip 181.185.85.0 0.0.0.255 any", "permit ip 192.182.99.0 0.0.0.255 any"
+        ]
+        self.execute_module(changed=True, commands=commands)
+
+    def test_awplus_acl_override_keeps_unchanged_acl(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        afi="IPv4",
+                        acls=[
+                            dict(
+                                name="2001",
+                                acl_type="extended",
+                                aces=[
+                                    dict(
+                                        source_addr="170.42.45.0 0.0.0.255",
+                                        destination_addr="any",
+                                        action="deny",
+                                        protocols="ip"
+                                    ),
+                                    dict(
+                                        source_addr="141.143.42.0 0.0.0.255",
+                                        destination_addr="any",
+                                        action="permit",
+                                        protocols="ip"
+                                    ),
+                                    dict(
+                                        source_addr="181.185.85.0 0.0.0.255",
+                                        destination_addr="any",
+                                        action="permit",
+                                        protocols="ip"
+                                    )
+                                ]
+                            )
+                        ]
+                    )
+                ],
+                state="overridden"
+            )
+        )
+        commands = [
+            "no access-list 72", "no access-list 104", "no access-list extended test",
+            "no ipv6 access-list extended ipv6_test", "no access-list 3000", "no access-list hardware hardware_acl"
         ]
         self.execute_module(changed=True, commands=commands)
 
@@ -1314,3 +1400,101 @@ class TestACLModule(TestAwplusModule):
             )
         )
         self.execute_module(changed=False)
+
+    def test_awplus_acl_delete_ace_with_ace_id(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        afi="IPv4",
+                        acls=[
+                            dict(
+                                name="2001",
+                                acl_type="extended",
+                                aces=[
+                                    dict(
+                                        ace_ID=8,
+                                        source_addr="141.143.42.0 0.0.0.255",
+                                        destination_addr="any",
+                                        action="permit",
+                                        protocols="ip"
+                                    )
+                                ]
+                            )
+                        ]
+                    )
+                ],
+                state="deleted"
+            )
+        )
+        commands = ["access-list 2001", "no permit ip 141.143.42.0 0.0.0.255 any"]
+        self.execute_module(changed=True, commands=commands)
+
+    def test_awplus_acl_merge_matches_acl_afi(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        afi="IPv6",
+                        acls=[
+                            dict(
+                                name="test",
+                                acl_type="extended",
+                                aces=[
+                                    dict(
+                                        source_addr="2001:db8::/64",
+                                        destination_addr="2001:db8::f/64",
+                                        action="deny",
+                                        protocols="icmp"
+                                    )
+                                ]
+                            )
+                        ]
+                    )
+                ],
+                state="merged"
+            )
+        )
+        commands = ["ipv6 access-list extended test", "deny icmp 2001:db8::/64 2001:db8::f/64"]
+        self.execute_module(changed=True, commands=commands)
+
+    def test_awplus_acl_facts_parsed(self):
+        set_module_args(dict(config=None, state="replaced"))
+        result = self.execute_module(changed=False)
+        acls = dict(((acl["afi"], acl["name"]), acl) for acl in result["before"]["acls"])
+        self.assertEqual(len(acls), 7)
+        self.assertEqual(acls[("IPv4", "72")], {"afi": "IPv4", "name": "72", "type": "Standard"})
+        self.assertEqual(
+            acls[("IPv4", "2001")]["ace"][0],
+            {"ace_ID": 4, "action": "deny", "protocols": "ip", "source_addr": "170.42.45.0 0.0.0.255", "destination_addr": "any"}
+        )
+        self.assertEqual(
+            acls[("IPv4", "test")]["ace"],
+            [
+                {"ace_ID": 4, "action": "deny", "protocols": "tcp", "source_addr": "192.143.87.0/24",
+                 "source_port_protocol": [{"lt": 1}], "destination_addr": "192.142.50.0/24",
+                 "destination_port_protocol": [{"eq": 50}]},
+                {"ace_ID": 8, "action": "deny", "protocols": "icmp", "source_addr": "196.143.87.0/24",
+                 "destination_addr": "196.142.50.0/24", "ICMP_type_number": 8},
+            ]
+        )
+        self.assertEqual(acls[("IPv6", "ipv6_test")]["type"], "Extended")
+        self.assertEqual(acls[("IPv4", "hardware_acl")]["ace"][1]["action"], "copy-to-cpu")
+
+    def test_awplus_acl_facts_not_reread_without_change(self):
+        set_module_args(dict(config=None, state="replaced"))
+        self.execute_module(changed=False)
+        self.assertEqual(self.execute_show_command.call_count, 1)
+
+    def test_awplus_acl_facts_not_reread_in_check_mode(self):
+        set_module_args(
+            dict(
+                config=[dict(afi="IPv4", acls=[dict(name="77", acl_type="standard")])],
+                state="merged",
+                _ansible_check_mode=True,
+            )
+        )
+        result = self.execute_module(changed=True, commands=["access-list 77"])
+        self.assertEqual(self.execute_show_command.call_count, 1)
+        self.assertEqual(result["after"], result["before"])
+        self.get_resource_connection_config.return_value.edit_config.assert_not_called()
@@ -69,11 +69,6 @@ class TestACLInterfacesModule(TestAwplusModule):
         )
         self.execute_show_port_list = self.mock_execute_show_port_list.start()
 
-        self.mock_execute_show_access_list = patch(
-            "ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.config.acl_interfaces.acl_interfaces.Acl_interfaces.get_acl"
-        )
-        self.execute_show_access_list = self.mock_execute_show_access_list.start()
-
     def tearDown(self):
         super(TestACLInterfacesModule, self).tearDown()
         self.mock_load_config.stop()
@@ -83,7 +78,6 @@ class TestACLInterfacesModule(TestAwplusModule):
         self.mock_get_config.stop()
         self.mock_execute_show_running_config.stop()
         self.mock_execute_show_port_list.stop()
-        self.mock_execute_show_access_list.stop()
 
     def load_fixtures(self, commands=None):
         def load_running_config_from_file(*args, **kwargs):
@@ -97,7 +91,7 @@ class TestACLInterfacesModule(TestAwplusModule):
 
         self.execute_show_running_config.side_effect = load_running_config_from_file
         self.execute_show_port_list.side_effect = load_port_list_from_file
-        self.execute_show_access_list.side_effect = load_access_list_from_file
+        self.get_resource_connection_config.return_value.get.side_effect = load_access_list_from_file
 
     def test_awplus_acl_interfaces_merge_empty_config(self):
         set_module_args(dict(config=None))
@@ -192,3 +186,19 @@ class TestACLInterfacesModule(TestAwplusModule):
             "interface port1.6.5", "no access-group test_acl_3"
         ]
         self.execute_module(changed=True, commands=commands)
+
+    def test_awplus_acl_interfaces_merge_lists_acls_once(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(name="port1.6.5", acl_names=["test_acl_4", "10"]),
+                    dict(name="port1.6.6", acl_names=["test_acl_4", "test_acl_2"]),
+                ]
+            )
+        )
+        commands = [
+            "interface port1.6.5", "access-group test_acl_4",
+            "interface port1.6.6", "access-group test_acl_4", "access-group test_acl_2"
+        ]
+        self.execute_module(changed=True, commands=commands)
+        self.get_resource_connection_config.return_value.get.assert_called_once_with("show access-list")
@@ -28,6 +28,7 @@ from ansible_collections.alliedtelesis.awplus.tests.unit.compat.mock import (
 )
 from ansible_collections.alliedtelesis.awplus.plugins.modules import awplus_config
 from ansible_collections.alliedtelesis.awplus.plugins.cliconf.awplus import Cliconf
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import ConnectionError
 from ansible_collections.alliedtelesis.awplus.tests.unit.utils import set_module_args
 from .awplus_module import TestAwplusModule, load_fixture
 
@@ -124,6 +125,46 @@ class TestAwplusConfigModule(TestAwplusModule):
         self.assertEqual(self.get_config.call_count, 0)
         self.assertEqual(self.conn.edit_config.call_count, 0)
 
+    def test_awplus_config_save_modified(self):
+        set_module_args(dict(save_when="modified"))
+        self.conn.get_config_digests = MagicMock(return_value={"running": "a1", "startup": "b2"})
+        self.execute_module(changed=True)
+        self.assertEqual(self.run_commands.call_count, 1)
+        self.assertIn("copy running-config startup-config\r", self.run_commands.call_args[0][1])
+
+        self.run_commands.reset_mock()
+        self.conn.get_config_digests.return_value = {"running": "a1", "startup": "a1"}
+        self.execute_module(changed=False)
+        self.assertEqual(self.run_commands.call_count, 0)
+
+    def test_awplus_config_save_modified_fallback(self):
+        set_module_args(dict(save_when="modified"))
+        self.conn.get_config_digests = MagicMock(side_effect=ConnectionError("Method not found"))
+        self.run_commands.return_value = [self.running_config]
+        self.execute_module(changed=False)
+        self.assertEqual(self.get_config.call_count, 1)
+        self.assertEqual(self.run_commands.call_count, 1)
+        self.assertEqual(self.run_commands.call_args[0][1], "show startup-config")
+
+    def test_awplus_config_fetches_once_per_change(self):
+        fixture_path = os.path.join(os.path.dirname(__file__), "fixtures")
+        src = os.path.join(fixture_path, "awplus_config_src.cfg")
+        set_module_args(dict(src=src, backup=True, save_when="modified", diff_against="running", _ansible_diff=True))
+        self.conn.get_config_digests = MagicMock(side_effect=ConnectionError("Method not found"))
+        self.conn.get_diff = MagicMock(
+            return_value=self.cliconf_obj.get_diff(load_fixture("awplus_config_src.cfg"), self.running_config)
+        )
+        self.get_config.side_effect = [self.running_config, self.running_config + "\nhostname foo"]
+        self.run_commands.return_value = [self.running_config]
+        result = self.execute_module(changed=True)
+        # the running-config is fetched before and once after the change,
+        # and the startup-config once
+        self.assertEqual(self.get_config.call_count, 2)
+        self.assertEqual([c[0][1] for c in self.run_commands.call_args_list],
+                         ["show startup-config", "copy running-config startup-config\r"])
+        self.assertIn("hostname foo", result["diff"]["after"])
+        self.assertNotIn("hostname foo", result["diff"]["before"])
+
     def test_awplus_config_lines_wo_parents(self):
         lines = ["hostname foo"]
         set_module_args(dict(lines=lines))
@@ -18,6 +18,9 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import shutil
+import tempfile
+
 from ansible_collections.alliedtelesis.awplus.tests.unit.compat.mock import patch
 from ansible_collections.alliedtelesis.awplus.plugins.modules import awplus_facts
 from ansible_collections.alliedtelesis.awplus.tests.unit.utils import set_module_args
@@ -34,6 +37,11 @@ class TestAwplusFactsModule(TestAwplusModule):
         )
         self.run_commands = self.mock_run_commands.start()
 
+        self.mock_iter_command_lines = patch(
+            "ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.legacy.base.iter_command_lines"
+        )
+        self.iter_command_lines = self.mock_iter_command_lines.start()
+
         self.mock_get_resource_connection_config = patch(
             'ansible_collections.ansible.netcommon.plugins.module_utils.network.common.cfg.base.get_resource_connection'
         )
@@ -62,6 +70,7 @@ class TestAwplusFactsModule(TestAwplusModule):
     def tearDown(self):
         super(TestAwplusFactsModule, self).tearDown()
         self.mock_run_commands.stop()
+        self.mock_iter_command_lines.stop()
         self.mock_get_capabilities.stop()
 
     def load_fixtures(self, commands=None):
@@ -74,7 +83,12 @@ class TestAwplusFactsModule(TestAwplusModule):
                 output.append(load_fixture(f"awplus_facts_{filename}"))
             return output
 
+        def load_lines_from_file(module, command):
+            filename = command.replace(" ", "_")
+            return iter(load_fixture(f"awplus_facts_{filename}").split("\n"))
+
         self.run_commands.side_effect = load_from_file
+        self.iter_command_lines.side_effect = load_lines_from_file
 
     def test_awplus_facts_filesystems_info(self):
         set_module_args(dict(gather_subset="hardware"))
@@ -131,3 +145,98 @@ class TestAwplusFactsModule(TestAwplusModule):
             ],
             "001a.eb94.27bb",
         )
+
+    def test_awplus_facts_running_config_fetched_once(self):
+        set_module_args(
+            dict(
+                gather_subset="min",
+                gather_network_resources=["logging", "vrfs", "lldp_global", "interfaces", "l2_interfaces"],
+            )
+        )
+        connection = self.get_resource_connection_facts.return_value
+
+        def get_from_file(command):
+            if command == "show running-config":
+                return load_fixture("awplus_vrf_config.cfg")
+            if command == "show interface brief":
+                return "Interface  Status  Protocol\nport1.0.1  admin up  running\nport1.0.2  admin up  down"
+            return ""
+
+        connection.get.side_effect = get_from_file
+        result = self.execute_module()
+        self.assertEqual(
+            sorted(call.args[0] for call in connection.get.call_args_list),
+            ["show interface brief", "show running-config"],
+        )
+
+        resources = result["ansible_facts"]["ansible_network_resources"]
+        self.assertEqual([vrf["name"] for vrf in resources["vrfs"]], ["red", "test_1"])
+        self.assertIn({"dest": "host", "name": "2.3.4.5"}, resources["logging"])
+        self.assertIn("port1.0.2", [intf["name"] for intf in resources["interfaces"]])
+
+    def test_awplus_facts_resources_match_single_subset_gathers(self):
+        subsets = ["logging", "vrfs", "lldp_global", "interfaces", "l2_interfaces"]
+        connection = self.get_resource_connection_facts.return_value
+
+        def get_from_file(command):
+            if command == "show running-config":
+                return load_fixture("awplus_vrf_config.cfg")
+            if command == "show interface brief":
+                return "Interface  Status  Protocol\nport1.0.1  admin up  running\nport1.0.2  admin up  down"
+            return ""
+
+        connection.get.side_effect = get_from_file
+        set_module_args(dict(gather_subset="min", gather_network_resources=subsets))
+        together = self.execute_module()["ansible_facts"]["ansible_network_resources"]
+
+        separately = {}
+        for subset in subsets:
+            set_module_args(dict(gather_subset="min", gather_network_resources=[subset]))
+            separately.update(self.execute_module()["ansible_facts"]["ansible_network_resources"])
+        self.assertEqual(together, separately)
+
+    def test_awplus_facts_resource_cache(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        connection = self.get_resource_connection_facts.return_value
+        running_config = [load_fixture("awplus_vrf_config.cfg")]
+
+        def get_from_file(command):
+            if command == "show running-config":
+                return running_config[0]
+            if command == "show interface brief":
+                return "Interface  Status  Protocol\nport1.0.1  admin up  running\nport1.0.2  admin up  down"
+            return ""
+
+        connection.get.side_effect = get_from_file
+
+        def gather(subsets):
+            set_module_args(
+                dict(
+                    gather_subset="min",
+                    gather_network_resources=subsets,
+                    resource_cache=True,
+                    resource_cache_dir=cache_dir,
+                    resource_cache_key="switch1",
+                )
+            )
+            connection.get.reset_mock()
+            resources = self.execute_module()["ansible_facts"]["ansible_network_resources"]
+            return resources, sorted(call.args[0] for call in connection.get.call_args_list)
+
+        parsed, commands = gather(["vrfs", "interfaces"])
+        self.assertEqual(commands, ["show interface brief", "show running-config"])
+
+        # unchanged config, so the cached subsets aren't parsed again
+        cached, commands = gather(["vrfs", "interfaces"])
+        self.assertEqual(cached, parsed)
+        self.assertEqual(commands, ["show running-config"])
+
+        cached, commands = gather(["vrfs", "logging"])
+        self.assertEqual(cached["vrfs"], parsed["vrfs"])
+        self.assertIn({"dest": "host", "name": "2.3.4.5"}, cached["logging"])
+
+        running_config[0] = running_config[0].replace("ip vrf red", "ip vrf blue")
+        changed, commands = gather(["vrfs", "interfaces"])
+        self.assertEqual(commands, ["show interface brief", "show running-config"])
+        self.assertIn("blue", [vrf["name"] for vrf in changed["vrfs"]])
@@ -11,6 +11,9 @@ from ansible_collections.alliedtelesis.awplus.tests.unit.compat.mock import patc
 from ansible_collections.alliedtelesis.awplus.plugins.modules import (
     awplus_l2_interfaces,
 )
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.config.l2_interfaces.l2_interfaces import (
+    check_stackports,
+)
 from ansible_collections.alliedtelesis.awplus.tests.unit.utils import set_module_args
 from .awplus_module import TestAwplusModule, load_fixture
 
@@ -77,6 +80,9 @@ class TestAwplusL2InterfacesModule(TestAwplusModule):
         self.execute_show_command.side_effect = load_from_file
         self.execute_show_int_command.return_value = ["port1.0.1", "port1.0.2", "port1.0.3", "port1.0.4"]
         self.check_stackports.return_value = False
+        self.get_resource_connection_config.return_value.get.return_value = load_fixture(
+            "awplus_l2_interfaces_vlan_brief.cfg"
+        )
 
     def test_awplus_l2_interfaces_merged(self):
         set_module_args(
@@ -173,3 +179,58 @@ class TestAwplusL2InterfacesModule(TestAwplusModule):
         set_module_args(dict(config=[dict(name="port1.0.2",)], state="deleted"))
         commands = ["interface port1.0.2", "switchport mode access", "no switchport access vlan"]
         self.execute_module(changed=True, commands=commands)
+
+    def test_awplus_l2_interfaces_merged_vlan_range(self):
+        set_module_args(
+            dict(
+                config=[dict(name="port1.0.2", trunk=dict(allowed_vlans=['2-4000']))],
+                state="merged",
+            )
+        )
+        commands = [
+            "interface port1.0.2",
+            "switchport trunk allowed vlan add 3",
+            "switchport trunk allowed vlan add 4",
+        ]
+        self.execute_module(changed=True, commands=commands)
+        self.get_resource_connection_config.return_value.get.assert_called_once_with("show vlan brief")
+
+    def test_awplus_l2_interfaces_merged_skips_stackport(self):
+        self.check_stackports.side_effect = check_stackports
+        self.execute_show_int_command.return_value = ["port1.0.1", "port1.0.2", "port1.0.3", "port1.0.4"]
+        self.get_resource_connection_config.return_value.get.return_value = load_fixture(
+            "awplus_l2_interfaces_vlan_brief.cfg"
+        )
+        set_module_args(
+            dict(
+                config=[
+                    dict(name="port1.0.3", trunk=dict(native_vlan=2)),
+                    dict(name="port1.0.4", access=dict(vlan=2),),
+                ],
+                state="merged",
+            )
+        )
+        commands = [
+            "interface port1.0.3",
+            "switchport mode trunk",
+            "switchport trunk native vlan 2",
+        ]
+        self.execute_module(changed=True, commands=commands, fixture="awplus_l2_interfaces_stackport_config.cfg")
+        self.assertEqual(self.execute_show_command.call_count, 2)
+
+    def test_awplus_l2_interfaces_merged_range(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(name="port1.0.3", access=dict(vlan=2)),
+                    dict(name="port1.0.4", access=dict(vlan=2)),
+                ],
+                state="merged",
+            )
+        )
+        commands = [
+            "interface port1.0.3-1.0.4",
+            "switchport mode access",
+            "switchport access vlan 2",
+        ]
+        self.execute_module(changed=True, commands=commands, sort=False)
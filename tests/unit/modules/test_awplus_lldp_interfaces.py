@@ -202,3 +202,22 @@ class TestAwplusLldpGlobalModule(TestAwplusModule):
             "no lldp tlv-select link-aggregation",
         ]
         self.execute_module(changed=True, commands=commands)
+
+    def test_awplus_lldp_interfaces_merged_range(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(name="port1.0.1", tlv_select=dict(protocol_ids=True)),
+                    dict(name="port1.0.3", transmit=False),
+                    dict(name="port1.0.4", tlv_select=dict(protocol_ids=True)),
+                ],
+                state="merged",
+            )
+        )
+        commands = [
+            "interface port1.0.1,port1.0.4",
+            "lldp tlv-select protocol-ids",
+            "interface port1.0.3",
+            "no lldp transmit",
+        ]
+        self.execute_module(changed=True, commands=commands, sort=False)
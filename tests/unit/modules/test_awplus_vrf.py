@@ -48,11 +48,17 @@ class TestAwplusVrfModule(TestAwplusModule):
         )
         self.run_commands = self.mock_run_commands.start()
 
+        self.mock_get_connection = patch(
+            "ansible_collections.alliedtelesis.awplus.plugins.modules.awplus_vrf.get_connection"
+        )
+        self.get_connection = self.mock_get_connection.start()
+
     def tearDown(self):
         super(TestAwplusVrfModule, self).tearDown()
         self.mock_get_config.stop()
         self.mock_load_config.stop()
         self.mock_run_commands.stop()
+        self.mock_get_connection.stop()
 
     def load_fixtures(self, commands=None, transport="cli"):
         self.get_config.return_value = load_fixture("awplus_vrf_config.cfg")
@@ -0,0 +1,74 @@
+#
+# (c) 2023 Allied Telesis
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import unittest
+
+from ansible.module_utils.connection import ConnectionError
+from ansible_collections.alliedtelesis.awplus.plugins.action.awplus import ActionModule
+from ansible_collections.alliedtelesis.awplus.tests.unit.compat.mock import MagicMock, patch
+
+ACTION_PATH = 'ansible_collections.alliedtelesis.awplus.plugins.action.awplus'
+RECORDS = [{'command': 'show version', 'seconds': 0.1, 'bytes': 100, 'cached': False}]
+
+
+class TestAwplusAction(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_normal_run = patch('ansible.plugins.action.normal.ActionModule.run', return_value={'changed': False})
+        self.normal_run = self.mock_normal_run.start()
+        self.mock_connection = patch(f'{ACTION_PATH}.Connection')
+        self.connection = self.mock_connection.start().return_value
+        self.connection.get_perf_records.side_effect = [['before the task'], RECORDS]
+
+    def tearDown(self):
+        self.mock_normal_run.stop()
+        self.mock_connection.stop()
+
+    def run_action(self, socket_path='/tmp/awplus.sock'):
+        task = MagicMock(args={}, async_val=0, check_mode=False)
+        action = ActionModule(task, MagicMock(socket_path=socket_path), MagicMock(), MagicMock(), MagicMock(), MagicMock())
+        return action.run(task_vars={})
+
+    def test_awplus_action_perf(self):
+        self.connection.get_capabilities.return_value = json.dumps({'perf': True})
+        result = self.run_action()
+        self.assertEqual(result['_perf'], {'commands': RECORDS})
+        self.assertEqual(self.connection.get_perf_records.call_count, 2)
+
+    def test_awplus_action_perf_off(self):
+        self.connection.get_capabilities.return_value = json.dumps({'perf': False})
+        result = self.run_action()
+        self.assertNotIn('_perf', result)
+        self.connection.get_perf_records.assert_not_called()
+
+    def test_awplus_action_perf_connection_error(self):
+        self.connection.get_capabilities.side_effect = ConnectionError('unable to connect to socket')
+        result = self.run_action()
+        self.assertNotIn('_perf', result)
+        self.normal_run.assert_called_once()
+
+    def test_awplus_action_no_socket_path(self):
+        result = self.run_action(socket_path=None)
+        self.assertNotIn('_perf', result)
+        self.connection.get_capabilities.assert_not_called()
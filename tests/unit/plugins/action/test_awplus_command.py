@@ -0,0 +1,117 @@
+#
+# (c) 2023 Allied Telesis
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import unittest
+
+from ansible.module_utils.connection import ConnectionError
+from ansible_collections.alliedtelesis.awplus.plugins.action.awplus_command import ActionModule
+from ansible_collections.alliedtelesis.awplus.tests.unit.compat.mock import MagicMock, patch
+
+ACTION_PATH = 'ansible_collections.alliedtelesis.awplus.plugins.action'
+VERSION = "AlliedWare Plus (TM) 5.4.7 12/14/16 09:17:18"
+
+
+class TestAwplusCommandAction(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_module_run = patch(f'{ACTION_PATH}.awplus.ActionModule.run', return_value={'module': True})
+        self.module_run = self.mock_module_run.start()
+        self.mock_perf_connection = patch(f'{ACTION_PATH}.awplus.Connection')
+        self.mock_perf_connection.start().return_value.get_capabilities.return_value = '{"perf": false}'
+        self.mock_connection = patch(f'{ACTION_PATH}.awplus_command.Connection')
+        self.connection = self.mock_connection.start().return_value
+        self.connection.run_commands.return_value = [VERSION]
+        self.mock_sleep = patch(f'{ACTION_PATH}.awplus_command.time.sleep')
+        self.sleep = self.mock_sleep.start()
+
+    def tearDown(self):
+        self.mock_module_run.stop()
+        self.mock_perf_connection.stop()
+        self.mock_connection.stop()
+        self.mock_sleep.stop()
+
+    def run_action(self, args, socket_path='/tmp/awplus.sock', async_val=0):
+        task = MagicMock(args=args, async_val=async_val, check_mode=False)
+        connection = MagicMock(socket_path=socket_path)
+        action = ActionModule(task, connection, MagicMock(), MagicMock(), MagicMock(), MagicMock())
+        return action.run(task_vars={})
+
+    def assert_module_run(self, result):
+        self.assertEqual(result, {'module': True})
+        self.connection.run_commands.assert_not_called()
+
+    def test_awplus_command_action_direct(self):
+        result = self.run_action(dict(commands=['show version', {'command': 'show clock'}]))
+        self.connection.run_commands.assert_called_once_with(commands=['show version', 'show clock'])
+        self.module_run.assert_not_called()
+        self.assertFalse(result['changed'])
+        self.assertEqual(result['stdout'], [VERSION])
+        self.assertEqual(result['stdout_lines'], [[VERSION]])
+
+    def test_awplus_command_action_wait_for(self):
+        result = self.run_action(dict(commands=['show version'], wait_for=['result[0] contains AlliedWare']))
+        self.assertNotIn('failed', result)
+        self.sleep.assert_not_called()
+
+    def test_awplus_command_action_wait_for_fail(self):
+        result = self.run_action(dict(commands=['show version'], wait_for=['result[0] contains 5.5.0'], retries=3))
+        self.assertTrue(result['failed'])
+        self.assertEqual(result['failed_conditions'], ['result[0] contains 5.5.0'])
+        self.assertEqual(self.connection.run_commands.call_count, 3)
+
+    def test_awplus_command_action_wait_for_match_any(self):
+        result = self.run_action(dict(commands=['show version'], match='any',
+                                      wait_for=['result[0] contains 5.5.0', 'result[0] contains 5.4.7']))
+        self.assertNotIn('failed', result)
+        self.assertEqual(self.connection.run_commands.call_count, 1)
+
+    def test_awplus_command_action_bad_match(self):
+        result = self.run_action(dict(commands=['show version'], match='some'))
+        self.assertTrue(result['failed'])
+        self.assertIn('value of match must be one of', result['msg'])
+
+    def test_awplus_command_action_bad_wait_for(self):
+        result = self.run_action(dict(commands=['show version'], wait_for=['result[0] sounds like 5.4.7']))
+        self.assertTrue(result['failed'])
+        self.connection.run_commands.assert_not_called()
+
+    def test_awplus_command_action_connection_error(self):
+        self.connection.run_commands.side_effect = ConnectionError('% Invalid input detected')
+        result = self.run_action(dict(commands=['show version']))
+        self.assertTrue(result['failed'])
+        self.assertEqual(result['msg'], '% Invalid input detected')
+
+    def test_awplus_command_action_prompt_answer(self):
+        self.assert_module_run(self.run_action(dict(commands=[{'command': 'show version', 'prompt': 'y/n', 'answer': 'y'}])))
+
+    def test_awplus_command_action_not_show(self):
+        self.assert_module_run(self.run_action(dict(commands=['show version', 'clear counters'])))
+
+    def test_awplus_command_action_provider(self):
+        self.assert_module_run(self.run_action(dict(commands=['show version'], provider={'host': 'switch'})))
+
+    def test_awplus_command_action_async(self):
+        self.assert_module_run(self.run_action(dict(commands=['show version']), async_val=30))
+
+    def test_awplus_command_action_no_socket_path(self):
+        self.assert_module_run(self.run_action(dict(commands=['show version']), socket_path=None))
@@ -0,0 +1,64 @@
+#
+# (c) 2023 Allied Telesis
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import unittest
+
+from ansible_collections.alliedtelesis.awplus.plugins.action.awplus_facts import ActionModule
+from ansible_collections.alliedtelesis.awplus.tests.unit.compat.mock import MagicMock, patch
+
+ACTION_PATH = 'ansible_collections.alliedtelesis.awplus.plugins.action.awplus_facts'
+
+
+class TestAwplusFactsAction(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_start_perf = patch(f'{ACTION_PATH}.ActionModule._start_perf', return_value=None)
+        self.mock_start_perf.start()
+        self.mock_execute_module = patch(f'{ACTION_PATH}.ActionModule._execute_module', return_value={'changed': False})
+        self.execute_module = self.mock_execute_module.start()
+
+    def tearDown(self):
+        self.mock_start_perf.stop()
+        self.mock_execute_module.stop()
+
+    def resource_cache_dir(self, cache_plugin, cache_connection, args=None):
+        task = MagicMock(args=dict(resource_cache=True, **(args or {})), async_val=0, check_mode=False)
+        action = ActionModule(task, MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock())
+        with patch(f'{ACTION_PATH}.C') as constants:
+            constants.CACHE_PLUGIN = cache_plugin
+            constants.CACHE_PLUGIN_CONNECTION = cache_connection
+            action.run(task_vars={'inventory_hostname': 'switch1'})
+        module_args = self.execute_module.call_args.kwargs['module_args']
+        self.assertEqual(module_args['resource_cache_key'], 'switch1')
+        return module_args['resource_cache_dir']
+
+    def test_awplus_facts_action_file_cache_dir(self):
+        self.assertEqual(self.resource_cache_dir('jsonfile', '/tmp/facts'), '/tmp/facts/awplus_resources')
+        self.assertEqual(self.resource_cache_dir('community.general.yaml', '/tmp/facts'), '/tmp/facts/awplus_resources')
+
+    def test_awplus_facts_action_non_file_cache(self):
+        self.assertEqual(self.resource_cache_dir('redis', 'localhost:6379:0'), '~/.ansible/awplus_resources')
+        self.assertEqual(self.resource_cache_dir('memory', None), '~/.ansible/awplus_resources')
+
+    def test_awplus_facts_action_explicit_cache_dir(self):
+        self.assertEqual(self.resource_cache_dir('redis', 'localhost:6379:0', dict(resource_cache_dir='/srv/cache')), '/srv/cache')
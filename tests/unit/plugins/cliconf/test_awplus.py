@@ -0,0 +1,196 @@
+#
+# (c) 2023 Allied Telesis
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import unittest
+
+from ansible.errors import AnsibleConnectionFailure
+from ansible_collections.alliedtelesis.awplus.plugins.cliconf.awplus import PERF_RECORDS_LIMIT, Cliconf
+from ansible_collections.alliedtelesis.awplus.plugins.terminal.awplus import ERROR_PATTERNS, ErrorMatcher
+from ansible_collections.alliedtelesis.awplus.tests.unit.compat.mock import MagicMock
+from ansible_collections.alliedtelesis.awplus.tests.unit.modules.awplus_module import load_fixture
+
+
+class TestAwplusCliconf(unittest.TestCase):
+
+    def setUp(self):
+        self.cliconf_obj = Cliconf(MagicMock())
+        self.running_config = load_fixture("awplus_config_config.cfg")
+
+    def test_awplus_cliconf_command_cache(self):
+        options = dict(command_cache_ttl=60, command_cache_size=2)
+        self.cliconf_obj.get_option = MagicMock(side_effect=options.get)
+        self.cliconf_obj.send_command = MagicMock(side_effect=lambda command, **kwargs: command.upper())
+        self.cliconf_obj._connection.get_prompt.return_value = b"awplus#"
+
+        self.assertEqual(self.cliconf_obj.get("show vlan all"), "SHOW VLAN ALL")
+        self.cliconf_obj.get("show vlan all")
+        self.cliconf_obj.get("show interface brief")
+        self.assertEqual(self.cliconf_obj.send_command.call_count, 2)
+
+        # the least recently used output is dropped first
+        self.cliconf_obj.get("show vlan all")
+        self.cliconf_obj.get("show lldp")
+        self.cliconf_obj.get("show vlan all")
+        self.cliconf_obj.get("show interface brief")
+        self.assertEqual(self.cliconf_obj.send_command.call_count, 4)
+
+        self.cliconf_obj.edit_config(["vlan database", "vlan 2"])
+        self.cliconf_obj.send_command.reset_mock()
+        self.cliconf_obj.get("show vlan all")
+        self.assertEqual(self.cliconf_obj.send_command.call_count, 1)
+
+        options["command_cache_ttl"] = 0
+        self.cliconf_obj.get("show vlan all")
+        self.assertEqual(self.cliconf_obj.send_command.call_count, 2)
+
+    def test_awplus_cliconf_get_lines(self):
+        self.cliconf_obj.send_command = MagicMock(return_value=self.running_config)
+        lines = self.running_config.splitlines()
+        chunks = []
+        start = 0
+        more = True
+        while more:
+            chunk = self.cliconf_obj.get_lines("show running-config", start=start, count=50)
+            chunks.append(chunk["lines"])
+            start += len(chunk["lines"])
+            more = chunk["more"]
+        self.assertEqual(sum(chunks, []), lines)
+        self.assertEqual(len(chunks), (len(lines) + 49) // 50)
+        self.assertEqual(self.cliconf_obj.send_command.call_count, 1)
+
+    def test_awplus_cliconf_perf_records(self):
+        options = dict(perf=True, perf_log=None, command_cache_ttl=60, command_cache_size=8)
+        self.cliconf_obj.get_option = MagicMock(side_effect=options.get)
+        self.cliconf_obj._connection.send.return_value = b"VLAN ID  Name"
+        self.cliconf_obj._connection.get_option.return_value = "aw1"
+
+        self.cliconf_obj.get("show vlan brief")
+        self.cliconf_obj.get("show vlan brief")
+        records = self.cliconf_obj.get_perf_records()
+        self.assertEqual([(r["command"], r["bytes"], r["cached"], r["host"]) for r in records],
+                         [("show vlan brief", 13, False, "aw1"), ("show vlan brief", 13, True, "aw1")])
+        self.assertEqual(self.cliconf_obj.get_perf_records(), [])
+
+        options["perf"] = False
+        self.cliconf_obj.get("show interface brief")
+        self.assertEqual(self.cliconf_obj.get_perf_records(), [])
+
+    def test_awplus_cliconf_perf_records_limit(self):
+        options = dict(perf=True, perf_log=None, command_cache_ttl=0, command_cache_size=0)
+        self.cliconf_obj.get_option = MagicMock(side_effect=options.get)
+        self.cliconf_obj._connection.send.return_value = b""
+        self.cliconf_obj._connection.get_option.return_value = "aw1"
+
+        for index in range(PERF_RECORDS_LIMIT + 5):
+            self.cliconf_obj.get(f"show interface port1.0.{index}")
+        records = self.cliconf_obj.get_perf_records()
+        self.assertEqual(len(records), PERF_RECORDS_LIMIT)
+        self.assertEqual(records[0]["command"], "show interface port1.0.5")
+
+    def test_awplus_cliconf_config_digests(self):
+        configs = {"running": self.running_config, "startup": self.running_config}
+        self.cliconf_obj.get_option = MagicMock(side_effect=dict(command_cache_ttl=0, command_cache_size=128).get)
+        self.cliconf_obj._connection.get_prompt.return_value = b"awplus#"
+        self.cliconf_obj.get_config = MagicMock(side_effect=lambda source: configs[source])
+        self.cliconf_obj.send_command = MagicMock(return_value="")
+
+        digests = self.cliconf_obj.get_config_digests()
+        self.assertEqual(digests["running"], digests["startup"])
+        self.assertEqual(self.cliconf_obj.get_config.call_count, 2)
+
+        # the running-config is read every time, so a change made outside
+        # the connection is seen; the startup digest is kept
+        configs["running"] += "\nhostname foo"
+        digests = self.cliconf_obj.get_config_digests()
+        self.assertNotEqual(digests["running"], digests["startup"])
+        self.assertEqual([c[1]["source"] for c in self.cliconf_obj.get_config.call_args_list],
+                         ["running", "startup", "running"])
+
+        # configuration sent through the connection leaves the startup digest
+        self.cliconf_obj._invalidate_caches()
+        self.cliconf_obj.get_config_digests()
+        self.assertEqual(self.cliconf_obj.get_config.call_count, 4)
+
+        # a save, or any other command, drops it
+        self.cliconf_obj.run_commands(["copy running-config startup-config\r"])
+        configs["startup"] = configs["running"]
+        digests = self.cliconf_obj.get_config_digests()
+        self.assertEqual(digests["running"], digests["startup"])
+        self.assertEqual(self.cliconf_obj.get_config.call_count, 6)
+
+        # with the command cache enabled the running-config is kept for its ttl
+        self.cliconf_obj.get_option.side_effect = dict(command_cache_ttl=60, command_cache_size=128).get
+        self.cliconf_obj.send_command.return_value = configs["running"]
+        self.cliconf_obj.get_config_digests()
+        digests = self.cliconf_obj.get_config_digests()
+        self.assertEqual(digests["running"], digests["startup"])
+        self.assertEqual(self.cliconf_obj.send_command.call_count, 2)
+        self.assertEqual(self.cliconf_obj.get_config.call_count, 6)
+
+    def send_config_batch(self, commands, *chunks):
+        terminal = self.cliconf_obj._connection._terminal
+        stderr_re = [ErrorMatcher(ERROR_PATTERNS)]
+        terminal.terminal_stderr_re = stderr_re
+        self.cliconf_obj._connection.receive.side_effect = list(chunks)
+        self.cliconf_obj.get_option = MagicMock(side_effect=dict(perf=False).get)
+        try:
+            return self.cliconf_obj._send_config_batch(commands)
+        finally:
+            self.assertIs(terminal.terminal_stderr_re, stderr_re)
+
+    def test_awplus_cliconf_config_batch(self):
+        commands = ["interface port1.0.1", "description uplink", "switchport access vlan 5"]
+        # the receive returns at the prompt echoed in front of each line
+        responses = self.send_config_batch(
+            commands,
+            b"interface port1.0.1\nawplus(config-if)#",
+            b"description uplink\nawplus(config-if)#switchport access vlan 5\n"
+            b"% Switchport mode is access\nawplus(config-if)#",
+        )
+        self.assertEqual(responses, ["", "", "% Switchport mode is access"])
+        self.assertEqual(self.cliconf_obj._connection.send.call_count, 3)
+        self.assertEqual(self.cliconf_obj._connection.receive.call_count, 2)
+
+    def test_awplus_cliconf_config_batch_error(self):
+        commands = ["interface port1.0.1", "switchport access vlan 4000", "description uplink"]
+        with self.assertRaises(AnsibleConnectionFailure) as error:
+            self.send_config_batch(
+                commands,
+                b"interface port1.0.1\nawplus(config-if)#switchport access vlan 4000\n"
+                b"% Error: VLAN 4000 does not exist\nawplus(config-if)#description uplink\nawplus(config-if)#",
+            )
+        self.assertTrue(str(error.exception).startswith("switchport access vlan 4000\r\n% Error: VLAN 4000"))
+
+    def test_awplus_cliconf_config_batch_prompt_like_output(self):
+        commands = ["banner motd", "hostname core"]
+        split = self.cliconf_obj._split_batch_output
+        output = "banner motd\nlab#\nbuilding(1)#\nawplus(config)#hostname core\nswitch#\ncore(config)#"
+        self.assertEqual(split(commands, output), ["lab#\nbuilding(1)#", "switch#"])
+        # a prompt before the last line has been echoed isn't the end
+        self.assertIsNone(split(commands, "banner motd\nlab#"))
+        self.assertIsNone(split(commands, "banner motd\nawplus(config)#hostname core"))
+
+    def test_awplus_cliconf_config_batch_restores_stderr_re(self):
+        self.cliconf_obj._connection.send.side_effect = AnsibleConnectionFailure("timed out")
+        with self.assertRaises(AnsibleConnectionFailure):
+            self.send_config_batch(["hostname core", "lldp run"])
@@ -0,0 +1,97 @@
+#
+# (c) 2023 Allied Telesis
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import unittest
+
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.facts.policy_maps.policy_maps import Policy_mapsFacts
+from ansible_collections.alliedtelesis.awplus.tests.unit.compat.mock import MagicMock
+
+RUNNING_CONFIG = """policy-map storm
+ class link
+  storm-protection
+  storm-action linkdown
+  storm-window 500
+ class port
+  storm-action portdisable
+  storm-rate 40
+ class vlan
+  storm-action vlandisable
+!
+policy-map police
+ class twin
+  police twin-rate 128 3264 4096 8192 action remark-transmit
+ class single
+  police single-rate 64 4096 8192 action drop-red
+!
+policy-map remark
+ class remarks
+  remark new-cos 3 internal
+  remark-map bandwidth-class green to new-dscp 10 new-bandwidth-class yellow
+  remark-map bandwidth-class yellow to new-dscp 20 new-bandwidth-class red
+  remark-map bandwidth-class red to new-dscp 30 new-bandwidth-class green
+  set ip next-hop 192.0.2.1
+!
+interface port1.0.1
+ service-policy input storm
+!
+end"""
+
+
+class TestPolicyMapsFacts(unittest.TestCase):
+
+    def setUp(self):
+        self.facts = Policy_mapsFacts(MagicMock())
+        self.blocks = self.facts.index_policy_map_blocks(RUNNING_CONFIG)
+
+    def test_policy_maps_facts_index_blocks(self):
+        self.assertEqual(sorted(self.blocks), ['police', 'remark', 'storm'])
+
+    def test_policy_maps_facts_storm_action(self):
+        self.assertEqual(self.facts.render_classifiers('storm', self.blocks), [
+            {'name': 'link', 'storm_protection': True, 'storm_action': 'link_down', 'storm_window': '500'},
+            {'name': 'port', 'storm_action': 'port_disable', 'storm_rate': '40'},
+            {'name': 'vlan', 'storm_action': 'vlan_disable'},
+        ])
+
+    def test_policy_maps_facts_policers(self):
+        self.assertEqual(self.facts.render_classifiers('police', self.blocks), [
+            {'name': 'twin',
+             'policer': {'type': 'twin_rate', 'action': 'remark_transmit', 'cir': '128', 'pir': '3264', 'cbs': '4096', 'pbs': '8192'}},
+            {'name': 'single',
+             'policer': {'type': 'single_rate', 'action': 'drop_red', 'cir': '64', 'cbs': '4096', 'ebs': '8192'}},
+        ])
+
+    def test_policy_maps_facts_remark_maps(self):
+        self.assertEqual(self.facts.render_classifiers('remark', self.blocks), [{
+            'name': 'remarks',
+            'remark': {'new_cos': '3', 'apply': 'internal'},
+            'remark_map': [
+                {'class_in': 'green', 'new_dscp': '10', 'new_class': 'yellow'},
+                {'class_in': 'yellow', 'new_dscp': '20', 'new_class': 'red'},
+                {'class_in': 'red', 'new_dscp': '30', 'new_class': 'green'},
+            ],
+            'pbr_next_hop': '192.0.2.1',
+        }])
+
+    def test_policy_maps_facts_unknown_policy_map(self):
+        self.assertEqual(self.facts.render_classifiers('missing', self.blocks), [])
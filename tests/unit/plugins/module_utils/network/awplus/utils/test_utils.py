@@ -0,0 +1,104 @@
+#
+# (c) 2023 Allied Telesis
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import unittest
+
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.network.awplus.utils.utils import (
+    int_list_to_range,
+    int_range_to_list,
+    interface_key,
+)
+
+PORTS = [f"port{stack}.0.{port}" for stack in (1, 2) for port in range(1, 13)]
+INTERFACES = set(PORTS + ["vlan1", "vlan2", "vlan3", "vlan4", "po1", "sa2"])
+
+
+class TestInterfaceKey(unittest.TestCase):
+
+    def test_interface_key_port(self):
+        self.assertEqual(interface_key("port1.0.12"), ("port", 1, 0, 12))
+        self.assertEqual(interface_key("port2.1.3"), ("port", 2, 1, 3))
+
+    def test_interface_key_other(self):
+        self.assertEqual(interface_key("vlan10"), ("vlan", 10))
+        self.assertEqual(interface_key("po3"), ("po", 3))
+        self.assertEqual(interface_key("eth0"), ("eth", 0))
+
+    def test_interface_key_sort(self):
+        names = ["port1.0.10", "port2.0.1", "port1.0.9", "port1.0.2"]
+        self.assertEqual(sorted(names, key=interface_key), ["port1.0.2", "port1.0.9", "port1.0.10", "port2.0.1"])
+
+    def test_interface_key_malformed(self):
+        for name in ("", "port1.0", "port1.0.x", "1.0.2", "port1.0.2.3"):
+            self.assertIsNone(interface_key(name), name)
+
+
+class TestIntRangeToList(unittest.TestCase):
+
+    def test_int_range_to_list_single(self):
+        self.assertEqual(int_range_to_list("port1.0.3", INTERFACES), ["port1.0.3"])
+        self.assertEqual(int_range_to_list("vlan2,po1", INTERFACES), ["vlan2", "po1"])
+
+    def test_int_range_to_list_port_range(self):
+        self.assertEqual(int_range_to_list("port1.0.1-1.0.3", INTERFACES), ["port1.0.1", "port1.0.2", "port1.0.3"])
+        self.assertEqual(int_range_to_list("vlan2-4", INTERFACES), ["vlan2", "vlan3", "vlan4"])
+
+    def test_int_range_to_list_stack_range(self):
+        self.assertEqual(int_range_to_list("port1.0.11-1.0.12,port2.0.1-2.0.2,port2.0.5", INTERFACES),
+                         ["port1.0.11", "port1.0.12", "port2.0.1", "port2.0.2", "port2.0.5"])
+
+    def test_int_range_to_list_missing_interfaces(self):
+        # the interfaces in a range the switch doesn't have are left out
+        self.assertEqual(int_range_to_list("port1.0.11-1.0.14", INTERFACES), ["port1.0.11", "port1.0.12"])
+        self.assertEqual(int_range_to_list("port1.0.3-1.0.1", INTERFACES), [])
+        self.assertIsNone(int_range_to_list("port1.0.13", INTERFACES))
+        self.assertIsNone(int_range_to_list("port1.0.1,port3.0.1", INTERFACES))
+
+    def test_int_range_to_list_malformed(self):
+        for range_string in ("port1.0.1-3", "vlan2-1.0.4", "port1.0.1-1.0.x", "port1.0.x-1.0.2", "-port1.0.2"):
+            self.assertIsNone(int_range_to_list(range_string, INTERFACES), range_string)
+
+
+class TestIntListToRange(unittest.TestCase):
+
+    def test_int_list_to_range(self):
+        self.assertEqual(int_list_to_range(["port1.0.1", "port1.0.2", "port1.0.3", "port1.0.5"]), "port1.0.1-1.0.3,port1.0.5")
+        self.assertEqual(int_list_to_range(["vlan4", "vlan2", "vlan3"]), "vlan2-4")
+        self.assertEqual(int_list_to_range([]), "")
+
+    def test_int_list_to_range_order(self):
+        self.assertEqual(int_list_to_range(["port1.0.10", "port1.0.9", "port1.0.2"]), "port1.0.2,port1.0.9-1.0.10")
+        self.assertEqual(int_list_to_range(["port2.0.1", "port1.0.12", "port1.0.11"]), "port1.0.11-1.0.12,port2.0.1")
+
+    def test_int_list_to_range_duplicates_and_unknown(self):
+        self.assertEqual(int_list_to_range(["port1.0.2", "bogus", "port1.0.1", "port1.0.2", "bogus"]), "port1.0.1-1.0.2,bogus")
+
+    def test_int_list_to_range_round_trip(self):
+        for names in (PORTS, PORTS[::2], PORTS[3:15], ["port1.0.1", "port1.0.12", "port2.0.12"], ["vlan1", "vlan2", "vlan4"]):
+            range_string = int_list_to_range(names)
+            self.assertEqual(int_range_to_list(range_string, INTERFACES), sorted(names, key=interface_key))
+            self.assertEqual(int_list_to_range(int_range_to_list(range_string, INTERFACES)), range_string)
+
+    def test_int_range_to_list_round_trip(self):
+        for range_string in ("port1.0.1-1.0.12,port2.0.1-2.0.12", "port1.0.2,port1.0.4-1.0.6,port2.0.3", "vlan1-4"):
+            self.assertEqual(int_list_to_range(int_range_to_list(range_string, INTERFACES)), range_string)
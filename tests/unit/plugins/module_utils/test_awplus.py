@@ -0,0 +1,91 @@
+#
+# (c) 2023 Allied Telesis
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import unittest
+
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils import awplus
+from ansible_collections.alliedtelesis.awplus.tests.unit.compat.mock import MagicMock, patch
+
+
+class TestAwplusModuleUtilsPerf(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_get_module_connection = patch(
+            'ansible_collections.alliedtelesis.awplus.plugins.module_utils.awplus.get_module_connection'
+        )
+        self.connection = self.mock_get_module_connection.start().return_value
+        self.connection.run_commands.return_value = ['AlliedWare Plus']
+
+    def tearDown(self):
+        self.mock_get_module_connection.stop()
+
+    def run_module(self, perf):
+        self.connection.get_capabilities.return_value = json.dumps({'network_api': 'cliconf', 'perf': perf})
+        module = MagicMock(spec=['fail_json', 'exit_json'])
+        awplus.run_commands(module, ['show version'])
+        return module, awplus.add_perf_records(module, {'changed': False})
+
+    def test_awplus_module_utils_perf_records(self):
+        module, result = self.run_module(perf=True)
+        self.assertEqual([(call['call'], call['bytes']) for call in result['_perf']['calls']], [('run_commands', 15)])
+        self.assertIsInstance(module.exit_json, MagicMock)
+
+    def test_awplus_module_utils_perf_off(self):
+        module, result = self.run_module(perf=False)
+        self.assertEqual(result, {'changed': False})
+
+
+class TestAwplusModuleUtilsCommandLines(unittest.TestCase):
+
+    def setUp(self):
+        self.connection = MagicMock()
+        self.module = MagicMock(spec=['fail_json'])
+        self.module._awplus_connection = self.connection
+
+    def test_awplus_module_utils_iter_command_lines(self):
+        output = [f"line {n}" for n in range(5)]
+
+        def get_lines(command, start=0, count=2):
+            return {'lines': output[start:start + count], 'more': start + count < len(output)}
+
+        self.connection.get_lines.side_effect = get_lines
+        lines = awplus.iter_command_lines(self.module, 'show interface', count=2)
+        self.assertEqual(list(lines), output)
+        self.assertEqual(
+            [call.kwargs['start'] for call in self.connection.get_lines.call_args_list], [0, 2, 4]
+        )
+        self.assertEqual(self.connection.get_lines.call_args.kwargs, {'command': 'show interface', 'start': 4, 'count': 2})
+
+    def test_awplus_module_utils_iter_command_lines_is_lazy(self):
+        self.connection.get_lines.return_value = {'lines': ['line 0'], 'more': True}
+        lines = awplus.iter_command_lines(self.module, 'show interface')
+        self.assertEqual(next(lines), 'line 0')
+        self.assertEqual(self.connection.get_lines.call_count, 1)
+
+    def test_awplus_module_utils_iter_command_lines_error(self):
+        self.connection.get_lines.side_effect = awplus.ConnectionError('timeout value 30 seconds reached')
+        self.module.fail_json.side_effect = SystemExit
+        with self.assertRaises(SystemExit):
+            list(awplus.iter_command_lines(self.module, 'show interface'))
+        self.module.fail_json.assert_called_once_with(msg='timeout value 30 seconds reached')
@@ -0,0 +1,173 @@
+#
+# (c) 2023 Allied Telesis
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import unittest
+
+from ansible_collections.alliedtelesis.awplus.plugins.module_utils.connection import (
+    Connection,
+    ConnectionError,
+    get_module_connection,
+    recv_data,
+    resource_connection,
+    send_data,
+)
+from ansible_collections.alliedtelesis.awplus.tests.unit.compat.mock import MagicMock
+
+
+class RpcServer(threading.Thread):
+    """ Answers each request with the name of its method, serving one
+    client socket at a time as ansible-connection does
+    """
+
+    def __init__(self, path, single_reply=False, drop_after=None):
+        super(RpcServer, self).__init__()
+        self.daemon = True
+        self.single_reply = single_reply
+        self.drop_after = drop_after
+        self.accepted = 0
+        self.requests = 0
+        self.closed = threading.Event()
+        self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.listener.bind(path)
+        self.listener.listen(5)
+
+    def run(self):
+        while True:
+            try:
+                conn, addr = self.listener.accept()
+            except OSError:
+                return
+            self.accepted += 1
+            while True:
+                data = recv_data(conn)
+                if data is None:
+                    break
+                self.requests += 1
+                if self.requests == self.drop_after:
+                    # read the request but hang up without answering
+                    break
+                request = json.loads(data)
+                send_data(conn, json.dumps(dict(jsonrpc="2.0", id=request["id"], result=request["method"])).encode())
+                if self.single_reply:
+                    break
+            conn.close()
+            self.closed.set()
+
+    def stop(self):
+        self.listener.close()
+
+
+class TestConnection(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.socket_path = os.path.join(self.tmpdir, "conn")
+
+    def tearDown(self):
+        self.server.stop()
+        shutil.rmtree(self.tmpdir)
+
+    def start_server(self, single_reply=False, drop_after=None):
+        self.server = RpcServer(self.socket_path, single_reply, drop_after)
+        self.server.start()
+        return Connection(self.socket_path)
+
+    def test_connection_socket_per_request(self):
+        connection = self.start_server()
+        self.assertEqual(connection.get_capabilities(), "get_capabilities")
+        self.assertEqual(connection.get_config(), "get_config")
+        self.assertEqual(self.server.accepted, 2)
+        self.assertIsNone(connection._socket)
+
+    def test_connection_reused_in_with_block(self):
+        connection = self.start_server()
+        with connection:
+            with connection:
+                self.assertEqual(connection.get_config(), "get_config")
+            self.assertEqual(connection.get("show interface"), "get")
+            self.assertEqual(connection.run_commands(), "run_commands")
+            self.assertIsNotNone(connection._socket)
+        self.assertEqual(self.server.accepted, 1)
+        self.assertIsNone(connection._socket)
+
+        # the socket was closed, so the server can take another client
+        self.assertEqual(Connection(self.socket_path).get_config(), "get_config")
+        self.assertEqual(self.server.accepted, 2)
+
+    def test_connection_resends_when_reused_socket_closed(self):
+        connection = self.start_server(single_reply=True)
+        with connection:
+            self.assertEqual(connection.get_config(), "get_config")
+            self.server.closed.wait(5)
+            self.assertEqual(connection.get("show interface"), "get")
+            self.assertTrue(connection._single_reply)
+            self.assertIsNone(connection._socket)
+            self.assertEqual(connection.run_commands(), "run_commands")
+        # the request after the hang up and every later one get a socket each
+        self.assertEqual(self.server.accepted, 3)
+        self.assertEqual(self.server.requests, 3)
+
+    def test_connection_no_resend_after_request_written(self):
+        connection = self.start_server(drop_after=2)
+        with connection:
+            self.assertEqual(connection.get_config(), "get_config")
+            with self.assertRaises(ConnectionError):
+                connection.edit_config(["hostname foo"])
+            self.assertIsNone(connection._socket)
+        # the unanswered request reached the server once and wasn't resent
+        self.assertEqual(self.server.requests, 2)
+        self.assertEqual(self.server.accepted, 1)
+
+    def test_resource_connection(self):
+        self.start_server()
+        module = MagicMock(spec=["_socket_path"], _socket_path=self.socket_path)
+        with resource_connection(module) as connection:
+            self.assertIs(module._connection, connection)
+            self.assertIs(get_module_connection(module), connection)
+            self.assertEqual(connection.get("show vlan"), "get")
+            self.assertEqual(connection.edit_config(["vlan database"]), "edit_config")
+        self.assertEqual(self.server.accepted, 1)
+        self.assertIsNone(connection._socket)
+
+        module = MagicMock(spec=["_socket_path"], _socket_path=None)
+        with resource_connection(module) as connection:
+            self.assertIsNone(connection)
+        self.assertFalse(hasattr(module, "_connection"))
+
+    def test_connection_close(self):
+        connection = self.start_server()
+        connection.close()
+        with connection:
+            connection.get_config()
+            connection.close()
+            self.assertIsNone(connection._socket)
+            connection.close()
+            self.assertEqual(connection.get_config(), "get_config")
+        self.assertEqual(self.server.accepted, 2)
+        self.assertIsNone(connection._socket)
@@ -0,0 +1,116 @@
+#
+# (c) 2023 Allied Telesis
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import re
+import unittest
+
+from ansible_collections.alliedtelesis.awplus.tests.unit.compat.mock import MagicMock
+from ansible_collections.alliedtelesis.awplus.plugins.terminal.awplus import (
+    ERROR_PATTERNS,
+    PROMPT_PATTERNS,
+    ErrorMatcher,
+    PromptMatcher,
+    TerminalModule,
+)
+
+ERRORS = [
+    b"% Error: VLAN 4000 does not exist",
+    b"% Invalid input detected at '^' marker.",
+    b"% Incomplete command.",
+    b"% Ambiguous command",
+    b"% Bad secret",
+    b"\n% Bad passwords",
+    b"show foo not found",
+    b"% 10.0.0.0/8 overlaps with 10.1.0.0/16",
+    b"% Bad mask /33 for address 10.0.0.1",
+    b"% Informational: \n",
+    b"Command authorization failed",
+]
+OUTPUT = b"".join(b"interface port1.0.%d\n description uplink %d\n switchport\n!\n" % (i, i) for i in range(100))
+
+
+def receive(matcher, response, chunk):
+    """ Search the response as it grows a chunk at a time, as network_cli
+    does with libssh, and return whether an error was found """
+    matcher.reset()
+    found = False
+    for end in range(chunk, len(response) + chunk, chunk):
+        found = bool(matcher.search(response[:end])) or found
+    return found
+
+
+class TestAwplusTerminal(unittest.TestCase):
+
+    def test_awplus_terminal_prompt_matcher(self):
+        matcher = PromptMatcher(PROMPT_PATTERNS)
+        self.assertTrue(matcher.search(OUTPUT + b"awplus#"))
+        self.assertTrue(matcher.search(b"show vlan\nawplus(config-if)# "))
+        self.assertTrue(matcher.search(b"awplus>"))
+        self.assertFalse(matcher.search(b"awplus#show running-config\n" + OUTPUT))
+        self.assertFalse(matcher.search(OUTPUT + b"awplus# show"))
+
+    def test_awplus_terminal_error_matcher_matches_patterns(self):
+        regexes = [re.compile(pattern, re.I if nocase else 0) for pattern, nocase in ERROR_PATTERNS]
+        matcher = ErrorMatcher(ERROR_PATTERNS)
+        for error in ERRORS + [b"description Error free", b"interface port1.0.1"]:
+            expected = any(regex.search(error) for regex in regexes)
+            matcher.reset()
+            self.assertEqual(bool(matcher.search(error)), expected, error)
+        self.assertTrue(all(receive(matcher, error, 1000) for error in ERRORS))
+
+    def test_awplus_terminal_error_matcher_growing_response(self):
+        matcher = ErrorMatcher(ERROR_PATTERNS)
+        self.assertFalse(receive(matcher, OUTPUT + b"awplus#", 300))
+        for error in ERRORS:
+            for position in (10, len(OUTPUT) // 2, len(OUTPUT) - 3):
+                position = OUTPUT.index(b"\n", position) + 1
+                response = OUTPUT[:position] + error + b"\n" + OUTPUT[position:]
+                # chunks that split the error across searches
+                for chunk in (257, 300, 1000):
+                    self.assertTrue(receive(matcher, response, chunk), (error, position, chunk))
+
+    def test_awplus_terminal_error_matcher_windows(self):
+        # with paramiko each search is a different window of at most 256 bytes
+        matcher = ErrorMatcher(ERROR_PATTERNS)
+        self.assertTrue(matcher.search(b"awplus#show vlan 4000\n% Error: VLAN 4000 does not exist"))
+        self.assertFalse(matcher.search(b"VLAN ID  Name  Type  State  Member ports\n1  default  STATIC"))
+        self.assertTrue(matcher.search(b"% Invalid input detected at '^' marker."))
+
+    def test_awplus_terminal_error_matchers_reset_per_receive(self):
+        terminal = TerminalModule(MagicMock())
+        position = OUTPUT.index(b"\n", 500) + 1
+        errored = OUTPUT[:position] + b"% Error: VLAN 4000 does not exist\n" + OUTPUT[position:]
+
+        # a receive that stopped after 1000 bytes, then one with an error
+        # before that point
+        [matcher] = terminal.terminal_stderr_re
+        self.assertFalse(matcher.search(OUTPUT[:1000]))
+        [matcher] = terminal.terminal_stderr_re
+        self.assertTrue(matcher.search(errored[:3000]))
+
+        # an error in one receive isn't reported for the next
+        [matcher] = terminal.terminal_stderr_re
+        self.assertFalse(matcher.search(OUTPUT[:3000]))
+
+        # each terminal has its own matchers
+        self.assertIsNot(TerminalModule(MagicMock()).terminal_stderr_re[0], matcher)